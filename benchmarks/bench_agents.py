@@ -0,0 +1,43 @@
+"""Agent Benchmark - perceive throughput with list vs ring-buffer memory"""
+
+import time
+
+from my_agent_project.agents.autonomous_agent import AutonomousAgent
+
+
+class ListMemoryAgent(AutonomousAgent):
+    """AutonomousAgent with the previous list-based memory"""
+    
+    def __init__(self, agent_id: str, memory_size: int = 1000):
+        super().__init__(agent_id, memory_size=memory_size)
+        self.memory = []
+    
+    def update_memory(self, data):
+        if len(self.memory) >= self.memory_size:
+            self.memory.pop(0)
+        self.memory.append(data)
+
+
+def perceive_rate(agent, steps: int) -> float:
+    """Perceive calls per second once memory is full"""
+    for step in range(agent.memory_size):
+        agent.perceive(step)
+    start = time.perf_counter()
+    for step in range(steps):
+        agent.perceive(step)
+    return steps / (time.perf_counter() - start)
+
+
+def main():
+    """Run agent benchmark"""
+    
+    steps = 200_000
+    print(f"{'memory_size':>12} | {'list':>14} {'ring':>14} {'speedup':>8}")
+    for memory_size in [1_000, 10_000, 100_000]:
+        list_rate = perceive_rate(ListMemoryAgent("list", memory_size), steps)
+        ring_rate = perceive_rate(AutonomousAgent("ring", memory_size=memory_size), steps)
+        print(f"{memory_size:>12} | {list_rate:>10,.0f}/s {ring_rate:>10,.0f}/s {ring_rate / list_rate:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Checkpoint Benchmark - full and delta snapshots, lazy vs eager restore"""
+
+import shutil
+import tempfile
+import time
+
+import numpy as np
+
+from my_agent_project.core.replay_buffer import ReplayBuffer
+from my_agent_project.environment.simulator import EnvironmentSimulator
+from my_agent_project.utils.checkpoint import Checkpoint
+
+
+def timed(fn):
+    """Result and wall time of fn()"""
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main():
+    """Run checkpoint benchmark"""
+    
+    capacity = 16_000_000
+    buffer = ReplayBuffer(capacity, state_shape=(4,), state_dtype=np.float32, seed=0)
+    buffer.add_batch(np.ones((capacity, 4), dtype=np.float32), np.zeros(capacity, dtype=np.int64),
+                     np.zeros(capacity), np.ones((capacity, 4), dtype=np.float32))
+    env = EnvironmentSimulator("bench_world")
+    for i in range(10_000):
+        env.add_agent(f"agent_{i}")
+    env.reset()
+    world = {'env': env, 'replay': buffer}
+    size = sum(a.nbytes for a in (buffer.states, buffer.next_states, buffer.actions, buffer.rewards))
+    print(f"World arrays: {size / 2**30:.2f} GiB")
+    
+    root = tempfile.mkdtemp(prefix="bench_checkpoint_")
+    try:
+        checkpoint = Checkpoint(root)
+        stats, elapsed = timed(lambda: checkpoint.save('full', world))
+        print(f"  {'full save':<14} {elapsed:>7.2f}s {stats['bytes_written'] / 2**20:>9.1f} MiB written")
+        
+        buffer.rewards[:1000] = 1.0
+        env.step_array(np.zeros(10_000))
+        stats, elapsed = timed(lambda: checkpoint.save('delta', world))
+        print(f"  {'delta save':<14} {elapsed:>7.2f}s {stats['bytes_written'] / 2**20:>9.1f} MiB written")
+        
+        restored, elapsed = timed(lambda: checkpoint.load('delta', lazy=True))
+        print(f"  {'lazy restore':<14} {elapsed:>7.3f}s")
+        _, elapsed = timed(lambda: restored['replay'].sample(4096))
+        print(f"  {'first sample':<14} {elapsed:>7.3f}s (pages faulted in on demand)")
+        del restored
+        restored, elapsed = timed(lambda: checkpoint.load('delta', lazy=False))
+        print(f"  {'eager restore':<14} {elapsed:>7.3f}s")
+    finally:
+        shutil.rmtree(root)
+
+
+if __name__ == "__main__":
+    main()
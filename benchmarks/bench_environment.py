@@ -0,0 +1,67 @@
+"""Environment Benchmark - dict step vs vectorized step_array, VecEnv throughput"""
+
+import os
+import time
+from functools import partial
+
+import numpy as np
+
+from my_agent_project.environment.simulator import EnvironmentSimulator
+from my_agent_project.environment.vec_env import SubprocVecEnv, VecEnv
+
+
+def make_env(agents: int) -> EnvironmentSimulator:
+    """Simulator with registered agents"""
+    env = EnvironmentSimulator("bench_env")
+    for i in range(agents):
+        env.add_agent(f"agent_{i}")
+    env.reset()
+    return env
+
+
+def vec_rate(vec_env, steps: int) -> float:
+    """Environment steps per second"""
+    actions = np.ones(vec_env.buffers['actions'].shape, dtype=np.int64)
+    vec_env.step(actions)
+    start = time.perf_counter()
+    for _ in range(steps):
+        vec_env.step(actions)
+    return steps * vec_env.num_envs / (time.perf_counter() - start)
+
+
+def main():
+    """Run environment benchmark"""
+    
+    rng = np.random.default_rng(0)
+    print(f"{'agents':>10} | {'step':>12} {'step_array':>12} {'speedup':>8}")
+    for agents in [1_000, 10_000, 100_000]:
+        env = make_env(agents)
+        actions = rng.integers(0, 4, agents)
+        action_dict = dict(zip(env.agent_ids, actions.tolist()))
+        
+        start = time.perf_counter()
+        env.step(action_dict)
+        dict_time = time.perf_counter() - start
+        
+        ticks = 100
+        start = time.perf_counter()
+        for _ in range(ticks):
+            env.step_array(actions)
+        array_time = (time.perf_counter() - start) / ticks
+        print(f"{agents:>10,} | {dict_time * 1e3:>10.2f}ms {array_time * 1e3:>10.3f}ms "
+              f"{dict_time / array_time:>7.0f}x")
+    
+    num_envs, agents = 8, 10_000
+    env_fns = [partial(make_env, agents)] * num_envs
+    print(f"VecEnv, {num_envs} envs x {agents:,} agents ({os.cpu_count()} CPUs)")
+    with VecEnv(env_fns) as vec_env:
+        base = vec_rate(vec_env, 50)
+    print(f"  {'in-process':<16} {base:>10,.0f} env steps/s")
+    for workers in [1, 2, 4]:
+        with SubprocVecEnv(env_fns, num_workers=workers) as vec_env:
+            rate = vec_rate(vec_env, 50)
+        print(f"  {f'subproc x{workers}':<16} {rate:>10,.0f} env steps/s {rate / base:>6.2f}x")
+
+
+if __name__ == "__main__":
+    main()
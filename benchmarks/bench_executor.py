@@ -0,0 +1,94 @@
+"""Executor Benchmark - inline vs thread and process backends, history lookup, result cache"""
+
+import time
+import tracemalloc
+
+from my_agent_project.core.executor import Executor
+
+
+def wait_for_io(delay: float) -> float:
+    """Stand-in for a tool or LLM call"""
+    time.sleep(delay)
+    return delay
+
+
+def burn_cpu(n: int) -> int:
+    """CPU-bound work"""
+    return sum(i * i for i in range(n))
+
+
+def run(backend: str, max_concurrent: int, action, args: tuple, count: int) -> float:
+    """Tasks per second for a backend"""
+    with Executor(max_concurrent_tasks=max_concurrent, backend=backend) as executor:
+        for i in range(count):
+            executor.submit_task(f"task_{i}", action, args)
+        start = time.perf_counter()
+        executor.execute_tasks()
+        return count / (time.perf_counter() - start)
+
+
+def noop() -> None:
+    """Trivial task"""
+    return None
+
+
+def history_run(count: int, max_history) -> tuple:
+    """Lookup time and retained memory after running count tasks"""
+    tracemalloc.start()
+    executor = Executor(max_history=max_history)
+    for i in range(count):
+        executor.submit_task(f"task_{i}", noop)
+    executor.execute_tasks()
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    
+    start = time.perf_counter()
+    for i in range(count - 1000, count):
+        executor.get_task_result(f"task_{i}")
+    lookup = (time.perf_counter() - start) / 1000
+    return lookup, retained
+
+
+def cached_run(count: int, distinct: int, cache: bool) -> float:
+    """Tasks per second when count calls repeat distinct argument sets"""
+    executor = Executor()
+    for i in range(count):
+        executor.submit_task(f"task_{i}", burn_cpu, (20_000 + i % distinct,), cache=cache)
+    start = time.perf_counter()
+    executor.execute_tasks()
+    return count / (time.perf_counter() - start)
+
+
+def main():
+    """Run executor benchmark"""
+    
+    print("I/O-bound tasks (10ms sleep)")
+    inline = run('inline', 1, wait_for_io, (0.01,), 100)
+    print(f"  {'inline':<20} {inline:>10,.0f} tasks/s")
+    for workers in [8, 32]:
+        rate = run('thread', workers, wait_for_io, (0.01,), 400)
+        print(f"  {f'thread x{workers}':<20} {rate:>10,.0f} tasks/s {rate / inline:>6.1f}x")
+    
+    print("CPU-bound tasks (sum of 200k squares)")
+    inline = run('inline', 1, burn_cpu, (200_000,), 40)
+    print(f"  {'inline':<20} {inline:>10,.1f} tasks/s")
+    for workers in [2, 4]:
+        rate = run('process', workers, burn_cpu, (200_000,), 80)
+        print(f"  {f'process x{workers}':<20} {rate:>10,.1f} tasks/s {rate / inline:>6.1f}x")
+    
+    print("Repeated pure calls (2,000 tasks over 50 argument sets)")
+    uncached = cached_run(2000, 50, False)
+    cached = cached_run(2000, 50, True)
+    print(f"  {'uncached':<20} {uncached:>10,.0f} tasks/s")
+    print(f"  {'cached':<20} {cached:>10,.0f} tasks/s {cached / uncached:>6.1f}x")
+    
+    print("History after N tasks (get_task_result, traced memory)")
+    for count in [10_000, 100_000]:
+        for max_history in [None, 10_000]:
+            lookup, retained = history_run(count, max_history)
+            label = f"{count:,} cap={max_history or 'none'}"
+            print(f"  {label:<20} {lookup * 1e6:>8.2f}us {retained / 2**20:>8.1f}MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Knowledge Benchmark - per-agent dict copies vs shared LWW store and delta sync"""
+
+import time
+import tracemalloc
+
+from my_agent_project.core.knowledge_store import KnowledgeStore
+
+
+def traced(fn) -> tuple:
+    """Result of fn and bytes it left allocated"""
+    tracemalloc.start()
+    result = fn()
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, retained
+
+
+def main():
+    """Run knowledge benchmark"""
+    
+    keys, agents = 10_000, 100
+    items = {f"key_{i}": (i, i * 2) for i in range(keys)}
+    
+    def private_copies():
+        return [dict(items) for _ in range(agents)]
+    
+    def shared_store():
+        store = KnowledgeStore("team")
+        for key, value in items.items():
+            store.set(key, value)
+        return store, [store.view() for _ in range(agents)]
+    
+    _, private_bytes = traced(private_copies)
+    _, shared_bytes = traced(shared_store)
+    print(f"{keys:,} keys x {agents} agents")
+    print(f"  {'private dicts':<14} {private_bytes / 2**20:>8.1f} MiB")
+    print(f"  {'shared store':<14} {shared_bytes / 2**20:>8.1f} MiB")
+    
+    source, replica = KnowledgeStore("source"), KnowledgeStore("replica")
+    for key, value in items.items():
+        source.set(key, value)
+    replica.merge(source.delta_since(0))
+    print("Sync after changing k keys")
+    for changed in [1, 100, 1_000]:
+        for i in range(changed):
+            source.set(f"key_{i}", (i, -i))
+        start = time.perf_counter()
+        replica.merge(source.delta_since(0))
+        full = time.perf_counter() - start
+        for i in range(changed):
+            source.set(f"key_{i}", (i, i))
+        seq = source.seq - changed
+        start = time.perf_counter()
+        replica.merge(source.delta_since(seq))
+        delta = time.perf_counter() - start
+        print(f"  {changed:>6,} changed | full {full * 1e3:>7.2f}ms delta {delta * 1e3:>7.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
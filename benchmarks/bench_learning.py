@@ -0,0 +1,71 @@
+"""Learning Benchmark - LearningModel vs TabularLearningModel"""
+
+import time
+import tracemalloc
+
+import numpy as np
+
+from my_agent_project.core.learning import LearningModel, TabularLearningModel
+
+
+def state_memory(model_factory, num_states: int) -> float:
+    """Bytes allocated per state for value table"""
+    tracemalloc.start()
+    model = model_factory()
+    for state in range(num_states):
+        model.train(state, None, 1.0, state)
+    model.training_history.clear()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size / num_states
+
+
+def main():
+    """Run learning benchmark"""
+    
+    num_states = 10_000
+    num_transitions = 1_000_000
+    rng = np.random.default_rng(0)
+    states = rng.integers(0, num_states, num_transitions)
+    next_states = rng.integers(0, num_states, num_transitions)
+    rewards = rng.random(num_transitions)
+    state_list, next_list, reward_list = states.tolist(), next_states.tolist(), rewards.tolist()
+    
+    print(f"Throughput over {num_transitions:,} transitions, {num_states:,} states")
+    
+    for name, model in [
+        ('LearningModel.train', LearningModel()),
+        ('TabularLearningModel.train', TabularLearningModel(record_history=False)),
+    ]:
+        start = time.perf_counter()
+        for s, r, n in zip(state_list, reward_list, next_list):
+            model.train(s, None, r, n)
+        elapsed = time.perf_counter() - start
+        print(f"  {name:<46} {num_transitions / elapsed:>14,.0f} transitions/s")
+    
+    model = TabularLearningModel(record_history=False)
+    start = time.perf_counter()
+    for offset in range(0, num_transitions, 65_536):
+        batch = slice(offset, offset + 65_536)
+        model.train_batch(state_list[batch], None, rewards[batch], next_list[batch])
+    elapsed = time.perf_counter() - start
+    print(f"  {'TabularLearningModel.train_batch':<46} {num_transitions / elapsed:>14,.0f} transitions/s")
+    
+    model = TabularLearningModel(record_history=False, int_states=True)
+    start = time.perf_counter()
+    for offset in range(0, num_transitions, 65_536):
+        batch = slice(offset, offset + 65_536)
+        model.train_batch(states[batch], None, rewards[batch], next_states[batch])
+    elapsed = time.perf_counter() - start
+    print(f"  {'TabularLearningModel(int_states).train_batch':<46} {num_transitions / elapsed:>14,.0f} transitions/s")
+    
+    print("Memory per state (value table + keys)")
+    print(f"  {'LearningModel':<46} {state_memory(lambda: LearningModel(), 100_000):>10.1f} bytes")
+    print(f"  {'TabularLearningModel':<46} "
+          f"{state_memory(lambda: TabularLearningModel(record_history=False), 100_000):>10.1f} bytes")
+    print(f"  {'TabularLearningModel(int_states=True)':<46} "
+          f"{state_memory(lambda: TabularLearningModel(record_history=False, int_states=True), 100_000):>10.1f} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+"""Memory Benchmark - indexed vs scanning metadata lookups"""
+
+import timeit
+
+from my_agent_project.core.memory import Memory
+
+
+def scan_by_type(memory: Memory, data_type: str) -> list:
+    """Linear scan used by Memory.retrieve_by_type before indexing"""
+    return [entry['data'] for entry in memory.storage if entry['metadata'].get('type') == data_type]
+
+
+def main():
+    """Run memory benchmark"""
+    
+    print(f"{'capacity':>10} {'matches':>8} | {'scan':>12} {'indexed':>12} {'speedup':>8}")
+    
+    for capacity in [1_000, 10_000, 100_000]:
+        memory = Memory(capacity=capacity)
+        for step in range(capacity * 2):
+            data_type = 'goal_set' if step % 100 == 0 else 'observation'
+            memory.store(step, {'type': data_type})
+        
+        assert memory.retrieve_by_type('goal_set') == scan_by_type(memory, 'goal_set')
+        number = max(10, 100_000 // capacity)
+        scan = timeit.timeit(lambda: scan_by_type(memory, 'goal_set'), number=number) / number
+        indexed = timeit.timeit(lambda: memory.retrieve_by_type('goal_set'), number=number) / number
+        matches = len(memory.retrieve_by_type('goal_set'))
+        print(f"{capacity:>10} {matches:>8} | {scan * 1e6:>10.1f}us {indexed * 1e6:>10.1f}us {scan / indexed:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Message Bus Benchmark - team broadcast fan-out cost and bounded memory"""
+
+import copy
+import time
+import tracemalloc
+
+from my_agent_project.agents.collaborative_agent import CollaborativeAgent
+from my_agent_project.core.message_bus import MessageBus
+
+
+def make_team(size: int, capacity: int) -> tuple:
+    """Bus with one team of collaborative agents"""
+    bus = MessageBus(queue_capacity=capacity)
+    agents = [CollaborativeAgent(f"agent_{i}") for i in range(size)]
+    for agent in agents:
+        agent.join_team(bus, "blue")
+    bus.flush()
+    return bus, agents
+
+
+def main():
+    """Run message bus benchmark"""
+    
+    payload = {'position': (10.0, 20.0), 'sightings': list(range(50))}
+    steps = 200
+    print(f"{'team':>6} | {'bus/delivery':>13} {'deepcopy/delivery':>18}")
+    for size in [10, 100, 1_000]:
+        bus, agents = make_team(size, 64)
+        start = time.perf_counter()
+        for _ in range(steps):
+            agents[0].perceive(payload)
+            deliveries = bus.flush()
+            for agent in agents:
+                agent.receive_messages()
+        bus_time = (time.perf_counter() - start) / (steps * deliveries)
+        
+        start = time.perf_counter()
+        for _ in range(steps):
+            copies = [copy.deepcopy(payload) for _ in range(size - 1)]
+        copy_time = (time.perf_counter() - start) / (steps * len(copies))
+        print(f"{size:>6,} | {bus_time * 1e9:>11.0f}ns {copy_time * 1e9:>16.0f}ns")
+    
+    print("Undrained team of 100, 10,000 broadcasts (queue capacity 64)")
+    tracemalloc.start()
+    bus, agents = make_team(100, 64)
+    baseline = tracemalloc.get_traced_memory()[0]
+    for step in range(10_000):
+        agents[step % 100].perceive(step)
+        bus.flush()
+    retained = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    stats = bus.get_stats()
+    print(f"  queued {stats['queued']:,}, dropped {stats['dropped']:,}, retained {retained / 2**20:.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
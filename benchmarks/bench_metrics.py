@@ -0,0 +1,77 @@
+"""Metrics Benchmark - per-record cost and retained memory, sample lists vs streaming histograms"""
+
+import time
+import tracemalloc
+from collections import defaultdict
+
+import numpy as np
+
+from my_agent_project.utils.metrics import Metrics
+
+
+class ListMetrics:
+    """Previous Metrics keeping every sample as a dict"""
+    
+    def __init__(self):
+        self._metrics = defaultdict(list)
+    
+    def record(self, metric_name, value):
+        self._metrics[metric_name].append({'value': value, 'timestamp': time.time()})
+    
+    def get_metric_stats(self, metric_name):
+        values = [m['value'] for m in self._metrics[metric_name]]
+        return {'count': len(values), 'min': min(values), 'max': max(values),
+                'avg': sum(values) / len(values), 'latest': values[-1]}
+
+
+def measure(metrics, values: list) -> tuple:
+    """Nanoseconds per record, retained bytes and stats time"""
+    record = metrics.record
+    start = time.perf_counter()
+    for value in values:
+        record('latency', value)
+    per_record = (time.perf_counter() - start) / len(values)
+    
+    start = time.perf_counter()
+    stats = metrics.get_metric_stats('latency')
+    return per_record, time.perf_counter() - start, stats
+
+
+def retained(make, values: list) -> int:
+    """Traced bytes held after recording values"""
+    tracemalloc.start()
+    metrics = make()
+    for value in values:
+        metrics.record('latency', value)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size
+
+
+def main():
+    """Run metrics benchmark"""
+    
+    rng = np.random.default_rng(0)
+    variants = [('list', ListMetrics), ('streaming', Metrics), ('reservoir 1k', lambda: Metrics(reservoir_size=1024))]
+    print(f"{'samples':>10} {'variant':<14} | {'record':>9} {'stats':>10} {'memory':>10}")
+    for count in [100_000, 1_000_000]:
+        values = rng.lognormal(-7, 1, count).tolist()
+        for label, make in variants:
+            per_record, stats_time, _ = measure(make(), values)
+            size = retained(make, values)
+            print(f"{count:>10,} {label:<14} | {per_record * 1e9:>7.0f}ns {stats_time * 1e3:>8.2f}ms "
+                  f"{size / 2**20:>8.2f}MB")
+    
+    stats = Metrics()
+    values = rng.lognormal(-7, 1, 1_000_000)
+    for value in values.tolist():
+        stats.record('latency', value)
+    stats = stats.get_metric_stats('latency')
+    print("Percentile error vs exact")
+    for key, q in [('p50', 50), ('p95', 95), ('p99', 99)]:
+        exact = np.percentile(values, q)
+        print(f"  {key}: {stats[key] * 1e3:.4f}ms exact {exact * 1e3:.4f}ms ({abs(stats[key] / exact - 1):.2%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Population Benchmark - per-agent loop vs batched columnar steps"""
+
+import time
+
+import numpy as np
+
+from my_agent_project.agents.autonomous_agent import AutonomousAgent
+from my_agent_project.agents.collaborative_agent import CollaborativeAgent
+from my_agent_project.agents.population import Population
+from my_agent_project.agents.reasoning_agent import ReasoningAgent
+
+
+def loop_step(agents, observations) -> None:
+    """One perceive/reason/act cycle agent by agent"""
+    for agent, observation in zip(agents, observations):
+        agent.perceive(observation)
+        decision = agent.reason()
+        agent.act(decision.get('action'))
+
+
+def measure(kind, count: int, steps: int) -> tuple:
+    """Seconds per step for the loop, batched steps and the sync they defer"""
+    observations = np.arange(count)
+    agents = [kind(f"agent_{i}", memory_size=16) for i in range(count)]
+    start = time.perf_counter()
+    for _ in range(steps):
+        loop_step(agents, observations)
+    looped = (time.perf_counter() - start) / steps
+    
+    population = Population([kind(f"agent_{i}", memory_size=16) for i in range(count)], max_pending=None)
+    start = time.perf_counter()
+    for _ in range(steps):
+        population.step(observations)
+    batched = (time.perf_counter() - start) / steps
+    start = time.perf_counter()
+    population.sync()
+    return looped, batched, (time.perf_counter() - start) / steps
+
+
+def main():
+    """Run population benchmark"""
+    
+    count, steps = 50_000, 32
+    print(f"{count:,} agents, {steps} steps, one sync at the end")
+    print(f"{'kind':<20} | {'loop':>10} {'step':>10} {'sync':>10} | {'step only':>9} {'with sync':>9}")
+    for kind in [AutonomousAgent, CollaborativeAgent, ReasoningAgent]:
+        looped, batched, sync = measure(kind, count, steps)
+        print(f"{kind.__name__:<20} | {looped * 1e3:>8.1f}ms {batched * 1e3:>8.2f}ms {sync * 1e3:>8.1f}ms | "
+              f"{looped / batched:>8.0f}x {looped / (batched + sync):>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""Records Benchmark - tracemalloc bytes and blocks per agent step, dicts vs slotted records"""
+
+import time
+import tracemalloc
+from collections import defaultdict
+
+from my_agent_project.agents.autonomous_agent import AutonomousAgent
+from my_agent_project.core.learning import LearningModel
+from my_agent_project.core.memory import Memory
+from my_agent_project.environment.simulator import EnvironmentSimulator
+from my_agent_project.utils.metrics import Metrics
+
+
+class DictAgent(AutonomousAgent):
+    """AutonomousAgent with the previous dict messages"""
+    
+    def perceive(self, observation):
+        self.state['observation'] = observation
+        self.update_memory({'type': 'observation', 'data': observation})
+    
+    def reason(self):
+        return {
+            'agent_id': self.agent_id,
+            'independence_score': self.independence_level,
+            'action': 'autonomous_action',
+            'confidence': self.independence_level
+        }
+    
+    def act(self, action):
+        return {'agent_id': self.agent_id, 'action_executed': action, 'status': 'success'}
+
+
+class DictSimulator(EnvironmentSimulator):
+    """EnvironmentSimulator with the previous dict observations"""
+    
+    def _execute_action(self, agent_id, action):
+        return {'agent_id': agent_id, 'action': action, 'timestep': self.timestep, 'status': 'executed'}
+
+
+class DictMemory(Memory):
+    """Memory with the previous dict entries"""
+    
+    def store(self, data, metadata=None):
+        entry = {'data': data, 'metadata': metadata or {}, 'timestamp': self.next_timestamp}
+        self.next_timestamp += 1
+        if len(self.storage) == self.capacity:
+            self._unindex(self.storage[0])
+        self.storage.append(entry)
+        self._index(entry)
+
+
+class DictMetrics(Metrics):
+    """Metrics with the previous dict samples"""
+    
+    def __init__(self):
+        super().__init__()
+        self._metrics = defaultdict(list)
+    
+    def record(self, metric_name, value):
+        self._metrics[metric_name].append({'value': value, 'timestamp': time.time()})
+
+
+class DictLearningModel(LearningModel):
+    """LearningModel with the previous dict history rows"""
+    
+    def _record(self, state, action, reward, delta):
+        self.reward_stats.update(reward)
+        self.delta_stats.update(delta)
+        self.training_history.append({'state': state, 'action': action, 'reward': reward, 'delta': delta})
+
+
+def make_parts(compact: bool, steps: int) -> tuple:
+    """Agent, environment, memory, metrics and model of one variant"""
+    if compact:
+        parts = (AutonomousAgent("agent", memory_size=steps), EnvironmentSimulator("env", max_steps=steps + 1),
+                 Memory(capacity=steps, indexed_keys=()), Metrics(), LearningModel())
+    else:
+        parts = (DictAgent("agent", memory_size=steps), DictSimulator("env", max_steps=steps + 1),
+                 DictMemory(capacity=steps, indexed_keys=()), DictMetrics(), DictLearningModel())
+    parts[1].add_agent("agent")
+    return parts
+
+
+def run_steps(parts: tuple, steps: int) -> None:
+    """Perceive, reason, act, step the environment and record the outcome"""
+    agent, env, memory, metrics, model = parts
+    state = 0
+    for step in range(steps):
+        agent.perceive(step)
+        decision = agent.reason()
+        result = agent.act(decision['action'])
+        observations, rewards, _ = env.step({agent.agent_id: result['action_executed']})
+        memory.store(observations[agent.agent_id])
+        metrics.record('reward', rewards[agent.agent_id])
+        model.train(state, decision['action'], rewards[agent.agent_id], step % 64)
+        state = step % 64
+
+
+def measure(compact: bool, steps: int) -> tuple:
+    """Retained bytes and blocks per step and microseconds per step"""
+    parts = make_parts(compact, steps)
+    run_steps(parts, 64)
+    parts = make_parts(compact, steps)
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    run_steps(parts, steps)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    stats = after.compare_to(before, 'filename')
+    size = sum(stat.size_diff for stat in stats)
+    blocks = sum(stat.count_diff for stat in stats)
+    
+    parts = make_parts(compact, steps)
+    start = time.perf_counter()
+    run_steps(parts, steps)
+    elapsed = time.perf_counter() - start
+    return size / steps, blocks / steps, elapsed / steps
+
+
+def main():
+    """Run records benchmark"""
+    
+    steps = 100_000
+    print(f"{steps:,} agent steps, everything retained")
+    print(f"{'variant':<10} | {'bytes/step':>10} {'blocks/step':>11} {'time/step':>10}")
+    for compact in [False, True]:
+        size, blocks, elapsed = measure(compact, steps)
+        label = 'records' if compact else 'dicts'
+        print(f"{label:<10} | {size:>10,.0f} {blocks:>11.1f} {elapsed * 1e6:>8.2f}us")
+
+
+if __name__ == "__main__":
+    main()
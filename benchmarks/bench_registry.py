@@ -0,0 +1,66 @@
+"""Registry Benchmark - agent registration and churn with list vs registry membership"""
+
+import random
+import time
+
+from my_agent_project.environment.base_env import BaseEnvironment
+
+
+class ChurnEnvironment(BaseEnvironment):
+    """Minimal environment exercising agent membership only"""
+    
+    def reset(self):
+        return {}
+    
+    def step(self, actions):
+        return {}, {}, False
+
+
+class ListEnvironment(ChurnEnvironment):
+    """ChurnEnvironment with the previous list-based membership"""
+    
+    def __init__(self, env_id: str):
+        super().__init__(env_id)
+        self.agents = []
+    
+    def add_agent(self, agent_id):
+        if agent_id not in self.agents:
+            self.agents.append(agent_id)
+    
+    def remove_agent(self, agent_id):
+        if agent_id in self.agents:
+            self.agents.remove(agent_id)
+
+
+def churn(env: BaseEnvironment, agents: int, churn_ops: int) -> tuple:
+    """Seconds to register agents, then to replace churn_ops random agents"""
+    start = time.perf_counter()
+    for i in range(agents):
+        env.add_agent(f"agent_{i}")
+    register = time.perf_counter() - start
+    
+    rng = random.Random(0)
+    live = [f"agent_{i}" for i in range(agents)]
+    start = time.perf_counter()
+    for i in range(churn_ops):
+        slot = rng.randrange(agents)
+        env.remove_agent(live[slot])
+        live[slot] = f"agent_{agents + i}"
+        env.add_agent(live[slot])
+    return register, time.perf_counter() - start
+
+
+def main():
+    """Run registry benchmark"""
+    
+    churn_ops = 2_000
+    print(f"{'agents':>8} | {'register list':>14} {'registry':>10} | {f'churn x{churn_ops} list':>18} {'registry':>10}")
+    for agents in [1_000, 10_000, 50_000]:
+        list_register, list_churn = churn(ListEnvironment("list"), agents, churn_ops)
+        reg_register, reg_churn = churn(ChurnEnvironment("registry"), agents, churn_ops)
+        print(f"{agents:>8,} | {list_register * 1e3:>12.1f}ms {reg_register * 1e3:>8.1f}ms | "
+              f"{list_churn * 1e3:>16.1f}ms {reg_churn * 1e3:>8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
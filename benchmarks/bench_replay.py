@@ -0,0 +1,55 @@
+"""Replay Benchmark - Memory of dicts vs NumPy replay buffers"""
+
+import time
+
+import numpy as np
+
+from my_agent_project.core.learning import LearningModel, TabularLearningModel
+from my_agent_project.core.memory import Memory
+from my_agent_project.core.replay_buffer import PrioritizedReplayBuffer, ReplayBuffer
+
+
+def main():
+    """Run replay benchmark"""
+    
+    capacity = 100_000
+    num_states = 10_000
+    batch_size = 256
+    num_batches = 400
+    rng = np.random.default_rng(0)
+    states = rng.integers(0, num_states, capacity)
+    next_states = rng.integers(0, num_states, capacity)
+    rewards = rng.random(capacity)
+    
+    print(f"Off-policy replay, capacity={capacity:,}, batch={batch_size}")
+    
+    memory = Memory(capacity=capacity)
+    for s, r, n in zip(states.tolist(), rewards.tolist(), next_states.tolist()):
+        memory.store({'state': s, 'action': 0, 'reward': r, 'next_state': n}, {'type': 'transition'})
+    model = LearningModel()
+    start = time.perf_counter()
+    for _ in range(num_batches // 10):
+        for index in rng.integers(0, capacity, batch_size).tolist():
+            t = memory.retrieve(index)
+            model.train(t['state'], t['action'], t['reward'], t['next_state'])
+    elapsed = time.perf_counter() - start
+    print(f"  {'Memory + LearningModel.train':<44} {num_batches // 10 * batch_size / elapsed:>14,.0f} transitions/s")
+    
+    for name, buffer in [
+        ('ReplayBuffer + train_batch', ReplayBuffer(capacity, seed=0)),
+        ('PrioritizedReplayBuffer + train_batch', PrioritizedReplayBuffer(capacity, seed=0)),
+    ]:
+        buffer.add_batch(states, np.zeros(capacity), rewards, next_states)
+        model = TabularLearningModel(int_states=True, record_history=False)
+        start = time.perf_counter()
+        for _ in range(num_batches):
+            batch = buffer.sample(batch_size)
+            deltas = model.train_batch(batch['states'], None, batch['rewards'], batch['next_states'])
+            if isinstance(buffer, PrioritizedReplayBuffer):
+                buffer.update_priorities(batch['indices'], deltas)
+        elapsed = time.perf_counter() - start
+        print(f"  {name:<44} {num_batches * batch_size / elapsed:>14,.0f} transitions/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""Scheduler Benchmark - TaskScheduler push/pop cost as queues grow"""
+
+import random
+import time
+
+from my_agent_project.core.executor import ExecutionStatus, Task
+from my_agent_project.core.scheduler import TaskScheduler
+
+
+def noop():
+    return None
+
+
+def main():
+    """Run scheduler benchmark"""
+    
+    print(f"{'tasks':>10} | {'push':>10} {'pop+complete':>14}")
+    for num_tasks in [10_000, 100_000, 1_000_000]:
+        rng = random.Random(0)
+        tasks = []
+        for i in range(num_tasks):
+            dependencies = (f"t{rng.randrange(i)}",) if i and rng.random() < 0.2 else ()
+            tasks.append(Task(f"t{i}", noop, priority=rng.randrange(10), deadline=rng.random(),
+                              dependencies=dependencies, owner=f"agent_{rng.randrange(100)}"))
+        
+        scheduler = TaskScheduler()
+        start = time.perf_counter()
+        for task in tasks:
+            scheduler.push(task)
+        push_time = (time.perf_counter() - start) / num_tasks
+        
+        start = time.perf_counter()
+        while True:
+            task = scheduler.pop()
+            if task is None:
+                break
+            task.status = ExecutionStatus.SUCCESS
+            scheduler.complete(task)
+        pop_time = (time.perf_counter() - start) / num_tasks
+        assert len(scheduler) == 0
+        print(f"{num_tasks:>10} | {push_time * 1e6:>8.2f}us {pop_time * 1e6:>12.2f}us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Sharded Simulation Benchmark - ticks per second and scaling efficiency over worker shards"""
+
+import os
+import time
+from functools import partial
+
+import numpy as np
+
+from my_agent_project.environment.sharded import ShardedSimulator
+from my_agent_project.environment.simulator import EnvironmentSimulator
+
+
+class BusySimulator(EnvironmentSimulator):
+    """Simulator with per-agent reward work, standing in for real dynamics"""
+    
+    def __init__(self, env_id: str, work: int = 200):
+        super().__init__(env_id)
+        self.work = work
+    
+    def _calculate_rewards(self, observations):
+        if not self.work:
+            return super()._calculate_rewards(observations)
+        actions = observations['action']
+        rewards = np.empty(len(actions))
+        for i, action in enumerate(actions.tolist()):
+            rewards[i] = sum((action + k) % 7 for k in range(self.work)) / self.work
+        return rewards
+
+
+def make_shard(work: int, shard: int) -> BusySimulator:
+    """Simulator for one shard"""
+    return BusySimulator(f"shard_{shard}", work)
+
+
+def single_rate(agents: int, work: int, ticks: int) -> float:
+    """Ticks per second of one in-process simulator"""
+    env = make_shard(work, 0)
+    for i in range(agents):
+        env.add_agent(f"agent_{i}")
+    env.reset()
+    actions = np.arange(agents)
+    start = time.perf_counter()
+    for _ in range(ticks):
+        env.step_array(actions)
+    return ticks / (time.perf_counter() - start)
+
+
+def sharded_rate(agents: int, work: int, ticks: int, shards: int) -> float:
+    """Ticks per second of the sharded simulation"""
+    agent_ids = [f"agent_{i}" for i in range(agents)]
+    with ShardedSimulator(agent_ids, num_shards=shards, env_fn=partial(make_shard, work)) as sim:
+        actions = np.arange(agents)
+        sim.reset()
+        sim.step(actions)
+        start = time.perf_counter()
+        for _ in range(ticks):
+            sim.step(actions)
+        return ticks / (time.perf_counter() - start)
+
+
+def main():
+    """Run sharded simulation benchmark"""
+    
+    print(f"{os.cpu_count()} CPUs")
+    for agents, work, ticks in [(10_000, 0, 200), (2_000, 200, 10)]:
+        print(f"{agents:,} agents, {work} work units per agent")
+        base = single_rate(agents, work, ticks)
+        print(f"  {'in-process':<12} {base:>10,.1f} ticks/s")
+        for shards in [1, 2, 4]:
+            rate = sharded_rate(agents, work, ticks, shards)
+            speedup = rate / base
+            print(f"  {f'{shards} shards':<12} {rate:>10,.1f} ticks/s {speedup:>6.2f}x "
+                  f"{speedup / shards:>6.0%} efficiency")
+
+
+if __name__ == "__main__":
+    main()
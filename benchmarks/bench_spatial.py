@@ -0,0 +1,63 @@
+"""Spatial Benchmark - grid and KD-tree queries vs linear scan on a large map"""
+
+import time
+
+import numpy as np
+
+from my_agent_project.environment.spatial_index import GridIndex, KDTree
+
+
+def per_query(fn, queries: np.ndarray) -> float:
+    """Mean seconds per query"""
+    start = time.perf_counter()
+    for query in queries:
+        fn(query)
+    return (time.perf_counter() - start) / len(queries)
+
+
+def main():
+    """Run spatial benchmark"""
+    
+    size = (10_000, 10_000)
+    rng = np.random.default_rng(0)
+    queries = rng.random((200, 2)) * size
+    print(f"{'entities':>10} | {'query':<16} {'scan':>10} {'index':>10} {'speedup':>8}")
+    for count in [10_000, 100_000, 1_000_000]:
+        points = rng.random((count, 2)) * size
+        
+        start = time.perf_counter()
+        grid = GridIndex(size, cell_size=50.0)
+        grid.insert_many(np.arange(count), points)
+        tree = KDTree(points)
+        build = time.perf_counter() - start
+        
+        def scan_radius(query):
+            offsets = points - query
+            return np.nonzero(np.einsum('ij,ij->i', offsets, offsets) <= 100.0 ** 2)[0]
+        
+        def scan_nearest(query):
+            offsets = points - query
+            return np.argmin(np.einsum('ij,ij->i', offsets, offsets))
+        
+        rows = [
+            ('radius 100 grid', scan_radius, lambda q: grid.query_radius(q, 100.0)),
+            ('nearest grid', scan_nearest, lambda q: grid.nearest(q)),
+            ('radius 100 kdtree', scan_radius, lambda q: tree.query_radius(q, 100.0)),
+            ('nearest kdtree', scan_nearest, lambda q: tree.nearest(q)),
+        ]
+        for label, scan, indexed in rows:
+            scan_time, index_time = per_query(scan, queries), per_query(indexed, queries)
+            print(f"{count:>10,} | {label:<16} {scan_time * 1e6:>8.0f}us {index_time * 1e6:>8.0f}us "
+                  f"{scan_time / index_time:>7.1f}x")
+        
+        moves = rng.integers(0, count, 10_000)
+        targets = rng.random((10_000, 2)) * size
+        start = time.perf_counter()
+        for entity_id, target in zip(moves.tolist(), targets):
+            grid.move(entity_id, target)
+        move_time = (time.perf_counter() - start) / len(moves)
+        print(f"{'':>10} | build {build:.2f}s, grid move {move_time * 1e6:.1f}us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Transport Benchmark - message throughput over local and TCP transports by batch size"""
+
+import multiprocessing as mp
+import time
+
+from my_agent_project.core.message_bus import Message
+from my_agent_project.core.transport import SocketTransport, TransportListener
+
+
+def sink(transport: SocketTransport, expected: int) -> None:
+    """Receive expected messages, then acknowledge"""
+    received = 0
+    while received < expected:
+        received += len(transport.recv(timeout=None))
+    transport.send([Message('ack', 'sink', received, 0)])
+
+
+def tcp_sink(port: int, expected: int) -> None:
+    """Sink connecting over TCP"""
+    sink(SocketTransport.connect('127.0.0.1', port), expected)
+
+
+def throughput(kind: str, total: int, batch_size: int) -> float:
+    """Messages per second from this process to a sink process"""
+    context = mp.get_context('fork')
+    if kind == 'local':
+        transport, remote = SocketTransport.pair()
+        worker = context.Process(target=sink, args=(remote, total))
+        worker.start()
+        remote.close()
+    else:
+        listener = TransportListener('127.0.0.1', 0)
+        worker = context.Process(target=tcp_sink, args=(listener.address[1], total))
+        worker.start()
+        transport = listener.accept(timeout=10.0)
+        listener.close()
+    
+    batch = [Message('team/bench', 'source', {'position': (1.0, 2.0), 'step': i}, i) for i in range(batch_size)]
+    start = time.perf_counter()
+    for _ in range(total // batch_size):
+        transport.send(batch)
+    transport.recv(timeout=None)
+    elapsed = time.perf_counter() - start
+    worker.join()
+    transport.close()
+    return total / elapsed
+
+
+def main():
+    """Run transport benchmark"""
+    
+    total = 100_000
+    print(f"{'batch':>6} | {'local socket':>14} {'tcp localhost':>14}")
+    for batch_size in [1, 10, 100, 1_000]:
+        local = throughput('local', total, batch_size)
+        tcp = throughput('tcp', total, batch_size)
+        print(f"{batch_size:>6,} | {local:>12,.0f}/s {tcp:>12,.0f}/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,11 +3,13 @@ from .my_first_agent import MyFirstAgent
 from .autonomous_agent import AutonomousAgent
 from .reasoning_agent import ReasoningAgent
 from .collaborative_agent import CollaborativeAgent
+from .population import Population
 
 __all__ = [
     "BaseAgent",
     "MyFirstAgent",
     "AutonomousAgent",
     "ReasoningAgent",
-    "CollaborativeAgent"
+    "CollaborativeAgent",
+    "Population"
 ]
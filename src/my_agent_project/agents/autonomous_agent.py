@@ -1,14 +1,15 @@
 """Autonomous Agent - Operates independently with self-direction"""
 
-from typing import Any, Dict
+from typing import Any
 from .base_agent import BaseAgent
+from ..core.records import ActionResult, Decision, Percept
 
 
 class AutonomousAgent(BaseAgent):
     """Agent that can act independently and make self-directed decisions"""
     
-    def __init__(self, agent_id: str, independence_level: float = 0.8):
-        super().__init__(agent_id)
+    def __init__(self, agent_id: str, independence_level: float = 0.8, memory_size: int = 1000):
+        super().__init__(agent_id, memory_size)
         self.independence_level = independence_level
         self.goal = None
         self.strategy = None
@@ -16,26 +17,15 @@ class AutonomousAgent(BaseAgent):
     def perceive(self, observation: Any) -> None:
         """Perceive environment and update state"""
         self.state['observation'] = observation
-        self.update_memory({'type': 'observation', 'data': observation})
+        self.update_memory(Percept('observation', observation))
         
-    def reason(self) -> Dict[str, Any]:
+    def reason(self) -> Decision:
         """Autonomous reasoning and decision-making"""
-        decision = {
-            'agent_id': self.agent_id,
-            'independence_score': self.independence_level,
-            'action': 'autonomous_action',
-            'confidence': self.independence_level
-        }
-        return decision
+        return Decision(self.agent_id, self.independence_level, 'autonomous_action', self.independence_level)
     
-    def act(self, action: Any) -> Any:
+    def act(self, action: Any) -> ActionResult:
         """Execute autonomous action"""
-        result = {
-            'agent_id': self.agent_id,
-            'action_executed': action,
-            'status': 'success'
-        }
-        return result
+        return ActionResult(self.agent_id, action)
     
     def set_goal(self, goal: Any) -> None:
         """Set autonomous goal"""
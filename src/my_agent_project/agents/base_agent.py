@@ -1,5 +1,37 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from collections import deque
+from collections.abc import Sequence
+from typing import Any, Callable, List, Mapping, Optional, Tuple
+from ..core.vector_memory import VectorMemory
+
+
+class MemoryView(Sequence):
+    """Read-only live view of an agent's memory"""
+    
+    def __init__(self, memory: deque):
+        self._memory = memory
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self._memory)[index]
+        return self._memory[index]
+    
+    def __len__(self) -> int:
+        return len(self._memory)
+    
+    def __iter__(self):
+        return iter(self._memory)
+    
+    def __reversed__(self):
+        return reversed(self._memory)
+    
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, Sequence) and not isinstance(other, str):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+    
+    def __repr__(self) -> str:
+        return f"MemoryView({list(self._memory)!r})"
 
 
 class BaseAgent(ABC):
@@ -7,9 +39,10 @@ class BaseAgent(ABC):
     
     def __init__(self, agent_id: str, memory_size: int = 1000):
         self.agent_id = agent_id
-        self.memory = []
+        self.memory = deque(maxlen=memory_size)
         self.memory_size = memory_size
         self.state = {}
+        self.semantic_memory = None
         
     @abstractmethod
     def perceive(self, observation: Any) -> None:
@@ -26,17 +59,55 @@ class BaseAgent(ABC):
         """Execute action in environment"""
         pass
     
-    def update_memory(self, data: Dict[str, Any]) -> None:
-        """Update agent memory"""
-        if len(self.memory) >= self.memory_size:
-            self.memory.pop(0)
+    async def aperceive(self, observation: Any) -> None:
+        """Async perceive; override to await I/O, defaults to ``perceive``"""
+        self.perceive(observation)
+    
+    async def areason(self) -> Any:
+        """Async reason; override to await LLM/tool calls, defaults to ``reason``"""
+        return self.reason()
+    
+    async def aact(self, action: Any) -> Any:
+        """Async act; override to await I/O, defaults to ``act``"""
+        return self.act(action)
+    
+    async def astep(self, observation: Any) -> Any:
+        """Run one perceive/reason/act cycle on the event loop"""
+        await self.aperceive(observation)
+        decision = await self.areason()
+        if isinstance(decision, Mapping) and 'action' in decision:
+            decision = decision['action']
+        return await self.aact(decision)
+    
+    def update_memory(self, data: Mapping[str, Any]) -> None:
+        """Update agent memory, evicting the oldest entry once full"""
         self.memory.append(data)
+        if self.semantic_memory is not None:
+            self.semantic_memory.store(data, {'type': data.get('type')})
         
-    def get_memory(self) -> list:
-        """Retrieve agent memory"""
-        return self.memory
+    def get_memory(self) -> MemoryView:
+        """Retrieve read-only view of agent memory"""
+        return MemoryView(self.memory)
+    
+    def snapshot_memory(self) -> list:
+        """Retrieve copy of agent memory"""
+        return list(self.memory)
+    
+    def enable_semantic_recall(self, embedder: Optional[Callable[[Any], Any]] = None, dim: int = 256) -> None:
+        """Mirror memory updates into an embedding store for recall"""
+        self.semantic_memory = VectorMemory(self.memory_size, dim=dim, embedder=embedder)
+        for data in self.memory:
+            self.semantic_memory.store(data, {'type': data.get('type')})
+    
+    def recall(self, query: Any, k: int = 5) -> List[Tuple[Any, float]]:
+        """Recall memories most similar to query"""
+        if self.semantic_memory is None:
+            return []
+        return self.semantic_memory.recall(query, k)
     
     def reset(self) -> None:
         """Reset agent state"""
         self.memory.clear()
         self.state.clear()
+        if self.semantic_memory is not None:
+            self.semantic_memory.clear()
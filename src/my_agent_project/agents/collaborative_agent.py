@@ -1,23 +1,33 @@
 """Collaborative Agent - Multi-agent collaboration and communication"""
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
+from collections import deque
 from .base_agent import BaseAgent
+from ..core.knowledge_store import KnowledgeStore
+from ..core.message_bus import Message, MessageBus
+from ..core.records import Percept
+from ..utils.registry import Registry
 
 
 class CollaborativeAgent(BaseAgent):
     """Agent that collaborates with other agents"""
     
-    def __init__(self, agent_id: str, team_size: int = 5):
-        super().__init__(agent_id)
+    def __init__(self, agent_id: str, team_size: int = 5, memory_size: int = 1000):
+        super().__init__(agent_id, memory_size)
         self.team_size = team_size
-        self.team_members = []
-        self.shared_knowledge = {}
-        self.communication_log = []
+        self.team_members = Registry()
+        self.knowledge = KnowledgeStore(agent_id)
+        self.shared_knowledge = self.knowledge.view()
+        self.communication_log = deque(maxlen=memory_size)
+        self.messages_sent = 0
+        self.bus = None
+        self.team_topic = None
+        self.subscription = None
         
     def perceive(self, observation: Any) -> None:
         """Perceive environment"""
         self.state['observation'] = observation
-        self.update_memory({'type': 'observation', 'data': observation})
+        self.update_memory(Percept('observation', observation))
         self._broadcast_to_team(observation)
         
     def reason(self) -> Dict[str, Any]:
@@ -43,23 +53,80 @@ class CollaborativeAgent(BaseAgent):
     def add_team_member(self, member_id: str) -> None:
         """Add team member"""
         if member_id not in self.team_members:
-            self.team_members.append(member_id)
+            self.team_members.add(member_id)
             self.update_memory({'type': 'team_member_added', 'member_id': member_id})
     
+    def remove_team_member(self, member_id: str) -> None:
+        """Remove team member"""
+        if self.team_members.discard(member_id) is not None:
+            self.update_memory({'type': 'team_member_removed', 'member_id': member_id})
+    
+    def join_team(self, bus: MessageBus, team_id: str, queue_capacity: Optional[int] = None,
+                  policy: Optional[str] = None, knowledge: Optional[KnowledgeStore] = None) -> None:
+        """Subscribe to team topic on bus so broadcasts reach teammates
+        
+        Teammates in one process should pass the same ``knowledge`` store,
+        which they then share directly; the store replicates over the bus
+        to teammates in other processes. Knowledge held before joining is
+        published to the team.
+        """
+        self.leave_team()
+        self.bus = bus
+        self.team_topic = f"team/{team_id}"
+        self.subscription = bus.subscribe(self.team_topic, self.agent_id, queue_capacity, policy)
+        if knowledge is not None:
+            knowledge.merge(self.knowledge.delta_since(0), republish=True)
+            self.knowledge = knowledge
+            self.shared_knowledge = knowledge.view()
+        if self.knowledge.bus is None:
+            self.knowledge.attach(bus, self.team_topic + '/knowledge')
+        self.knowledge.publish()
+    
+    def leave_team(self) -> None:
+        """Unsubscribe from current team topic, keeping a private copy of team knowledge"""
+        if self.bus is not None:
+            self.bus.unsubscribe(self.team_topic, self.agent_id)
+        if self.knowledge.replica_id == self.agent_id:
+            self.knowledge.detach()
+        else:
+            private = KnowledgeStore(self.agent_id)
+            private.merge(self.knowledge.delta_since(0))
+            self.knowledge = private
+            self.shared_knowledge = private.view()
+        self.bus = self.team_topic = self.subscription = None
+    
+    def receive_messages(self, max_messages: Optional[int] = None) -> List[Message]:
+        """Take messages delivered from teammates since the last call"""
+        if self.subscription is None:
+            return []
+        return self.subscription.drain(max_messages)
+    
+    def share_knowledge(self, key: str, value: Any) -> None:
+        """Record knowledge item and publish it to the team"""
+        self.knowledge.set(key, value)
+        self.knowledge.publish()
+    
+    def sync_knowledge(self) -> int:
+        """Merge knowledge published by other replicas, return how many keys changed"""
+        return self.knowledge.sync()
+    
     def _broadcast_to_team(self, message: Any) -> None:
         """Broadcast message to team"""
         comm = {
             'from': self.agent_id,
             'message': message,
-            'timestamp': len(self.communication_log)
+            'timestamp': self.messages_sent
         }
         self.communication_log.append(comm)
+        self.messages_sent += 1
+        if self.bus is not None:
+            self.bus.publish(self.team_topic, self.agent_id, message)
     
     def get_team_status(self) -> Dict[str, Any]:
         """Get team collaboration status"""
         return {
             'agent_id': self.agent_id,
             'team_size': len(self.team_members),
-            'communication_count': len(self.communication_log),
+            'communication_count': self.messages_sent,
             'shared_knowledge_items': len(self.shared_knowledge)
         }
@@ -0,0 +1,274 @@
+"""Population - Batched perceive/reason/act over homogeneous agent groups"""
+
+from typing import Any, Dict, Optional, Sequence
+from itertools import repeat
+import numpy as np
+from .autonomous_agent import AutonomousAgent
+from .base_agent import BaseAgent
+from .collaborative_agent import CollaborativeAgent
+from .reasoning_agent import ReasoningAgent
+from ..core.records import Percept
+
+
+class Population:
+    """Agents of one class stepped phase by phase on columnar arrays
+    
+    Per-agent fields (``independence_level``, ``team_size``,
+    ``reasoning_depth`` and counters) are copied into NumPy columns, so
+    each phase runs once for the whole group. Decisions and results come
+    back as column dicts, with fields equal for every agent as scalars;
+    ``decision(i)`` and ``result(i)`` build the per-agent dicts on demand.
+    Phases with side effects on the agents are logged and replayed onto
+    the agent objects by ``sync``, which also sends team broadcasts; the
+    log is synced automatically once it holds ``max_pending`` phases.
+    
+    Only the exact classes in ``KINDS`` are accepted, since the batched
+    phases reproduce their ``perceive``/``reason``/``act``; subclasses
+    that override them must be stepped per agent. Counters that a
+    perceive bumps (``messages_sent``, ``facts_count``) are the values
+    read at the last refresh plus the perceives logged since, and
+    ``shared_knowledge_items`` is read from the agents on every reason.
+    """
+    
+    KINDS = (AutonomousAgent, CollaborativeAgent, ReasoningAgent)
+    
+    def __init__(self, agents: Sequence[BaseAgent], max_pending: Optional[int] = 64):
+        if not agents:
+            raise ValueError("population needs at least one agent")
+        self.kind = type(agents[0])
+        if self.kind not in self.KINDS:
+            raise TypeError(f"unsupported agent class: {self.kind.__name__}")
+        if any(type(agent) is not self.kind for agent in agents):
+            raise TypeError("population agents must share one class")
+        self.agents = list(agents)
+        self.size = len(self.agents)
+        self.agent_ids = np.array([agent.agent_id for agent in self.agents], dtype=object)
+        self.steps = 0
+        self.decisions = None
+        self.results = None
+        self.max_pending = max_pending
+        self._pending = []
+        self._perceived = 0
+        self.refresh()
+    
+    def refresh(self) -> None:
+        """Reload columns from the agent objects"""
+        agents = self.agents
+        self._perceived = sum(1 for phase in self._pending if phase[0] == 'perceive')
+        if self.kind is AutonomousAgent:
+            self.columns = {
+                'independence_level': np.array([a.independence_level for a in agents], dtype=np.float64)
+            }
+        elif self.kind is CollaborativeAgent:
+            self.columns = {
+                'team_size': np.array([a.team_size for a in agents], dtype=np.int64),
+                'team_members': np.array([len(a.team_members) for a in agents], dtype=np.int64),
+                'shared_knowledge_items': np.array([len(a.shared_knowledge) for a in agents], dtype=np.int64),
+                'messages_sent': np.array([a.messages_sent for a in agents], dtype=np.int64)
+            }
+        else:
+            self.columns = {
+                'reasoning_depth': np.array([a.reasoning_depth for a in agents], dtype=np.int64),
+                'facts_count': np.array([len(a.facts) for a in agents], dtype=np.int64)
+            }
+    
+    def perceive(self, observations: Any) -> None:
+        """Give every agent its observation
+        
+        ``observations`` is an array or list with one entry per agent; any
+        other value is perceived by every agent.
+        """
+        shared = not (isinstance(observations, (list, np.ndarray)) and len(observations) == self.size)
+        if not shared:
+            observations = observations.copy()
+        self._perceived += 1
+        self._log('perceive', observations, shared)
+    
+    def counter(self, name: str) -> np.ndarray:
+        """Current ``messages_sent`` or ``facts_count`` column
+        
+        Each logged perceive adds one, as one ``perceive`` call on the
+        agent sends one broadcast or stores one fact.
+        """
+        return self.columns[name] + self._perceived
+    
+    def reason(self) -> Dict[str, Any]:
+        """Decide for every agent at once"""
+        columns = self.columns
+        if self.kind is AutonomousAgent:
+            decisions = {
+                'agent_id': self.agent_ids,
+                'independence_score': columns['independence_level'],
+                'action': 'autonomous_action',
+                'confidence': columns['independence_level']
+            }
+        elif self.kind is CollaborativeAgent:
+            # Teammates and replicas change shared knowledge outside this population
+            columns['shared_knowledge_items'] = np.fromiter(
+                (len(a.shared_knowledge) for a in self.agents), dtype=np.int64, count=self.size)
+            decisions = {
+                'agent_id': self.agent_ids,
+                'team_members': columns['team_members'].copy(),
+                'shared_knowledge_items': columns['shared_knowledge_items'].copy(),
+                'action': 'collaborative_action'
+            }
+        else:
+            decisions = {
+                'agent_id': self.agent_ids,
+                'method': 'forward_chaining',
+                'conclusions': np.where(self.counter('facts_count') > 0, columns['reasoning_depth'], 0),
+                'depth': columns['reasoning_depth']
+            }
+        self.decisions = decisions
+        if self.kind is ReasoningAgent:
+            self._log('reason', None, True)
+        return decisions
+    
+    def act(self, actions: Any = None) -> Dict[str, Any]:
+        """Execute every agent's action, the decided one if decisions carry one"""
+        if actions is None and self.decisions is not None:
+            actions = self.decisions.get('action')
+        columns = self.columns
+        if self.kind is AutonomousAgent:
+            results = {'agent_id': self.agent_ids, 'action_executed': actions, 'status': 'success'}
+        elif self.kind is CollaborativeAgent:
+            results = {
+                'agent_id': self.agent_ids,
+                'action': actions,
+                'collaboration_level': columns['team_members'] / np.maximum(1, columns['team_size']),
+                'status': 'success'
+            }
+        else:
+            results = {
+                'agent_id': self.agent_ids,
+                'action': actions,
+                'reasoning_depth': columns['reasoning_depth'],
+                'facts_count': self.counter('facts_count'),
+                'status': 'success'
+            }
+        self.results = results
+        return results
+    
+    def step(self, observations: Any) -> Dict[str, Any]:
+        """Run one perceive/reason/act cycle for the whole population"""
+        self.perceive(observations)
+        decisions = self.reason()
+        self.steps += 1
+        return self.act(decisions.get('action'))
+    
+    def decision(self, index: int) -> Dict[str, Any]:
+        """Last decision of one agent as the dict its ``reason`` returns"""
+        decision = self._row(self.decisions, index)
+        if self.kind is ReasoningAgent:
+            decision['conclusions'] = [f"Conclusion_{i}" for i in range(decision['conclusions'])]
+        return decision
+    
+    def result(self, index: int) -> Dict[str, Any]:
+        """Last action result of one agent as the dict its ``act`` returns"""
+        return self._row(self.results, index)
+    
+    def sync(self) -> None:
+        """Apply logged phases to the agent objects and reload columns
+        
+        Each agent takes the net effect of every logged phase at once: its
+        memory, facts and communication log are extended in one call with
+        only the entries their bounds keep. Agents with semantic recall or
+        a team bus replay the phases through their own methods instead,
+        so embeddings and broadcasts happen in log order.
+        """
+        pending, self._pending = self._pending, []
+        if pending:
+            replayed = [index for index, agent in enumerate(self.agents)
+                        if agent.semantic_memory is not None or getattr(agent, 'bus', None) is not None]
+            for phase, observations, shared in pending:
+                for index in replayed:
+                    if phase == 'perceive':
+                        self.agents[index].perceive(observations if shared else observations[index])
+                    else:
+                        self.agents[index].reason()
+            self._apply(pending, set(replayed))
+        self.refresh()
+    
+    def _apply(self, pending: list, skip: set) -> None:
+        """Apply the net effect of logged phases to agents not in ``skip``"""
+        perceived = [(observations, shared) for phase, observations, shared in pending if phase == 'perceive']
+        reasons = []
+        count = 0
+        for phase, _, _ in pending:
+            if phase == 'perceive':
+                count += 1
+            else:
+                reasons.append(count)
+        
+        # Bounded memories and logs only keep the newest perceives, and
+        # only ReasoningAgent.facts needs every one of them
+        keep = count
+        if self.kind is not ReasoningAgent:
+            limits = {agent.memory.maxlen for agent in self.agents}
+            if self.kind is CollaborativeAgent:
+                limits.update(agent.communication_log.maxlen for agent in self.agents)
+            if None not in limits:
+                keep = min(count, max(limits))
+        dropped = count - keep
+        columns = [repeat(observations, self.size) if shared else list(observations)
+                   for observations, shared in perceived[dropped:]]
+        rows = zip(*columns) if columns else repeat((), self.size)
+        percept_type = 'fact' if self.kind is ReasoningAgent else 'observation'
+        
+        for index, (agent, seen) in enumerate(zip(self.agents, rows)):
+            if index in skip:
+                continue
+            if seen:
+                agent.state['observation'] = seen[-1]
+                agent.memory.extend([Percept(percept_type, o) for o in _tail(seen, agent.memory.maxlen)])
+            if self.kind is CollaborativeAgent:
+                first = agent.messages_sent + dropped
+                offset = len(seen) - len(_tail(seen, agent.communication_log.maxlen))
+                agent.communication_log.extend(
+                    {'from': agent.agent_id, 'message': seen[j], 'timestamp': first + j}
+                    for j in range(offset, len(seen)))
+                agent.messages_sent += count
+            elif self.kind is ReasoningAgent:
+                had_facts = bool(agent.facts)
+                agent.facts.extend(seen)
+                names = [f"Conclusion_{i}" for i in range(agent.reasoning_depth)]
+                for before in reasons:
+                    agent.inference_results.append({
+                        'agent_id': agent.agent_id,
+                        'method': 'forward_chaining',
+                        'conclusions': list(names) if had_facts or before else [],
+                        'depth': agent.reasoning_depth
+                    })
+    
+    def pending_phases(self) -> int:
+        """Logged phases not yet replayed onto the agents"""
+        return len(self._pending)
+    
+    def _log(self, phase: str, observations: Any, shared: bool) -> None:
+        """Log a phase for ``sync``, syncing once ``max_pending`` are held"""
+        self._pending.append((phase, observations, shared))
+        if self.max_pending and len(self._pending) >= self.max_pending:
+            self.sync()
+    
+    @staticmethod
+    def _row(columns: Optional[Dict[str, Any]], index: int) -> Dict[str, Any]:
+        """One agent's entry of a column dict"""
+        if columns is None:
+            raise ValueError("no phase has run yet")
+        row = {}
+        for key, value in columns.items():
+            if isinstance(value, np.ndarray):
+                value = value[index]
+                value = value.item() if isinstance(value, np.generic) else value
+            row[key] = value
+        return row
+    
+    def __len__(self) -> int:
+        return self.size
+
+
+def _tail(items: tuple, maxlen: Optional[int]) -> tuple:
+    """Last ``maxlen`` items, all of them when unbounded"""
+    if maxlen is None or len(items) <= maxlen:
+        return items
+    return items[len(items) - maxlen:]
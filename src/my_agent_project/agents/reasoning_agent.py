@@ -2,13 +2,14 @@
 
 from typing import Any, Dict, List
 from .base_agent import BaseAgent
+from ..core.records import Percept
 
 
 class ReasoningAgent(BaseAgent):
     """Agent with advanced reasoning capabilities"""
     
-    def __init__(self, agent_id: str, reasoning_depth: int = 5):
-        super().__init__(agent_id)
+    def __init__(self, agent_id: str, reasoning_depth: int = 5, memory_size: int = 1000):
+        super().__init__(agent_id, memory_size)
         self.reasoning_depth = reasoning_depth
         self.facts = []
         self.rules = []
@@ -18,7 +19,7 @@ class ReasoningAgent(BaseAgent):
         """Perceive and store facts"""
         self.facts.append(observation)
         self.state['observation'] = observation
-        self.update_memory({'type': 'fact', 'data': observation})
+        self.update_memory(Percept('fact', observation))
         
     def reason(self) -> Dict[str, Any]:
         """Apply logical reasoning"""
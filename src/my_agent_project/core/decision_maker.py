@@ -1,15 +1,21 @@
 """Decision Maker module - Decision-making logic"""
 
 from typing import Any, Dict, List, Optional
+import numpy as np
 
 
 class DecisionMaker:
     """Decision-making system"""
     
-    def __init__(self, decision_strategy: str = 'greedy'):
+    def __init__(self, decision_strategy: str = 'greedy', score_weight: float = 0.7,
+                 probability_weight: float = 0.3, seed: Optional[int] = None):
         self.decision_strategy = decision_strategy
+        self.score_weight = score_weight
+        self.probability_weight = probability_weight
         self.decisions_log = []
+        self.batch_decisions = 0
         self.preferences = {}
+        self.rng = np.random.default_rng(seed)
         
     def decide(self, options: List[Dict[str, Any]], context: Dict = None) -> Dict[str, Any]:
         """Make decision based on available options"""
@@ -23,6 +29,44 @@ class DecisionMaker:
         self.decisions_log.append(decision)
         return decision
     
+    def decide_batch(self, scores: np.ndarray, probabilities: Optional[np.ndarray] = None,
+                     mask: Optional[np.ndarray] = None, strategy: Optional[str] = None) -> np.ndarray:
+        """Choose one option per agent from (n_agents, n_options) arrays
+        
+        ``scores`` may also be a structured array with ``score`` and optional
+        ``probability`` fields. ``mask`` marks valid options for agents with
+        fewer options than the widest row. Returns the chosen option index per
+        agent, or -1 where an agent has no options.
+        """
+        scores = np.asarray(scores)
+        if scores.dtype.names:
+            fields = scores.dtype.names
+            if probabilities is None and 'probability' in fields:
+                probabilities = scores['probability']
+            scores = scores['score']
+        scores = np.atleast_2d(np.asarray(scores, dtype=np.float64))
+        strategy = strategy or self.decision_strategy
+        
+        if strategy == 'greedy':
+            values = scores
+        elif strategy == 'utility':
+            if probabilities is None:
+                probabilities = np.zeros_like(scores)
+            values = self._weighted_utility(scores, np.asarray(probabilities, dtype=np.float64))
+        else:
+            values = self.rng.random(scores.shape)
+        
+        if mask is not None:
+            mask = np.asarray(mask, dtype=bool)
+            values = np.where(mask, values, -np.inf)
+        
+        choices = np.argmax(values, axis=1) if values.shape[1] else np.full(len(values), -1)
+        if mask is not None:
+            choices[~mask.any(axis=1)] = -1
+        
+        self.batch_decisions += len(choices)
+        return choices
+    
     def _greedy_decision(self, options: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Greedy decision making"""
         if not options:
@@ -69,13 +113,11 @@ class DecisionMaker:
     
     def _calculate_utility(self, option: Dict[str, Any]) -> float:
         """Calculate utility of option"""
-        weight_score = 0.7
-        weight_probability = 0.3
-        
-        score = option.get('score', 0) * weight_score
-        probability = option.get('probability', 0) * weight_probability
-        
-        return score + probability
+        return self._weighted_utility(option.get('score', 0), option.get('probability', 0))
+    
+    def _weighted_utility(self, score, probability):
+        """Weighted utility, shared by scalar and array code paths"""
+        return score * self.score_weight + probability * self.probability_weight
     
     def set_preference(self, key: str, value: float) -> None:
         """Set preference for decision factor"""
@@ -84,7 +126,7 @@ class DecisionMaker:
     def get_decision_metrics(self) -> Dict[str, Any]:
         """Get decision-making metrics"""
         return {
-            'total_decisions': len(self.decisions_log),
+            'total_decisions': len(self.decisions_log) + self.batch_decisions,
             'strategy': self.decision_strategy,
             'preferences': self.preferences
         }
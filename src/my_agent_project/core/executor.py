@@ -1,7 +1,13 @@
 """Executor module - Action execution and management"""
 
-from typing import Any, Dict, List, Callable, Optional
+from typing import Any, Dict, Iterable, List, Callable, Optional, Union
+from abc import ABC, abstractmethod
+import asyncio
+import inspect
+from collections import OrderedDict, deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
 from enum import Enum
+from .result_cache import ResultCache
 
 
 class ExecutionStatus(Enum):
@@ -16,14 +22,23 @@ class ExecutionStatus(Enum):
 class Task:
     """Task representation"""
     
-    def __init__(self, task_id: str, action: Callable, args: tuple = (), kwargs: Dict = None):
+    def __init__(self, task_id: str, action: Callable, args: tuple = (), kwargs: Dict = None,
+                 timeout: Optional[float] = None, priority: int = 0, deadline: Optional[float] = None,
+                 dependencies: Iterable[str] = (), owner: Optional[str] = None):
         self.task_id = task_id
         self.action = action
         self.args = args
         self.kwargs = kwargs or {}
+        self.timeout = timeout
+        self.priority = priority
+        self.deadline = deadline
+        self.dependencies = tuple(dependencies)
+        self.owner = owner
         self.status = ExecutionStatus.PENDING
         self.result = None
         self.error = None
+        self.cache_key = None
+        self.future = Future()
         
     def execute(self) -> Any:
         """Execute task"""
@@ -36,52 +51,448 @@ class Task:
             self.status = ExecutionStatus.FAILED
             self.error = str(e)
             raise
+    
+    def cancel(self) -> bool:
+        """Cancel task if it has not started"""
+        return self.future.cancel()
+
+
+class ExecutionBackend(ABC):
+    """Abstract execution backend"""
+    
+    raise_errors = False
+    
+    @abstractmethod
+    def submit(self, task: Task) -> Future:
+        """Start running task and return future for its outcome"""
+        pass
+    
+    def shutdown(self, wait: bool = True) -> None:
+        """Release backend resources"""
+        pass
+
+
+class InlineBackend(ExecutionBackend):
+    """Run tasks synchronously in the calling thread"""
+    
+    raise_errors = True
+    
+    def submit(self, task: Task) -> Future:
+        """Execute task immediately"""
+        future = Future()
+        try:
+            future.set_result(task.execute())
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+
+class ThreadPoolBackend(ExecutionBackend):
+    """Run tasks on a thread pool, suited to I/O-bound actions"""
+    
+    def __init__(self, max_workers: int = 5):
+        self.pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='executor')
+    
+    def submit(self, task: Task) -> Future:
+        """Execute task on a worker thread"""
+        return self.pool.submit(task.execute)
+    
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down thread pool"""
+        self.pool.shutdown(wait=wait)
+
+
+class ProcessPoolBackend(ExecutionBackend):
+    """Run tasks in worker processes, suited to CPU-bound actions
+
+    Actions and their arguments must be picklable. The task object stays in
+    the parent process, so the Executor records its outcome on completion.
+    """
+    
+    def __init__(self, max_workers: int = 5):
+        self.pool = ProcessPoolExecutor(max_workers=max_workers)
+    
+    def submit(self, task: Task) -> Future:
+        """Execute task action in a worker process"""
+        task.status = ExecutionStatus.RUNNING
+        return self.pool.submit(task.action, *task.args, **task.kwargs)
+    
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down process pool"""
+        self.pool.shutdown(wait=wait)
+
+
+class TaskQueue:
+    """FIFO task queue, the default Executor scheduling policy"""
+    
+    def __init__(self):
+        self._tasks = deque()
+    
+    def push(self, task: Task) -> None:
+        """Queue task"""
+        self._tasks.append(task)
+    
+    def pop(self) -> Optional[Task]:
+        """Next task to dispatch, None when nothing is ready"""
+        return self._tasks.popleft() if self._tasks else None
+    
+    def complete(self, task: Task) -> None:
+        """Notify queue that task reached a final status"""
+        pass
+    
+    def __len__(self) -> int:
+        return len(self._tasks)
+    
+    def __iter__(self):
+        return iter(self._tasks)
+
+
+class ExecutionHistory:
+    """Bounded record of finished tasks indexed by task id
+
+    Tasks are kept in an ordered hash map, so lookup by id is O(1). Once
+    ``max_size`` tasks are held the least recently finished or looked-up
+    task is evicted. Per-status counters cover every task ever recorded,
+    evicted or not. Iteration runs from least to most recently used.
+    """
+    
+    def __init__(self, max_size: Optional[int] = 10000):
+        self.max_size = max_size
+        self.counts = {status: 0 for status in ExecutionStatus}
+        self.evicted = 0
+        self._tasks = OrderedDict()
+    
+    def append(self, task: Task) -> None:
+        """Record finished task, replacing an older task with the same id"""
+        self.counts[task.status] += 1
+        self._tasks.pop(task.task_id, None)
+        self._tasks[task.task_id] = task
+        if self.max_size is not None and len(self._tasks) > self.max_size:
+            self._tasks.popitem(last=False)
+            self.evicted += 1
+    
+    def get(self, task_id: str) -> Optional[Task]:
+        """Look up finished task and mark it recently used"""
+        task = self._tasks.get(task_id)
+        if task is not None:
+            self._tasks.move_to_end(task_id)
+        return task
+    
+    def total(self) -> int:
+        """Number of tasks recorded since creation"""
+        return sum(self.counts.values())
+    
+    def clear(self) -> None:
+        """Forget retained tasks and reset counters"""
+        self._tasks.clear()
+        self.counts = {status: 0 for status in ExecutionStatus}
+        self.evicted = 0
+    
+    def __contains__(self, task_id: str) -> bool:
+        return task_id in self._tasks
+    
+    def __len__(self) -> int:
+        return len(self._tasks)
+    
+    def __iter__(self):
+        return iter(self._tasks.values())
+
+
+BACKENDS = {
+    'inline': InlineBackend,
+    'thread': ThreadPoolBackend,
+    'process': ProcessPoolBackend,
+}
 
 
 class Executor:
     """Action executor"""
     
-    def __init__(self, max_concurrent_tasks: int = 5):
+    def __init__(self, max_concurrent_tasks: int = 5, backend: Union[str, ExecutionBackend] = 'inline',
+                 scheduler: Optional[Any] = None, max_history: Optional[int] = 10000,
+                 cache: Optional[ResultCache] = None):
         self.max_concurrent_tasks = max_concurrent_tasks
-        self.task_queue = []
-        self.execution_history = []
+        self.task_queue = scheduler if scheduler is not None else TaskQueue()
+        self.execution_history = ExecutionHistory(max_history)
+        # Keyed by Task object, since task ids need not be unique
         self.active_tasks = {}
+        self.cache = cache
+        self._duplicates = {}
+        if isinstance(backend, str):
+            backend = InlineBackend() if backend == 'inline' else BACKENDS[backend](max_concurrent_tasks)
+        self.backend = backend
+    
+    def submit_task(self, task_id: str, action: Callable, args: tuple = (), kwargs: Dict = None,
+                    cache: bool = False, **options) -> Task:
+        """Submit task for execution, its outcome is available as ``task.future``
         
-    def submit_task(self, task_id: str, action: Callable, args: tuple = (), kwargs: Dict = None) -> Task:
-        """Submit task for execution"""
-        task = Task(task_id, action, args, kwargs)
-        self.task_queue.append(task)
+        ``options`` (priority, deadline, dependencies, owner) are stored on
+        the task for schedulers such as ``TaskScheduler``. With ``cache`` the
+        action is treated as pure: a cached result finishes the task without
+        running it, and duplicates of a running call wait for its result.
+        """
+        task = Task(task_id, action, args, kwargs, **options)
+        if cache:
+            if self.cache is None:
+                self.cache = ResultCache()
+            task.cache_key = self.cache.make_key(action, task.args, task.kwargs)
+        self.task_queue.push(task)
         return task
     
     def execute_tasks(self) -> List[Task]:
-        """Execute queued tasks"""
+        """Execute queued tasks on the backend
+
+        At most ``max_concurrent_tasks`` run at once. The inline backend keeps
+        the synchronous behaviour of stopping at the first failure and
+        re-raising it; pool backends run the whole queue and return failed
+        tasks alongside successful ones.
+        """
         executed = []
+        in_flight = {}
         
-        while self.task_queue and len(self.active_tasks) < self.max_concurrent_tasks:
-            task = self.task_queue.pop(0)
-            self.active_tasks[task.task_id] = task
+        while True:
+            while len(self.active_tasks) < self.max_concurrent_tasks:
+                task = self.task_queue.pop()
+                if task is None:
+                    break
+                if not task.future.set_running_or_notify_cancel():
+                    task.status = ExecutionStatus.CANCELLED
+                    self._record(task)
+                    continue
+                if task.cache_key is not None and self._serve_cached(task, executed):
+                    continue
+                
+                self.active_tasks[task] = task.task_id
+                future = self.backend.submit(task)
+                if future.done():
+                    self._finish(task, future, executed)
+                else:
+                    in_flight[future] = task
             
-            try:
-                task.execute()
-                executed.append(task)
-            finally:
-                del self.active_tasks[task.task_id]
-                self.execution_history.append(task)
+            if not in_flight:
+                break
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                self._finish(in_flight.pop(future), future, executed)
         
         return executed
     
+    def _finish(self, task: Task, future: Future, executed: List[Task]) -> None:
+        """Record outcome of a task whose backend future is done"""
+        del self.active_tasks[task]
+        error = future.exception()
+        if task.status == ExecutionStatus.RUNNING:
+            if error is None:
+                task.result = future.result()
+                task.status = ExecutionStatus.SUCCESS
+            else:
+                task.status = ExecutionStatus.FAILED
+                task.error = str(error)
+        followers = []
+        if task.cache_key is not None:
+            followers = self._duplicates.pop(task.cache_key, [])
+            if task.status == ExecutionStatus.SUCCESS:
+                self.cache.put(task.cache_key, task.result)
+        
+        for finished in [task] + followers:
+            finished.status, finished.result, finished.error = task.status, task.result, task.error
+            self._record(finished)
+            if error is None:
+                finished.future.set_result(finished.result)
+            else:
+                finished.future.set_exception(error)
+            executed.append(finished)
+        if error is not None and self.backend.raise_errors:
+            raise error
+    
+    def _serve_cached(self, task: Task, executed: List[Task]) -> bool:
+        """Finish task from the cache or park it behind a running duplicate"""
+        followers = self._duplicates.get(task.cache_key)
+        if followers is not None:
+            followers.append(task)
+            self.cache.collapsed += 1
+            return True
+        hit, result = self.cache.get(task.cache_key)
+        if not hit:
+            self._duplicates[task.cache_key] = []
+            return False
+        
+        task.result = result
+        task.status = ExecutionStatus.SUCCESS
+        self._record(task)
+        task.future.set_result(result)
+        executed.append(task)
+        return True
+    
+    def _record(self, task: Task) -> None:
+        """Add finished task to history and release its dependents"""
+        self.execution_history.append(task)
+        self.task_queue.complete(task)
+    
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down execution backend"""
+        self.backend.shutdown(wait=wait)
+    
+    def __enter__(self) -> 'Executor':
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.shutdown()
+    
     def get_execution_status(self) -> Dict[str, Any]:
         """Get execution status"""
+        history = self.execution_history
         return {
             'queued_tasks': len(self.task_queue),
             'active_tasks': len(self.active_tasks),
-            'completed_tasks': len(self.execution_history),
+            'completed_tasks': history.total(),
+            'succeeded_tasks': history.counts[ExecutionStatus.SUCCESS],
+            'failed_tasks': history.counts[ExecutionStatus.FAILED],
+            'cancelled_tasks': history.counts[ExecutionStatus.CANCELLED],
+            'retained_tasks': len(history),
             'max_concurrent': self.max_concurrent_tasks
         }
     
     def get_task_result(self, task_id: str) -> Optional[Any]:
-        """Get result of completed task"""
-        for task in self.execution_history:
+        """Get result of completed task still held in history"""
+        task = self.execution_history.get(task_id)
+        return task.result if task is not None else None
+
+
+class AsyncExecutor:
+    """Executor for coroutine actions on an asyncio event loop
+
+    Queued tasks all start at once and wait on a semaphore sized by
+    ``max_concurrent_tasks``, so thousands of I/O-bound actions share one
+    loop. Timeouts and cancellation leave the task CANCELLED; any other
+    exception, including a ``TimeoutError`` raised by the action itself,
+    leaves it FAILED. Plain callables run inline on the loop thread and
+    block every other task until they return, and ``timeout`` only applies
+    to awaitables.
+    """
+    
+    def __init__(self, max_concurrent_tasks: int = 5, default_timeout: Optional[float] = None,
+                 max_history: Optional[int] = 10000):
+        self.max_concurrent_tasks = max_concurrent_tasks
+        self.default_timeout = default_timeout
+        self.task_queue = deque()
+        self.execution_history = ExecutionHistory(max_history)
+        self.active_tasks = {}
+        self._handles = {}
+        self._semaphore = None
+        self._loop = None
+        
+    def submit_task(self, task_id: str, action: Callable, args: tuple = (), kwargs: Dict = None,
+                    timeout: Optional[float] = None) -> Task:
+        """Submit coroutine function (or plain callable) for execution"""
+        task = Task(task_id, action, args, kwargs, timeout if timeout is not None else self.default_timeout)
+        self.task_queue.append(task)
+        return task
+    
+    async def execute_tasks(self) -> List[Task]:
+        """Run all queued tasks concurrently and return them once finished"""
+        tasks = list(self.task_queue)
+        self.task_queue.clear()
+        handles = []
+        for task in tasks:
+            handle = asyncio.ensure_future(self.run_task(task))
+            self._handles[task] = handle
+            handles.append(handle)
+        await asyncio.gather(*handles, return_exceptions=True)
+        for task in tasks:
+            if task.status == ExecutionStatus.PENDING:
+                # Cancelled before its coroutine ever started
+                self._handles.pop(task, None)
+                self._cancelled(task, "cancelled")
+                self.execution_history.append(task)
+        return tasks
+    
+    async def run_task(self, task: Task) -> Task:
+        """Run a single task under the concurrency limit"""
+        try:
+            async with self._limit():
+                if not task.future.set_running_or_notify_cancel():
+                    task.status = ExecutionStatus.CANCELLED
+                    return task
+                # Keyed by the task itself, like Executor, so duplicate ids coexist
+                self.active_tasks[task] = task.task_id
+                task.status = ExecutionStatus.RUNNING
+                result = task.action(*task.args, **task.kwargs)
+                if inspect.isawaitable(result):
+                    if task.timeout is None:
+                        result = await result
+                    else:
+                        loop = asyncio.get_running_loop()
+                        deadline = loop.time() + task.timeout
+                        try:
+                            result = await asyncio.wait_for(result, task.timeout)
+                        except asyncio.TimeoutError:
+                            if loop.time() < deadline:
+                                raise
+                            self._cancelled(task, f"timed out after {task.timeout}s")
+                            return task
+                task.result = result
+                task.status = ExecutionStatus.SUCCESS
+                task.future.set_result(result)
+        except asyncio.CancelledError:
+            self._cancelled(task, "cancelled")
+            raise
+        except Exception as e:
+            task.status = ExecutionStatus.FAILED
+            task.error = str(e)
+            task.future.set_exception(e)
+        finally:
+            self.active_tasks.pop(task, None)
+            self._handles.pop(task, None)
+            self.execution_history.append(task)
+        return task
+    
+    def _limit(self) -> asyncio.Semaphore:
+        """Concurrency semaphore of the running loop
+        
+        A semaphore binds to the first loop that waits on it, so a new one
+        is made whenever the executor is driven from another loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrent_tasks)
+            self._loop = loop
+        return self._semaphore
+    
+    def _cancelled(self, task: Task, reason: str) -> None:
+        """Mark task cancelled"""
+        task.status = ExecutionStatus.CANCELLED
+        task.error = reason
+        if task.future.running():
+            task.future.set_exception(asyncio.CancelledError(reason))
+        else:
+            task.future.cancel()
+    
+    def cancel_task(self, task_id: str) -> bool:
+        """Cancel a queued or running task"""
+        for task, handle in self._handles.items():
             if task.task_id == task_id:
-                return task.result
-        return None
+                return handle.cancel()
+        for task in self.task_queue:
+            if task.task_id == task_id:
+                return task.cancel()
+        return False
+    
+    def get_execution_status(self) -> Dict[str, Any]:
+        """Get execution status"""
+        history = self.execution_history
+        return {
+            'queued_tasks': len(self.task_queue),
+            'active_tasks': len(self.active_tasks),
+            'completed_tasks': history.total(),
+            'succeeded_tasks': history.counts[ExecutionStatus.SUCCESS],
+            'failed_tasks': history.counts[ExecutionStatus.FAILED],
+            'cancelled_tasks': history.counts[ExecutionStatus.CANCELLED],
+            'retained_tasks': len(history),
+            'max_concurrent': self.max_concurrent_tasks
+        }
+    
+    def get_task_result(self, task_id: str) -> Optional[Any]:
+        """Get result of completed task still held in history"""
+        task = self.execution_history.get(task_id)
+        return task.result if task is not None else None
@@ -0,0 +1,157 @@
+"""Knowledge Store module - Replicated last-writer-wins knowledge map"""
+
+from typing import Any, Dict, Hashable, Mapping, Optional, Tuple
+from collections import OrderedDict
+from types import MappingProxyType
+from .message_bus import MessageBus
+
+
+class _Tombstone:
+    """Marker for deleted keys that stays a singleton across pickling"""
+    
+    def __reduce__(self) -> str:
+        return '_DELETED'
+    
+    def __repr__(self) -> str:
+        return '<deleted>'
+
+
+_DELETED = _Tombstone()
+
+SYNC_REQUEST = 'sync_request'
+
+
+class KnowledgeStore:
+    """Last-writer-wins map CRDT shared by a team
+    
+    Every write is stamped with a version ``(lamport_clock, replica_id)``
+    and ``merge`` keeps the highest version per key, so replicas converge
+    whatever order deltas arrive in. Agents in one process share a store
+    and read it through ``view()``, a live read-only mapping. Each change
+    also gets a local sequence number, kept in change order, so
+    ``delta_since`` and ``publish`` cost O(changed keys).
+    
+    A replica attaching to a bus asks the others for their state; each
+    answers at its next ``sync`` by publishing every entry it holds, so
+    replicas joining late still receive earlier writes.
+    """
+    
+    def __init__(self, replica_id: str):
+        self.replica_id = replica_id
+        self.clock = 0
+        self.seq = 0
+        self._values = {}
+        self._versions = {}
+        self._changes = OrderedDict()
+        self._unpublished = OrderedDict()
+        self.bus = None
+        self.topic = None
+        self.subscription = None
+    
+    def set(self, key: Hashable, value: Any) -> None:
+        """Write value under key"""
+        self.clock += 1
+        self._apply(key, value, (self.clock, self.replica_id))
+        self._unpublished[key] = None
+    
+    def delete(self, key: Hashable) -> None:
+        """Remove key, leaving a tombstone so the removal replicates"""
+        self.set(key, _DELETED)
+    
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Current value of key"""
+        return self._values.get(key, default)
+    
+    def view(self) -> Mapping:
+        """Live read-only view of the current values"""
+        return MappingProxyType(self._values)
+    
+    def version(self, key: Hashable) -> Optional[Tuple[int, str]]:
+        """Version of the last write to key"""
+        return self._versions.get(key)
+    
+    def delta_since(self, seq: int = 0) -> Dict[Hashable, Tuple[Any, Tuple[int, str]]]:
+        """Entries changed locally after sequence number seq"""
+        delta = {}
+        for key in reversed(self._changes):
+            if self._changes[key] <= seq:
+                break
+            delta[key] = (self._values.get(key, _DELETED), self._versions[key])
+        return delta
+    
+    def merge(self, delta: Mapping[Hashable, Tuple[Any, Tuple[int, str]]], republish: bool = False) -> int:
+        """Apply remote entries newer than the local ones, return how many
+        
+        With ``republish`` the applied entries are also sent on the next
+        ``publish``, for deltas that did not come from the bus.
+        """
+        applied = 0
+        for key, (value, version) in delta.items():
+            current = self._versions.get(key)
+            if current is None or tuple(version) > current:
+                self.clock = max(self.clock, version[0])
+                self._apply(key, value, tuple(version))
+                if republish:
+                    self._unpublished[key] = None
+                applied += 1
+        return applied
+    
+    def attach(self, bus: MessageBus, topic: str) -> None:
+        """Replicate through bus: ``publish`` sends local writes, ``sync`` merges remote ones
+        
+        Every entry already held is queued for the next ``publish`` and the
+        other replicas are asked for theirs.
+        """
+        self.bus = bus
+        self.topic = topic
+        self.subscription = bus.subscribe(topic, self.replica_id)
+        self._unpublished.update(dict.fromkeys(self._changes))
+        bus.publish(topic, self.replica_id, SYNC_REQUEST)
+    
+    def detach(self) -> None:
+        """Stop replicating through the bus"""
+        if self.bus is not None:
+            self.bus.unsubscribe(self.topic, self.replica_id)
+        self.bus = self.topic = self.subscription = None
+    
+    def publish(self) -> int:
+        """Publish keys written locally since the last publish"""
+        if self.bus is None or not self._unpublished:
+            return 0
+        delta = {key: (self._values.get(key, _DELETED), self._versions[key]) for key in self._unpublished}
+        self._unpublished.clear()
+        self.bus.publish(self.topic, self.replica_id, delta)
+        return len(delta)
+    
+    def sync(self) -> int:
+        """Merge deltas delivered from other replicas, answering state requests"""
+        if self.subscription is None:
+            return 0
+        applied = 0
+        requested = False
+        for message in self.subscription.drain():
+            if message.payload == SYNC_REQUEST:
+                requested = True
+            else:
+                applied += self.merge(message.payload)
+        if requested:
+            self._unpublished.update(dict.fromkeys(self._changes))
+            self.publish()
+        return applied
+    
+    def _apply(self, key: Hashable, value: Any, version: Tuple[int, str]) -> None:
+        """Store value and version and record the change"""
+        if value is _DELETED:
+            self._values.pop(key, None)
+        else:
+            self._values[key] = value
+        self._versions[key] = version
+        self.seq += 1
+        self._changes[key] = self.seq
+        self._changes.move_to_end(key)
+    
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._values
+    
+    def __len__(self) -> int:
+        return len(self._values)
@@ -1,17 +1,217 @@
 """Learning module - Learning algorithms and models"""
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
+from pathlib import Path
+import pickle
 import random
+import numpy as np
+from .records import Transition
+
+
+class RunningStats:
+    """Streaming count/sum/min/max with Welford mean and variance"""
+    
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.minimum = float('inf')
+        self.maximum = -float('inf')
+        self.mean = 0.0
+        self.m2 = 0.0
+    
+    def update(self, value: float) -> None:
+        """Add single value"""
+        self.count += 1
+        self.total += value
+        if value < self.minimum:
+            self.minimum = value
+        if value > self.maximum:
+            self.maximum = value
+        diff = value - self.mean
+        self.mean += diff / self.count
+        self.m2 += diff * (value - self.mean)
+    
+    def update_many(self, values: np.ndarray) -> None:
+        """Add array of values using Chan's parallel merge"""
+        values = np.asarray(values, dtype=np.float64)
+        if not values.size:
+            return
+        count = self.count + values.size
+        batch_mean = float(values.mean())
+        diff = batch_mean - self.mean
+        self.m2 += float(((values - batch_mean) ** 2).sum()) + diff * diff * self.count * values.size / count
+        self.mean += diff * values.size / count
+        self.count = count
+        self.total += float(values.sum())
+        self.minimum = min(self.minimum, float(values.min()))
+        self.maximum = max(self.maximum, float(values.max()))
+    
+    @property
+    def variance(self) -> float:
+        """Population variance"""
+        return self.m2 / self.count if self.count else 0.0
+
+
+class TrainingHistory:
+    """Fixed-capacity ring buffer of training transitions
+    
+    Rewards and deltas are kept in NumPy arrays, states and actions in
+    preallocated lists. With ``spill_path`` set, every row is appended to that
+    file (as ``HISTORY_DTYPE`` records) before the ring overwrites it, and its
+    state and action to a pickled sidecar next to it, so the full history
+    survives on disk while RAM stays bounded.
+    """
+    
+    HISTORY_DTYPE = np.dtype([('reward', np.float64), ('delta', np.float64)])
+    OBJECTS_SUFFIX = '.objects'
+    
+    def __init__(self, capacity: int = 10000, spill_path: Optional[str] = None):
+        if capacity < 1:
+            raise ValueError(f"history capacity must be positive, got {capacity}")
+        self.capacity = capacity
+        self.spill_path = spill_path
+        self.rewards = np.zeros(capacity, dtype=np.float64)
+        self.deltas = np.zeros(capacity, dtype=np.float64)
+        self.states = [None] * capacity
+        self.actions = [None] * capacity
+        self.total_rows = 0
+        self.spilled_rows = 0
+        if spill_path:
+            Path(spill_path).parent.mkdir(parents=True, exist_ok=True)
+            open(spill_path, 'wb').close()
+            open(spill_path + self.OBJECTS_SUFFIX, 'wb').close()
+    
+    def record(self, state: Any, action: Any, reward: float, delta: float) -> None:
+        """Record single transition"""
+        if self.spill_path and self.total_rows - self.spilled_rows == self.capacity:
+            self.flush()
+        pos = self.total_rows % self.capacity
+        self.states[pos] = state
+        self.actions[pos] = action
+        self.rewards[pos] = reward
+        self.deltas[pos] = delta
+        self.total_rows += 1
+    
+    def record_many(self, states: List[Any], actions: Optional[List[Any]], rewards: np.ndarray,
+                    deltas: np.ndarray) -> None:
+        """Record batch of transitions"""
+        rewards = np.asarray(rewards, dtype=np.float64)
+        deltas = np.asarray(deltas, dtype=np.float64)
+        states = list(states)
+        actions = list(actions) if actions is not None else [None] * len(states)
+        if len(states) > self.capacity and not self.spill_path:
+            self.total_rows += len(states) - self.capacity
+            states, actions = states[-self.capacity:], actions[-self.capacity:]
+            rewards, deltas = rewards[-self.capacity:], deltas[-self.capacity:]
+        
+        offset = 0
+        while offset < len(states):
+            room = self.capacity - self.total_rows % self.capacity
+            if self.spill_path:
+                if self.total_rows - self.spilled_rows == self.capacity:
+                    self.flush()
+                room = min(room, self.capacity - (self.total_rows - self.spilled_rows))
+            pos = self.total_rows % self.capacity
+            count = min(room, len(states) - offset)
+            self.states[pos:pos + count] = states[offset:offset + count]
+            self.actions[pos:pos + count] = actions[offset:offset + count]
+            self.rewards[pos:pos + count] = rewards[offset:offset + count]
+            self.deltas[pos:pos + count] = deltas[offset:offset + count]
+            self.total_rows += count
+            offset += count
+    
+    def flush(self) -> None:
+        """Write rows not yet on disk to the spill file"""
+        pending = self.total_rows - self.spilled_rows
+        if not self.spill_path or not pending:
+            return
+        self._spill(self._order()[-pending:])
+        self.spilled_rows = self.total_rows
+    
+    def _spill(self, order: np.ndarray) -> None:
+        """Append rows at buffer positions ``order`` to the spill files"""
+        records = np.empty(len(order), dtype=self.HISTORY_DTYPE)
+        records['reward'] = self.rewards[order]
+        records['delta'] = self.deltas[order]
+        with open(self.spill_path, 'ab') as f:
+            records.tofile(f)
+        positions = order.tolist()
+        chunk = ([self.states[pos] for pos in positions], [self.actions[pos] for pos in positions])
+        with open(self.spill_path + self.OBJECTS_SUFFIX, 'ab') as f:
+            pickle.dump(chunk, f, protocol=pickle.HIGHEST_PROTOCOL)
+    
+    @classmethod
+    def load_spilled(cls, spill_path: str) -> np.ndarray:
+        """Load spilled rewards and deltas as a structured array"""
+        return np.fromfile(spill_path, dtype=cls.HISTORY_DTYPE)
+    
+    @classmethod
+    def iter_spilled(cls, spill_path: str) -> Iterator[Transition]:
+        """Replay spilled transitions, states and actions included, in order"""
+        records = cls.load_spilled(spill_path)
+        row = 0
+        with open(spill_path + cls.OBJECTS_SUFFIX, 'rb') as f:
+            while True:
+                try:
+                    states, actions = pickle.load(f)
+                except EOFError:
+                    return
+                for state, action, (reward, delta) in zip(states, actions, records[row:row + len(states)].tolist()):
+                    yield Transition(state, action, reward, delta)
+                row += len(states)
+    
+    def _order(self) -> np.ndarray:
+        """Buffer positions in chronological order"""
+        size = len(self)
+        start = (self.total_rows - size) % self.capacity
+        return (start + np.arange(size)) % self.capacity
+    
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        """Retained rewards and deltas in chronological order"""
+        order = self._order()
+        return {'reward': self.rewards[order], 'delta': self.deltas[order]}
+    
+    def __len__(self) -> int:
+        return min(self.total_rows, self.capacity)
+    
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("training history index out of range")
+        pos = (self.total_rows - size + index) % self.capacity
+        return Transition(self.states[pos], self.actions[pos], float(self.rewards[pos]), float(self.deltas[pos]))
+    
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+    
+    def clear(self) -> None:
+        """Drop retained rows"""
+        self.flush()
+        self.states = [None] * self.capacity
+        self.actions = [None] * self.capacity
+        self.total_rows = self.spilled_rows = 0
 
 
 class LearningModel:
     """Base learning model"""
     
-    def __init__(self, learning_rate: float = 0.01, discount_factor: float = 0.9):
+    def __init__(self, learning_rate: float = 0.01, discount_factor: float = 0.9,
+                 history_capacity: Optional[int] = None, history_spill_path: Optional[str] = None):
         self.learning_rate = learning_rate
         self.discount_factor = discount_factor
         self.weights = {}
-        self.training_history = []
+        self.history_capacity = history_capacity
+        if history_capacity is not None:
+            self.training_history = TrainingHistory(history_capacity, history_spill_path)
+        else:
+            self.training_history = []
+        self.reward_stats = RunningStats()
+        self.delta_stats = RunningStats()
         
     def train(self, state: Any, action: Any, reward: float, next_state: Any) -> None:
         """Train the model"""
@@ -23,12 +223,16 @@ class LearningModel:
             self.weights[state_key] = 0
         
         self.weights[state_key] += self.learning_rate * delta
-        self.training_history.append({
-            'state': state,
-            'action': action,
-            'reward': reward,
-            'delta': delta
-        })
+        self._record(state, action, reward, delta)
+    
+    def _record(self, state: Any, action: Any, reward: float, delta: float) -> None:
+        """Update running aggregates and history with one transition"""
+        self.reward_stats.update(reward)
+        self.delta_stats.update(delta)
+        if self.history_capacity:
+            self.training_history.record(state, action, reward, delta)
+        else:
+            self.training_history.append(Transition(state, action, reward, delta))
     
     def predict(self, state: Any) -> float:
         """Predict value for state"""
@@ -39,17 +243,186 @@ class LearningModel:
         return self.weights.get(str(state), 0.0)
     
     def get_training_metrics(self) -> Dict[str, Any]:
-        """Get training metrics"""
-        if not self.training_history:
+        """Get training metrics from running aggregates"""
+        if not self.reward_stats.count:
             return {}
         
-        rewards = [h['reward'] for h in self.training_history]
-        deltas = [h['delta'] for h in self.training_history]
-        
         return {
-            'total_episodes': len(self.training_history),
-            'average_reward': sum(rewards) / len(rewards),
-            'average_delta': sum(deltas) / len(deltas),
-            'max_reward': max(rewards),
-            'min_reward': min(rewards)
+            'total_episodes': self.reward_stats.count,
+            'average_reward': self.reward_stats.total / self.reward_stats.count,
+            'average_delta': self.delta_stats.total / self.delta_stats.count,
+            'max_reward': self.reward_stats.maximum,
+            'min_reward': self.reward_stats.minimum,
+            'reward_variance': self.reward_stats.variance,
+            'delta_variance': self.delta_stats.variance
         }
+
+
+class TabularLearningModel(LearningModel):
+    """Learning model with states interned to ids and values in a NumPy array
+    
+    States are keyed by the state object itself (falling back to ``str(state)``
+    for unhashable states) instead of being formatted on every call. Ids are
+    assigned in insertion order, so ``state_ids`` doubles as the id -> state
+    table, and the values live in a growable float array. With
+    ``int_states=True`` states are non-negative integers used directly as
+    ids, which drops the intern table and leaves one array slot per state;
+    negative ids raise ``ValueError``.
+    
+    Keys follow dict equality rather than ``LearningModel``'s string keys:
+    ``1``, ``1.0`` and ``True`` are one state while ``1`` and ``'1'`` are
+    two. ``weights`` still reports ``str(state)`` keys, so loading it back
+    only round-trips string states; load ``dict(zip(state_ids, values))``
+    to keep other state types.
+    """
+    
+    def __init__(self, learning_rate: float = 0.01, discount_factor: float = 0.9,
+                 initial_capacity: int = 1024, dtype: Any = np.float64, record_history: bool = True,
+                 int_states: bool = False, history_capacity: Optional[int] = None,
+                 history_spill_path: Optional[str] = None):
+        self.int_states = int_states
+        self.state_ids = {}
+        self._num_states = 0
+        self.values = np.zeros(max(1, initial_capacity), dtype=dtype)
+        self.record_history = record_history
+        super().__init__(learning_rate, discount_factor, history_capacity, history_spill_path)
+    
+    @property
+    def weights(self) -> Dict[str, float]:
+        """Value table as a ``str(state) -> value`` dict, like LearningModel"""
+        states = range(self._num_states) if self.int_states else self.state_ids
+        return {str(state): float(value) for state, value in zip(states, self.values)}
+    
+    @weights.setter
+    def weights(self, weights: Dict[Any, float]) -> None:
+        """Load value table from a ``state -> value`` mapping"""
+        self.state_ids = {}
+        self._num_states = 0
+        self.values[:] = 0
+        for state, value in weights.items():
+            self.values[self.intern(state)] = value
+    
+    def train(self, state: Any, action: Any, reward: float, next_state: Any) -> None:
+        """Train the model"""
+        state_id = self.intern(state)
+        next_value = self._get_value(next_state)
+        delta = reward + self.discount_factor * next_value - float(self.values[state_id])
+        self.values[state_id] += self.learning_rate * delta
+        if self.record_history:
+            self._record(state, action, reward, delta)
+        else:
+            self.reward_stats.update(reward)
+            self.delta_stats.update(delta)
+    
+    def train_batch(self, states: List[Any], actions: List[Any], rewards: Any, next_states: List[Any]) -> np.ndarray:
+        """Apply TD updates for a batch of transitions and return their deltas"""
+        state_ids = self.intern_many(states)
+        next_state_ids = self.intern_many(next_states)
+        deltas = self.train_batch_ids(state_ids, rewards, next_state_ids)
+        if self.record_history and self.history_capacity:
+            self.training_history.record_many(states, actions, rewards, deltas)
+        elif self.record_history:
+            if actions is None:
+                actions = [None] * len(deltas)
+            self.training_history.extend(
+                Transition(s, a, r, d)
+                for s, a, r, d in zip(states, actions, np.asarray(rewards).tolist(), deltas.tolist())
+            )
+        return deltas
+    
+    def train_batch_ids(self, state_ids: np.ndarray, rewards: Any, next_state_ids: np.ndarray) -> np.ndarray:
+        """Vectorized TD update over interned state ids
+        
+        All deltas are computed from the values at the start of the batch and
+        updates for repeated states are summed, so a batch is equivalent to
+        sequential ``train`` calls only when its states are distinct and do
+        not appear as next states.
+        """
+        state_ids = np.asarray(state_ids, dtype=np.intp)
+        next_state_ids = np.asarray(next_state_ids, dtype=np.intp)
+        rewards = np.asarray(rewards, dtype=self.values.dtype)
+        
+        deltas = rewards + self.discount_factor * self.values[next_state_ids] - self.values[state_ids]
+        np.add.at(self.values, state_ids, self.learning_rate * deltas)
+        self.reward_stats.update_many(rewards)
+        self.delta_stats.update_many(deltas)
+        return deltas
+    
+    def predict(self, state: Any) -> float:
+        """Predict value for state"""
+        return self._get_value(state)
+    
+    def predict_batch(self, states: List[Any]) -> np.ndarray:
+        """Predict values for many states, 0 for unseen ones"""
+        if self.int_states:
+            ids = np.asarray(states, dtype=np.intp)
+            if ids.size and ids.min() < 0:
+                raise ValueError(f"int state ids must be non-negative, got {int(ids.min())}")
+            ids = np.where(ids < self._num_states, ids, -1)
+        else:
+            lookup = self.state_ids.get
+            ids = np.fromiter((lookup(self._key(s), -1) for s in states), dtype=np.intp)
+        return np.where(ids >= 0, self.values[ids], 0.0)
+    
+    def intern(self, state: Any) -> int:
+        """Return dense id for state, assigning one if needed"""
+        if self.int_states:
+            state_id = int(state)
+            if state_id < 0:
+                raise ValueError(f"int state ids must be non-negative, got {state_id}")
+            if state_id >= self._num_states:
+                self._reserve(state_id + 1)
+            return state_id
+        
+        key = self._key(state)
+        state_id = self.state_ids.get(key)
+        if state_id is None:
+            state_id = self._num_states
+            self._reserve(state_id + 1)
+            self.state_ids[key] = state_id
+        return state_id
+    
+    def intern_many(self, states: List[Any]) -> np.ndarray:
+        """Return dense ids for a sequence of states"""
+        if self.int_states:
+            ids = np.asarray(states, dtype=np.intp)
+            if ids.size:
+                if ids.min() < 0:
+                    raise ValueError(f"int state ids must be non-negative, got {int(ids.min())}")
+                self._reserve(int(ids.max()) + 1)
+            return ids
+        
+        intern = self.intern
+        return np.fromiter((intern(s) for s in states), dtype=np.intp, count=len(states))
+    
+    def get_state_count(self) -> int:
+        """Get number of known states"""
+        return self._num_states
+    
+    def _get_value(self, state: Any) -> float:
+        """Get value for state"""
+        if self.int_states:
+            state_id = int(state)
+            if state_id < 0:
+                raise ValueError(f"int state ids must be non-negative, got {state_id}")
+            return float(self.values[state_id]) if state_id < self._num_states else 0.0
+        
+        state_id = self.state_ids.get(self._key(state))
+        return 0.0 if state_id is None else float(self.values[state_id])
+    
+    def _reserve(self, num_states: int) -> None:
+        """Extend known states, growing value array geometrically"""
+        if num_states > len(self.values):
+            values = np.zeros(max(num_states, 2 * len(self.values)), dtype=self.values.dtype)
+            values[:len(self.values)] = self.values
+            self.values = values
+        self._num_states = max(self._num_states, num_states)
+    
+    @staticmethod
+    def _key(state: Any) -> Any:
+        """Intern key for state"""
+        try:
+            hash(state)
+            return state
+        except TypeError:
+            return str(state)
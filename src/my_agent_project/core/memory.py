@@ -1,44 +1,127 @@
 """Memory module - Agent memory management"""
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 from collections import deque
+from itertools import islice
+from .records import MemoryEntry
 
 
 class Memory:
     """Agent memory management system"""
     
-    def __init__(self, capacity: int = 1000, memory_type: str = 'fifo'):
+    def __init__(self, capacity: int = 1000, memory_type: str = 'fifo', indexed_keys: Iterable[str] = ('type',)):
         self.capacity = capacity
         self.memory_type = memory_type
         self.storage = deque(maxlen=capacity)
         self.metadata = {}
+        self.indexes = {key: {} for key in indexed_keys}
+        self.next_timestamp = 0
         
     def store(self, data: Any, metadata: Optional[Dict] = None) -> None:
-        """Store data in memory"""
-        entry = {
-            'data': data,
-            'metadata': metadata or {},
-            'timestamp': len(self.storage)
-        }
+        """Store data in memory
+        
+        Indexes read ``metadata`` once, here; mutating the dict afterwards
+        leaves them stale, so store a new entry instead.
+        """
+        entry = MemoryEntry(data, metadata or {}, self.next_timestamp)
+        self.next_timestamp += 1
+        if self.capacity == 0:
+            return
+        if len(self.storage) == self.capacity:
+            self._unindex(self.storage[0])
         self.storage.append(entry)
+        self._index(entry)
         
     def retrieve(self, index: int = -1) -> Any:
         """Retrieve data from memory"""
         if self.storage:
-            return self.storage[index]['data']
+            return self.storage[index].data
         return None
     
     def retrieve_by_type(self, data_type: str) -> List[Any]:
         """Retrieve all data of specific type"""
-        results = []
+        return self.retrieve_by_metadata('type', data_type)
+    
+    def retrieve_by_metadata(self, key: str, value: Any) -> List[Any]:
+        """Retrieve all data whose metadata has ``key == value``
+        
+        Indexed keys cost O(matches); other keys fall back to a scan.
+        """
+        index = self.indexes.get(key)
+        if index is not None and value is not None:
+            try:
+                return [entry.data for entry in index.get(value, ())]
+            except TypeError:
+                pass
+        return [entry.data for entry in self.storage if entry.metadata.get(key) == value]
+    
+    def retrieve_range(self, start: int, end: Optional[int] = None) -> List[Any]:
+        """Retrieve data with ``start <= timestamp < end`` in insertion order
+        
+        Timestamps are consecutive, so the range maps directly to deque
+        positions and is walked from whichever end of the deque is closer.
+        """
+        if not self.storage:
+            return []
+        first = self.storage[0].timestamp
+        low = max(0, start - first)
+        high = len(self.storage) if end is None else min(len(self.storage), max(0, end - first))
+        if low >= high:
+            return []
+        if low < len(self.storage) - high:
+            entries = islice(self.storage, low, high)
+        else:
+            tail = islice(reversed(self.storage), len(self.storage) - high, len(self.storage) - low)
+            entries = reversed(list(tail))
+        return [entry.data for entry in entries]
+    
+    def add_index(self, key: str) -> None:
+        """Start indexing a metadata key, including entries already stored"""
+        if key in self.indexes:
+            return
+        self.indexes[key] = {}
         for entry in self.storage:
-            if entry['metadata'].get('type') == data_type:
-                results.append(entry['data'])
-        return results
+            self._index_entry(key, entry)
+    
+    def _index(self, entry: MemoryEntry) -> None:
+        """Add entry to metadata indexes"""
+        for key in self.indexes:
+            self._index_entry(key, entry)
+    
+    def _index_entry(self, key: str, entry: MemoryEntry) -> None:
+        """Add entry to one metadata index"""
+        value = entry.metadata.get(key)
+        if value is None:
+            return
+        try:
+            bucket = self.indexes[key].get(value)
+        except TypeError:
+            return
+        if bucket is None:
+            bucket = self.indexes[key][value] = deque()
+        bucket.append(entry)
+    
+    def _unindex(self, entry: MemoryEntry) -> None:
+        """Drop evicted entry, always the oldest of its buckets, from indexes"""
+        for key, index in self.indexes.items():
+            value = entry.metadata.get(key)
+            if value is None:
+                continue
+            try:
+                bucket = index.get(value)
+            except TypeError:
+                continue
+            if bucket and bucket[0] is entry:
+                bucket.popleft()
+                if not bucket:
+                    del index[value]
     
     def clear(self) -> None:
         """Clear all memory"""
         self.storage.clear()
+        self.next_timestamp = 0
+        for index in self.indexes.values():
+            index.clear()
         
     def get_capacity_usage(self) -> float:
         """Get memory usage percentage"""
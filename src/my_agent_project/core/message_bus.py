@@ -0,0 +1,175 @@
+"""Message Bus module - In-process publish/subscribe for agent messaging"""
+
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+from collections import deque
+import threading
+
+
+class BackpressureError(Exception):
+    """Raised when a blocking subscriber queue stays full past its timeout"""
+    pass
+
+
+class Message(NamedTuple):
+    """Immutable message shared by every subscriber it is delivered to"""
+    topic: str
+    sender: Any
+    payload: Any
+    seq: int
+
+
+class Subscription:
+    """Bounded ring queue of messages for one subscriber
+    
+    When full, ``drop_oldest`` overwrites the oldest message and counts it
+    in ``dropped``; ``block`` makes the publisher wait up to ``timeout``
+    seconds for the consumer to drain, then raises BackpressureError. The
+    timeout must be finite, since a consumer draining on the publishing
+    thread could otherwise never wake it.
+    """
+    
+    POLICIES = ('drop_oldest', 'block')
+    
+    def __init__(self, subscriber_id: Any, capacity: int = 1024, policy: str = 'drop_oldest',
+                 timeout: Optional[float] = None):
+        if policy not in self.POLICIES:
+            raise ValueError(f"unknown backpressure policy: {policy}")
+        if policy == 'block' and timeout is None:
+            raise ValueError("block policy needs a finite timeout")
+        self.subscriber_id = subscriber_id
+        self.capacity = capacity
+        self.policy = policy
+        self.timeout = timeout
+        self.dropped = 0
+        self.rejected = 0
+        self.delivered = 0
+        self._queue = deque(maxlen=capacity if policy == 'drop_oldest' else None)
+        self._not_full = threading.Condition()
+    
+    def put(self, message: Message) -> None:
+        """Enqueue message, applying the backpressure policy when full"""
+        with self._not_full:
+            if len(self._queue) >= self.capacity:
+                if self.policy == 'drop_oldest':
+                    self.dropped += 1
+                elif not self._not_full.wait_for(lambda: len(self._queue) < self.capacity, self.timeout):
+                    raise BackpressureError(f"queue of {self.subscriber_id} full")
+            self._queue.append(message)
+            self.delivered += 1
+    
+    def drain(self, max_messages: Optional[int] = None) -> List[Message]:
+        """Take queued messages, oldest first"""
+        with self._not_full:
+            if max_messages is None or max_messages >= len(self._queue):
+                batch = list(self._queue)
+                self._queue.clear()
+            else:
+                batch = [self._queue.popleft() for _ in range(max_messages)]
+            self._not_full.notify_all()
+        return batch
+    
+    def __len__(self) -> int:
+        return len(self._queue)
+
+
+class MessageBus:
+    """Topic-based publish/subscribe bus
+    
+    ``publish`` only appends to an outbox; ``flush``, called at step
+    boundaries, fans each message out to the topic's subscribers, handing
+    every one the same Message object. Senders do not receive their own
+    messages. Callables in ``forwarders`` also get each flushed batch,
+    which is how transports carry messages to buses in other processes.
+    
+    A blocking subscriber that stays full is skipped for the rest of the
+    batch, its missed messages counted in ``rejected``, so the other
+    subscribers still get every message; BackpressureError is raised once
+    the batch is done.
+    """
+    
+    def __init__(self, queue_capacity: int = 1024, policy: str = 'drop_oldest',
+                 block_timeout: Optional[float] = 1.0):
+        self.queue_capacity = queue_capacity
+        self.policy = policy
+        self.block_timeout = block_timeout
+        self.topics = {}
+        self.published = 0
+        self.forwarders = []
+        self._outbox = []
+        self._lock = threading.Lock()
+    
+    def subscribe(self, topic: str, subscriber_id: Any, capacity: Optional[int] = None,
+                  policy: Optional[str] = None) -> Subscription:
+        """Subscribe to topic, replacing an earlier subscription of the same id"""
+        subscription = Subscription(subscriber_id, capacity or self.queue_capacity,
+                                    policy or self.policy, self.block_timeout)
+        self.topics.setdefault(topic, {})[subscriber_id] = subscription
+        return subscription
+    
+    def unsubscribe(self, topic: str, subscriber_id: Any) -> None:
+        """Remove subscription"""
+        subscribers = self.topics.get(topic)
+        if subscribers is not None:
+            subscribers.pop(subscriber_id, None)
+            if not subscribers:
+                del self.topics[topic]
+    
+    def publish(self, topic: str, sender: Any, payload: Any) -> Message:
+        """Queue message for delivery at the next flush"""
+        with self._lock:
+            message = Message(topic, sender, payload, self.published)
+            self.published += 1
+            self._outbox.append(message)
+        return message
+    
+    def add_forwarder(self, forwarder: Callable[[List[Message]], None]) -> None:
+        """Register callable receiving every flushed batch"""
+        self.forwarders.append(forwarder)
+    
+    def flush(self) -> int:
+        """Deliver queued messages and return the number of deliveries"""
+        with self._lock:
+            outbox, self._outbox = self._outbox, []
+        if outbox:
+            for forwarder in self.forwarders:
+                forwarder(outbox)
+        return self.deliver(outbox)
+    
+    def deliver(self, messages: List[Message]) -> int:
+        """Fan messages out to local subscribers without forwarding them"""
+        deliveries = 0
+        full = []
+        for message in messages:
+            for subscriber_id, subscription in self.topics.get(message.topic, {}).items():
+                if subscriber_id == message.sender:
+                    continue
+                if subscription in full:
+                    subscription.rejected += 1
+                    continue
+                try:
+                    subscription.put(message)
+                    deliveries += 1
+                except BackpressureError:
+                    subscription.rejected += 1
+                    full.append(subscription)
+        if full:
+            names = ', '.join(str(subscription.subscriber_id) for subscription in full)
+            raise BackpressureError(f"queues full, messages rejected for: {names}")
+        return deliveries
+    
+    def pending(self) -> int:
+        """Messages waiting for the next flush"""
+        return len(self._outbox)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get bus statistics"""
+        subscriptions = [s for subscribers in self.topics.values() for s in subscribers.values()]
+        return {
+            'topics': len(self.topics),
+            'subscriptions': len(subscriptions),
+            'published': self.published,
+            'pending': len(self._outbox),
+            'queued': sum(len(s) for s in subscriptions),
+            'dropped': sum(s.dropped for s in subscriptions),
+            'rejected': sum(s.rejected for s in subscriptions)
+        }
@@ -2,6 +2,8 @@
 
 from typing import Any, Dict, List, Optional
 from abc import ABC, abstractmethod
+from collections import defaultdict
+import heapq
 
 
 class ReasoningEngine(ABC):
@@ -43,3 +45,137 @@ class ForwardChainingEngine(ReasoningEngine):
         """Check if rule conditions are met"""
         conditions = rule.get('conditions', [])
         return all(cond in facts for cond in conditions)
+
+class IncrementalForwardChainingEngine(ReasoningEngine):
+    """Incremental forward chaining engine with a persistent working memory
+
+    Rules are indexed by each of their conditions and carry a count of the
+    conditions still missing, so a rule is only visited when one of its
+    conditions arrives and fires once the last one does. Facts are tagged with
+    the pass in which ForwardChainingEngine would derive them, which keeps the
+    ``max_iterations`` cut-off and therefore the results identical.
+    """
+    
+    def __init__(self, max_iterations: int = 100):
+        self.max_iterations = max_iterations
+        self.conclusions = []
+        self.reset()
+    
+    def reset(self) -> None:
+        """Drop all rules and facts from working memory"""
+        self.rules = []
+        self._rule_conditions = []
+        self._missing = []
+        self._index = defaultdict(list)
+        self._levels = {}
+        self._base_facts = set()
+        self._horizon = self.max_iterations
+        self._loaded = []
+        self._external_rules = False
+        self._agenda = []
+        self._counter = 0
+    
+    def reason(self, facts: List[Any], rules: List[Dict]) -> List[Any]:
+        """Forward chaining that reuses working memory from the previous call
+
+        Passing the same rules again (optionally with rules appended)
+        together with a superset of the previous facts only processes what
+        changed. Each loaded rule is checked by identity and by its
+        conditions and conclusion, so rules replaced, removed or edited in
+        place, retracted facts, or rules added through ``add_rules`` rebuild
+        working memory from scratch.
+        """
+        facts = set(facts)
+        if (self._external_rules
+                or len(rules) < len(self._loaded)
+                or self._horizon != self.max_iterations
+                or not self._base_facts <= facts
+                or any(rule is not seen or self._signature(rule) != signature
+                       for rule, (seen, signature) in zip(rules, self._loaded))):
+            self.reset()
+        
+        new_rules = rules[len(self._loaded):]
+        self._loaded.extend((rule, self._signature(rule)) for rule in new_rules)
+        self._add_rules(new_rules)
+        self.assert_facts(facts - self._base_facts)
+        return self.conclusions
+    
+    @staticmethod
+    def _signature(rule: Dict) -> tuple:
+        """Contents of a rule that affect its firing"""
+        return tuple(rule.get('conditions', [])), rule.get('conclusion')
+    
+    def add_rules(self, rules: List[Dict]) -> List[Any]:
+        """Add rules to working memory and return facts new to it
+        
+        These rules are not part of any ``reason`` rule list, so the next
+        ``reason`` call starts from scratch.
+        """
+        self._external_rules = True
+        return self._add_rules(rules)
+    
+    def _add_rules(self, rules: List[Dict]) -> List[Any]:
+        """Index rules and fire those whose conditions are all known"""
+        for rule in rules:
+            rule_id = len(self.rules)
+            conditions = tuple(dict.fromkeys(rule.get('conditions', [])))
+            self.rules.append(rule)
+            self._rule_conditions.append(conditions)
+            self._missing.append(sum(1 for cond in conditions if cond not in self._levels))
+            for cond in conditions:
+                self._index[cond].append(rule_id)
+            if self._missing[rule_id] == 0:
+                self._fire(rule_id)
+        return self._propagate()
+    
+    def add_rule(self, rule: Dict) -> List[Any]:
+        """Add single rule to working memory"""
+        return self.add_rules([rule])
+    
+    def assert_facts(self, facts: List[Any]) -> List[Any]:
+        """Assert facts into working memory and return facts new to it"""
+        for fact in facts:
+            self._base_facts.add(fact)
+            self._schedule(fact, 0)
+        return self._propagate()
+    
+    def _schedule(self, fact: Any, level: int) -> None:
+        """Queue fact if it lowers its known derivation level"""
+        if level < self._levels.get(fact, level + 1):
+            self._counter += 1
+            heapq.heappush(self._agenda, (level, self._counter, fact))
+    
+    def _fire(self, rule_id: int) -> None:
+        """Schedule conclusion of a rule whose conditions are all known"""
+        conclusion = self.rules[rule_id].get('conclusion')
+        if not conclusion:
+            return
+        levels = self._levels
+        level = 1 + max((levels[cond] for cond in self._rule_conditions[rule_id]), default=0)
+        if level <= self._horizon:
+            self._schedule(conclusion, level)
+    
+    def _propagate(self) -> List[Any]:
+        """Process agenda in derivation order"""
+        derived = []
+        levels = self._levels
+        missing = self._missing
+        while self._agenda:
+            level, _, fact = heapq.heappop(self._agenda)
+            previous = levels.get(fact)
+            if previous is not None and previous <= level:
+                continue
+            levels[fact] = level
+            if previous is None:
+                derived.append(fact)
+                for rule_id in self._index.get(fact, ()):
+                    missing[rule_id] -= 1
+                    if missing[rule_id] == 0:
+                        self._fire(rule_id)
+            else:
+                for rule_id in self._index.get(fact, ()):
+                    if missing[rule_id] == 0:
+                        self._fire(rule_id)
+        
+        self.conclusions = list(levels)
+        return derived
@@ -0,0 +1,128 @@
+"""Records module - Compact slotted records for hot-path messages"""
+
+from typing import Any, Dict
+from collections.abc import Mapping
+
+
+class Record(Mapping):
+    """Fixed-field record with dict-style access
+    
+    Subclasses list their fields in ``__slots__``, so an instance carries
+    no per-instance dict and costs one allocation. Records are read-only
+    mappings over their fields (``record['action']``, ``get``, ``items``,
+    ``dict(record)``, ``copy()``) and compare equal to dicts with the
+    same items; existing fields can be reassigned by key or attribute.
+    They are not ``dict`` instances: serialize them with ``json.dumps(...,
+    default=json_default)`` and test for ``Mapping`` rather than ``dict``.
+    """
+    
+    __slots__ = ()
+    
+    def __getitem__(self, key: str) -> Any:
+        if key in self.__slots__:
+            return getattr(self, key)
+        raise KeyError(key)
+    
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key not in self.__slots__:
+            raise KeyError(key)
+        setattr(self, key, value)
+    
+    def __contains__(self, key: Any) -> bool:
+        return key in self.__slots__
+    
+    def __iter__(self):
+        return iter(self.__slots__)
+    
+    def __len__(self) -> int:
+        return len(self.__slots__)
+    
+    def __reduce__(self):
+        return type(self), tuple(getattr(self, field) for field in self.__slots__)
+    
+    def __repr__(self) -> str:
+        fields = ', '.join(f"{field}={getattr(self, field)!r}" for field in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict copy of the record"""
+        return {field: getattr(self, field) for field in self.__slots__}
+    
+    def copy(self) -> Dict[str, Any]:
+        """Plain dict copy, as ``dict.copy`` returns"""
+        return self.to_dict()
+
+
+def json_default(obj: Any) -> Any:
+    """``default`` hook for ``json.dumps`` that encodes records as objects"""
+    if isinstance(obj, Record):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class Percept(Record):
+    """Observation an agent keeps in memory"""
+    
+    __slots__ = ('type', 'data')
+    
+    def __init__(self, type: str, data: Any):
+        self.type = type
+        self.data = data
+
+
+class Decision(Record):
+    """Decision returned by ``AutonomousAgent.reason``"""
+    
+    __slots__ = ('agent_id', 'independence_score', 'action', 'confidence')
+    
+    def __init__(self, agent_id: str, independence_score: float, action: Any, confidence: float):
+        self.agent_id = agent_id
+        self.independence_score = independence_score
+        self.action = action
+        self.confidence = confidence
+
+
+class ActionResult(Record):
+    """Outcome returned by ``AutonomousAgent.act``"""
+    
+    __slots__ = ('agent_id', 'action_executed', 'status')
+    
+    def __init__(self, agent_id: str, action_executed: Any, status: str = 'success'):
+        self.agent_id = agent_id
+        self.action_executed = action_executed
+        self.status = status
+
+
+class Observation(Record):
+    """Per-agent observation produced by ``EnvironmentSimulator.step``"""
+    
+    __slots__ = ('agent_id', 'action', 'timestep', 'status')
+    
+    def __init__(self, agent_id: str, action: Any, timestep: int, status: str = 'executed'):
+        self.agent_id = agent_id
+        self.action = action
+        self.timestep = timestep
+        self.status = status
+
+
+class MemoryEntry(Record):
+    """Entry held by ``Memory`` storage"""
+    
+    __slots__ = ('data', 'metadata', 'timestamp')
+    
+    def __init__(self, data: Any, metadata: Mapping, timestamp: int):
+        self.data = data
+        self.metadata = metadata
+        self.timestamp = timestamp
+
+
+class Transition(Record):
+    """Training history row of a learning model"""
+    
+    __slots__ = ('state', 'action', 'reward', 'delta')
+    
+    def __init__(self, state: Any, action: Any, reward: float, delta: float):
+        self.state = state
+        self.action = action
+        self.reward = reward
+        self.delta = delta
@@ -0,0 +1,226 @@
+"""Replay Buffer module - Experience replay for off-policy learning"""
+
+from typing import Any, Dict, List, Optional, Tuple
+from collections.abc import Mapping
+import numpy as np
+from .memory import Memory
+
+
+class SumTree:
+    """Binary sum tree over leaf priorities
+
+    Leaves live in the second half of a flat array and every internal node
+    holds the sum of its children, so updates and prefix-sum searches cost
+    O(log N). Both operations are vectorized over batches of leaves.
+    """
+    
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.leaf_count = 1 << max(0, (capacity - 1).bit_length())
+        self.depth = self.leaf_count.bit_length() - 1
+        self.tree = np.zeros(2 * self.leaf_count, dtype=np.float64)
+    
+    def total(self) -> float:
+        """Sum of all priorities"""
+        return float(self.tree[1])
+    
+    def get(self, indices: np.ndarray) -> np.ndarray:
+        """Priorities of leaves"""
+        return self.tree[np.asarray(indices) + self.leaf_count]
+    
+    def update(self, indices: np.ndarray, priorities: np.ndarray) -> None:
+        """Set leaf priorities and refresh their ancestors"""
+        nodes = np.asarray(indices, dtype=np.intp) + self.leaf_count
+        self.tree[nodes] = priorities
+        for _ in range(self.depth):
+            # Duplicate parents just write the same sum twice
+            nodes = nodes // 2
+            self.tree[nodes] = self.tree[2 * nodes] + self.tree[2 * nodes + 1]
+    
+    def find(self, values: np.ndarray) -> np.ndarray:
+        """Leaf index where each prefix-sum value falls"""
+        values = np.array(values, dtype=np.float64)
+        nodes = np.ones(len(values), dtype=np.intp)
+        for _ in range(self.depth):
+            left = 2 * nodes
+            left_sum = self.tree[left]
+            go_right = values > left_sum
+            values -= np.where(go_right, left_sum, 0.0)
+            nodes = left + go_right
+        return nodes - self.leaf_count
+
+
+class ReplayBuffer(Memory):
+    """Fixed-capacity experience replay with uniform sampling
+
+    Transitions are stored column-wise in preallocated NumPy arrays and
+    overwritten oldest-first once the buffer is full. ``sample`` returns
+    contiguous arrays that can be fed straight into
+    ``TabularLearningModel.train_batch``. Transitions carry no metadata or
+    timestamps, so Memory's metadata and range queries raise TypeError
+    rather than answering from the unused ``storage``.
+    """
+    
+    def __init__(self, capacity: int = 100000, state_shape: Tuple[int, ...] = (),
+                 state_dtype: Any = np.int64, action_dtype: Any = np.int64, seed: Optional[int] = None):
+        super().__init__(capacity, memory_type='replay')
+        self.states = np.zeros((capacity,) + tuple(state_shape), dtype=state_dtype)
+        self.next_states = np.zeros_like(self.states)
+        self.actions = np.zeros(capacity, dtype=action_dtype)
+        self.rewards = np.zeros(capacity, dtype=np.float64)
+        self.position = 0
+        self.size = 0
+        self.rng = np.random.default_rng(seed)
+    
+    def add(self, state: Any, action: Any, reward: float, next_state: Any) -> int:
+        """Add single transition and return its slot"""
+        index = self.position
+        self.states[index] = state
+        self.actions[index] = action
+        self.rewards[index] = reward
+        self.next_states[index] = next_state
+        self.position = (index + 1) % self.capacity
+        self.size = min(self.size + 1, self.capacity)
+        self._on_insert(np.array([index]))
+        return index
+    
+    def add_batch(self, states: np.ndarray, actions: np.ndarray, rewards: np.ndarray,
+                  next_states: np.ndarray) -> np.ndarray:
+        """Add transitions in bulk and return their slots"""
+        count = len(rewards)
+        indices = (self.position + np.arange(count)) % self.capacity
+        if count > self.capacity:
+            # Only the newest `capacity` rows survive; write just those
+            keep = slice(count - self.capacity, count)
+            states, actions = np.asarray(states)[keep], np.asarray(actions)[keep]
+            rewards, next_states = np.asarray(rewards)[keep], np.asarray(next_states)[keep]
+            indices = indices[keep]
+        self.states[indices] = states
+        self.actions[indices] = actions
+        self.rewards[indices] = rewards
+        self.next_states[indices] = next_states
+        self.position = (self.position + count) % self.capacity
+        self.size = min(self.size + count, self.capacity)
+        self._on_insert(indices)
+        return indices
+    
+    def store(self, data: Any, metadata: Optional[Dict] = None) -> None:
+        """Store ``(state, action, reward, next_state)`` transition"""
+        if metadata:
+            raise TypeError("replay buffer transitions do not keep metadata")
+        if isinstance(data, Mapping):
+            self.add(data['state'], data['action'], data['reward'], data['next_state'])
+        else:
+            self.add(*data)
+    
+    def retrieve(self, index: int = -1) -> Any:
+        """Retrieve transition by chronological position"""
+        if not self.size:
+            return None
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError("replay buffer index out of range")
+        slot = (self.position - self.size + index) % self.capacity
+        return {
+            'state': self.states[slot],
+            'action': self.actions[slot],
+            'reward': float(self.rewards[slot]),
+            'next_state': self.next_states[slot]
+        }
+    
+    def retrieve_by_metadata(self, key: str, value: Any) -> List[Any]:
+        """Not supported: transitions have no metadata"""
+        raise TypeError("replay buffer does not support metadata queries")
+    
+    def retrieve_range(self, start: int, end: Optional[int] = None) -> List[Any]:
+        """Not supported: transitions have no timestamps"""
+        raise TypeError("replay buffer does not support timestamp range queries")
+    
+    def add_index(self, key: str) -> None:
+        """Not supported: transitions have no metadata"""
+        raise TypeError("replay buffer does not support metadata indexes")
+    
+    def sample(self, batch_size: int) -> Dict[str, np.ndarray]:
+        """Sample transitions uniformly with replacement"""
+        if not self.size:
+            raise ValueError("cannot sample from an empty replay buffer")
+        return self._gather(self.rng.integers(0, self.size, batch_size))
+    
+    def _gather(self, indices: np.ndarray) -> Dict[str, np.ndarray]:
+        """Collect transition columns for slots"""
+        return {
+            'indices': indices,
+            'states': self.states[indices],
+            'actions': self.actions[indices],
+            'rewards': self.rewards[indices],
+            'next_states': self.next_states[indices]
+        }
+    
+    def _on_insert(self, indices: np.ndarray) -> None:
+        """Hook for subclasses tracking per-slot state"""
+        pass
+    
+    def clear(self) -> None:
+        """Clear all transitions"""
+        super().clear()
+        self.position = 0
+        self.size = 0
+    
+    def get_capacity_usage(self) -> float:
+        """Get memory usage percentage"""
+        return (self.size / self.capacity) * 100
+    
+    def get_size(self) -> int:
+        """Get current number of transitions"""
+        return self.size
+
+
+class PrioritizedReplayBuffer(ReplayBuffer):
+    """Replay buffer with proportional prioritized sampling
+
+    Slot priorities live in a SumTree. New transitions get the highest
+    priority seen so far; ``update_priorities`` takes the TD errors returned
+    by a batch update and stores ``(|error| + epsilon) ** alpha``.
+    """
+    
+    def __init__(self, capacity: int = 100000, alpha: float = 0.6, beta: float = 0.4,
+                 epsilon: float = 1e-6, **kwargs):
+        self.tree = SumTree(capacity)
+        self.alpha = alpha
+        self.beta = beta
+        self.epsilon = epsilon
+        self.max_priority = 1.0
+        super().__init__(capacity, **kwargs)
+    
+    def _on_insert(self, indices: np.ndarray) -> None:
+        """Give new transitions maximum priority"""
+        self.tree.update(indices, np.full(len(indices), self.max_priority))
+    
+    def sample(self, batch_size: int, beta: Optional[float] = None) -> Dict[str, np.ndarray]:
+        """Sample proportionally to priority with importance weights"""
+        if not self.size:
+            raise ValueError("cannot sample from an empty replay buffer")
+        beta = self.beta if beta is None else beta
+        total = self.tree.total()
+        segment = total / batch_size
+        values = (np.arange(batch_size) + self.rng.random(batch_size)) * segment
+        indices = np.minimum(self.tree.find(np.minimum(values, total)), self.size - 1)
+        
+        probabilities = self.tree.get(indices) / total
+        weights = (self.size * probabilities) ** -beta
+        batch = self._gather(indices)
+        batch['weights'] = weights / weights.max()
+        return batch
+    
+    def update_priorities(self, indices: np.ndarray, td_errors: np.ndarray) -> None:
+        """Update priorities from TD errors"""
+        priorities = (np.abs(td_errors) + self.epsilon) ** self.alpha
+        self.tree.update(indices, priorities)
+        self.max_priority = max(self.max_priority, float(priorities.max()))
+    
+    def clear(self) -> None:
+        """Clear all transitions and priorities"""
+        super().clear()
+        self.tree.tree[:] = 0
+        self.max_priority = 1.0
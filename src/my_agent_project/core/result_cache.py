@@ -0,0 +1,86 @@
+"""Result Cache module - Memoized results for idempotent tasks"""
+
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+from collections import OrderedDict
+import pickle
+import time
+
+
+class ResultCache:
+    """LRU cache of task results with optional time-to-live
+    
+    Entries are keyed by the action and its arguments, falling back to the
+    pickled arguments when they are unhashable. Hits move an entry to the
+    most recently used end; expired entries are dropped when looked up, and
+    the least recently used entry is evicted once ``max_size`` is reached.
+    """
+    
+    def __init__(self, max_size: int = 1024, ttl: Optional[float] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.collapsed = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+    
+    @staticmethod
+    def make_key(action: Callable, args: tuple = (), kwargs: Optional[Dict] = None) -> Optional[Hashable]:
+        """Cache key for a call, None when its arguments cannot be keyed"""
+        call = (args, tuple(sorted((kwargs or {}).items())))
+        try:
+            hash(call)
+            return action, call
+        except TypeError:
+            pass
+        try:
+            return action, pickle.dumps(call, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            return None
+    
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """Look up key, returning ``(hit, result)``"""
+        entry = self._entries.get(key)
+        if entry is not None:
+            result, expires = entry
+            if expires is None or self.clock() < expires:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, result
+            del self._entries[key]
+        self.misses += 1
+        return False, None
+    
+    def put(self, key: Hashable, result: Any) -> None:
+        """Store result for key"""
+        expires = self.clock() + self.ttl if self.ttl is not None else None
+        self._entries[key] = (result, expires)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+    
+    def invalidate(self, key: Hashable) -> bool:
+        """Drop cached result for key"""
+        return self._entries.pop(key, None) is not None
+    
+    def clear(self) -> None:
+        """Drop all cached results"""
+        self._entries.clear()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self._entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'collapsed': self.collapsed,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
+    
+    def __len__(self) -> int:
+        return len(self._entries)
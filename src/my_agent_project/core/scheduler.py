@@ -0,0 +1,155 @@
+"""Scheduler module - Priority, deadline and dependency-aware task scheduling"""
+
+from typing import Dict, Optional
+from collections import OrderedDict, defaultdict, deque
+from itertools import count
+import heapq
+from .executor import ExecutionStatus, Task
+
+
+class TaskScheduler:
+    """Task scheduler for Executor with DAG dependencies and weighted fairness
+    
+    A task becomes ready once every task id in ``task.dependencies`` has
+    finished with SUCCESS; if a dependency fails or is cancelled, the task
+    (and in turn its dependents) is cancelled. Ready tasks are grouped by
+    ``task.owner``. Owners take turns by stride scheduling on their weights.
+    Inside an owner, ``order='priority'`` runs the highest priority first
+    with the earliest deadline breaking ties, and ``order='deadline'`` runs
+    the earliest deadline first (EDF) with priority breaking ties; tasks
+    without a deadline go last. Push and pop are O(log N).
+    
+    Final statuses are remembered for the last ``max_finished`` completed
+    ids; a task pushed later that depends on an id forgotten by then waits
+    as if that dependency had not run.
+    """
+    
+    ORDERS = ('priority', 'deadline')
+    
+    def __init__(self, weights: Optional[Dict[str, float]] = None, order: str = 'priority',
+                 max_finished: Optional[int] = 10000):
+        if order not in self.ORDERS:
+            raise ValueError(f"unknown order: {order}")
+        self.weights = dict(weights or {})
+        self.order = order
+        self.max_finished = max_finished
+        self.finished = OrderedDict()
+        self._ready = {}
+        self._owners = []
+        self._owner_pass = {}
+        self._virtual_time = 0.0
+        self._waiting = {}
+        self._children = defaultdict(dict)
+        self._doomed = deque()
+        self._counter = count()
+        self._size = 0
+    
+    def set_weight(self, owner: str, weight: float) -> None:
+        """Set fair-share weight of an owner"""
+        self.weights[owner] = weight
+    
+    def push(self, task: Task) -> None:
+        """Queue task, holding it back until its dependencies succeed"""
+        self._size += 1
+        unmet = 0
+        for parent in task.dependencies:
+            status = self.finished.get(parent)
+            if status == ExecutionStatus.SUCCESS:
+                continue
+            if status is not None:
+                self._forget(task)
+                self._doom(task, parent, status)
+                return
+            unmet += 1
+            self._children[parent][id(task)] = task
+        
+        if unmet:
+            self._waiting[id(task)] = unmet
+        else:
+            self._make_ready(task)
+    
+    def pop(self) -> Optional[Task]:
+        """Next task to dispatch, None when nothing is ready"""
+        if self._doomed:
+            self._size -= 1
+            return self._doomed.popleft()
+        if not self._owners:
+            return None
+        
+        owner_pass, _, owner = heapq.heappop(self._owners)
+        heap = self._ready[owner]
+        _, task = heapq.heappop(heap)
+        self._virtual_time = owner_pass
+        self._owner_pass[owner] = owner_pass + 1.0 / self.weights.get(owner, 1.0)
+        if heap:
+            heapq.heappush(self._owners, (self._owner_pass[owner], next(self._counter), owner))
+        else:
+            del self._ready[owner]
+        self._size -= 1
+        return task
+    
+    def complete(self, task: Task) -> None:
+        """Record final status of task and release or cancel its dependents"""
+        self.finished.pop(task.task_id, None)
+        self.finished[task.task_id] = task.status
+        if self.max_finished is not None and len(self.finished) > self.max_finished:
+            self.finished.popitem(last=False)
+        for child in self._children.pop(task.task_id, {}).values():
+            key = id(child)
+            if key not in self._waiting:
+                continue
+            if task.status == ExecutionStatus.SUCCESS:
+                self._waiting[key] -= 1
+                if not self._waiting[key]:
+                    del self._waiting[key]
+                    self._make_ready(child)
+            else:
+                del self._waiting[key]
+                self._forget(child)
+                self._doom(child, task.task_id, task.status)
+    
+    def _make_ready(self, task: Task) -> None:
+        """Move task into its owner's ready heap"""
+        deadline = task.deadline if task.deadline is not None else float('inf')
+        if self.order == 'deadline':
+            entry = ((deadline, -task.priority, next(self._counter)), task)
+        else:
+            entry = ((-task.priority, deadline, next(self._counter)), task)
+        heap = self._ready.get(task.owner)
+        if heap is not None:
+            heapq.heappush(heap, entry)
+            return
+        
+        # An owner returning from idle starts at the current virtual time
+        # rather than cashing in credit for the turns it skipped.
+        self._ready[task.owner] = [entry]
+        owner_pass = max(self._owner_pass.get(task.owner, 0.0), self._virtual_time)
+        self._owner_pass[task.owner] = owner_pass
+        heapq.heappush(self._owners, (owner_pass, next(self._counter), task.owner))
+    
+    def _forget(self, task: Task) -> None:
+        """Drop a task that will never become ready from its parents' child lists"""
+        for parent in task.dependencies:
+            children = self._children.get(parent)
+            if children is not None:
+                children.pop(id(task), None)
+                if not children:
+                    del self._children[parent]
+    
+    def _doom(self, task: Task, parent: str, status: ExecutionStatus) -> None:
+        """Cancel task whose dependency did not succeed
+        
+        The task is still handed out by ``pop`` so the Executor records it as
+        CANCELLED and reports back through ``complete``, cascading the
+        cancellation to its own dependents.
+        """
+        task.error = f"dependency {parent} {status.value}"
+        task.future.cancel()
+        self._doomed.append(task)
+    
+    def get_waiting_count(self) -> int:
+        """Number of tasks blocked on dependencies"""
+        return len(self._waiting)
+    
+    def __len__(self) -> int:
+        return self._size
@@ -0,0 +1,189 @@
+"""Transport module - Cross-process and TCP links between message buses"""
+
+from typing import Iterable, List, Optional, Tuple
+import os
+import pickle
+import select
+import socket
+import struct
+from .message_bus import Message, MessageBus
+
+
+HEADER = struct.Struct('!I')
+MAX_FRAME_BYTES = 64 * 1024 * 1024
+
+
+class SocketTransport:
+    """Framed batches of messages over a connected stream socket
+    
+    Every ``send`` writes one frame: a 4-byte big-endian length followed by
+    the pickled list of messages. Frames are unpickled on receipt, so only
+    connect workers that trust each other.
+    """
+    
+    def __init__(self, sock: socket.socket):
+        self.sock = sock
+        self.closed = False
+        self.frames_sent = 0
+        self.bytes_sent = 0
+        if sock.family in (socket.AF_INET, socket.AF_INET6):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._buffer = bytearray()
+    
+    def send(self, messages: List[Message]) -> None:
+        """Send messages as one frame"""
+        payload = pickle.dumps(list(messages), protocol=pickle.HIGHEST_PROTOCOL)
+        if len(payload) > MAX_FRAME_BYTES:
+            raise ValueError(f"frame of {len(payload)} bytes exceeds {MAX_FRAME_BYTES}")
+        self.sock.sendall(HEADER.pack(len(payload)) + payload)
+        self.frames_sent += 1
+        self.bytes_sent += HEADER.size + len(payload)
+    
+    def recv(self, timeout: Optional[float] = 0.0) -> List[Message]:
+        """Messages from every frame that arrives within timeout
+        
+        ``timeout=None`` waits for at least one frame. Returns an empty list
+        once the peer has closed the connection.
+        """
+        messages = []
+        wait = timeout
+        while not self.closed:
+            frame = self._next_frame()
+            if frame is not None:
+                messages.extend(pickle.loads(frame))
+                wait = 0.0
+                continue
+            readable, _, _ = select.select([self.sock], [], [], wait)
+            if not readable:
+                break
+            chunk = self.sock.recv(1 << 20)
+            if not chunk:
+                self.closed = True
+                break
+            self._buffer += chunk
+        return messages
+    
+    def _next_frame(self) -> Optional[bytes]:
+        """Pop one complete frame from the receive buffer"""
+        if len(self._buffer) < HEADER.size:
+            return None
+        (length,) = HEADER.unpack_from(self._buffer)
+        if length > MAX_FRAME_BYTES:
+            raise ConnectionError(f"frame of {length} bytes exceeds {MAX_FRAME_BYTES}")
+        end = HEADER.size + length
+        if len(self._buffer) < end:
+            return None
+        frame = bytes(self._buffer[HEADER.size:end])
+        del self._buffer[:end]
+        return frame
+    
+    def fileno(self) -> int:
+        return self.sock.fileno()
+    
+    def close(self) -> None:
+        """Close the connection"""
+        self.closed = True
+        self.sock.close()
+    
+    @classmethod
+    def pair(cls) -> Tuple['SocketTransport', 'SocketTransport']:
+        """Connected local pair, for a parent and a forked worker"""
+        left, right = socket.socketpair()
+        return cls(left), cls(right)
+    
+    @classmethod
+    def connect(cls, address: str, port: Optional[int] = None, timeout: float = 10.0) -> 'SocketTransport':
+        """Connect to a TCP listener, or a Unix socket path when no port is given"""
+        if port is None:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(timeout)
+            sock.connect(address)
+        else:
+            sock = socket.create_connection((address, port), timeout=timeout)
+        sock.settimeout(None)
+        return cls(sock)
+
+
+class TransportListener:
+    """Accepts SocketTransport connections over TCP or a Unix socket path"""
+    
+    def __init__(self, address: str = '127.0.0.1', port: Optional[int] = 0, backlog: int = 64):
+        if port is None:
+            if os.path.exists(address):
+                os.unlink(address)
+            self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.sock.bind(address)
+        else:
+            self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            self.sock.bind((address, port))
+        self.sock.listen(backlog)
+        self.address = self.sock.getsockname()
+    
+    def accept(self, timeout: Optional[float] = None) -> SocketTransport:
+        """Wait for the next connection"""
+        self.sock.settimeout(timeout)
+        sock, _ = self.sock.accept()
+        sock.settimeout(None)
+        return SocketTransport(sock)
+    
+    def close(self) -> None:
+        """Stop listening"""
+        path = self.address if self.sock.family == socket.AF_UNIX else None
+        self.sock.close()
+        if path and os.path.exists(path):
+            os.unlink(path)
+
+
+class BusBridge:
+    """Links a local MessageBus to remote buses over transports
+    
+    Each local flush sends the batch, filtered to ``topic_prefixes``, as one
+    frame per transport. ``poll`` delivers frames from remote buses to local
+    subscribers without sending them back out, so bridged buses never echo.
+    Messages are not relayed either: a bus only reaches buses it has a
+    transport to, so every pair of buses that must talk needs a direct
+    link (a full mesh for more than two).
+    """
+    
+    def __init__(self, bus: MessageBus, transports: Iterable[SocketTransport] = (),
+                 topic_prefixes: Tuple[str, ...] = ('',)):
+        self.bus = bus
+        self.transports = list(transports)
+        self.topic_prefixes = tuple(topic_prefixes)
+        self.forwarded = 0
+        self.received = 0
+        bus.add_forwarder(self._forward)
+    
+    def add_transport(self, transport: SocketTransport) -> None:
+        """Start bridging over another transport"""
+        self.transports.append(transport)
+    
+    def _forward(self, messages: List[Message]) -> None:
+        """Send locally flushed messages to every remote bus"""
+        batch = [m for m in messages if m.topic.startswith(self.topic_prefixes)]
+        if not batch:
+            return
+        for transport in self.transports:
+            if not transport.closed:
+                transport.send(batch)
+        self.forwarded += len(batch)
+    
+    def poll(self, timeout: Optional[float] = 0.0) -> int:
+        """Deliver messages that arrived from remote buses"""
+        open_transports = [t for t in self.transports if not t.closed]
+        if not open_transports:
+            return 0
+        if timeout != 0.0:
+            select.select(open_transports, [], [], timeout)
+        messages = []
+        for transport in open_transports:
+            messages.extend(transport.recv(0.0))
+        self.received += len(messages)
+        return self.bus.deliver(messages)
+    
+    def close(self) -> None:
+        """Close all transports"""
+        for transport in self.transports:
+            transport.close()
+        self.transports = []
@@ -0,0 +1,195 @@
+"""Vector Memory module - Embedding-based semantic recall"""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import re
+import zlib
+import numpy as np
+from .memory import Memory
+
+
+class HashingEmbedder:
+    """Deterministic bag-of-words embedder using the hashing trick
+
+    Tokens are hashed with CRC32, which unlike ``hash()`` is stable across
+    processes, into ``dim`` signed buckets. Works offline with no model.
+    """
+    
+    TOKEN_PATTERN = re.compile(r"\w+")
+    
+    def __init__(self, dim: int = 256):
+        self.dim = dim
+    
+    def __call__(self, data: Any) -> np.ndarray:
+        """Embed data as an L2-normalised float32 vector"""
+        vector = np.zeros(self.dim, dtype=np.float32)
+        for token in self.TOKEN_PATTERN.findall(str(data).lower()):
+            code = zlib.crc32(token.encode('utf-8'))
+            vector[code % self.dim] += 1.0 if code & 0x80000000 else -1.0
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+
+class VectorMemory(Memory):
+    """Memory with approximate nearest-neighbour recall over embeddings
+
+    Embeddings live in a contiguous ``(capacity, dim)`` float32 matrix whose
+    rows line up with ring slots, so eviction just overwrites a row.
+    ``recall`` scores the matrix block by block and keeps a running top-k.
+    After ``build_index`` an IVF coarse quantizer narrows recall to the
+    ``n_probe`` closest clusters, keeping it sub-linear for large memories.
+    """
+    
+    def __init__(self, capacity: int = 1000, dim: int = 256,
+                 embedder: Optional[Callable[[Any], np.ndarray]] = None, block_size: int = 65536, **kwargs):
+        super().__init__(capacity, memory_type='vector', **kwargs)
+        self.embedder = embedder or HashingEmbedder(dim)
+        self.dim = getattr(self.embedder, 'dim', dim)
+        self.block_size = block_size
+        self.vectors = np.zeros((capacity, self.dim), dtype=np.float32)
+        self.entries = [None] * capacity
+        self.centroids = None
+        self.assignments = None
+        self.list_slots = None
+        self.list_offsets = None
+        self.pending_slots = []
+        self.pending_count = 0
+    
+    def store(self, data: Any, metadata: Optional[Dict] = None, embedding: Optional[np.ndarray] = None) -> None:
+        """Store data together with its embedding"""
+        if self.capacity == 0:
+            super().store(data, metadata)
+            return
+        slot = self.next_timestamp % self.capacity
+        super().store(data, metadata)
+        vector = np.asarray(self.embedder(data) if embedding is None else embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        self.vectors[slot] = vector / norm if norm else vector
+        self.entries[slot] = self.storage[-1]
+        if self.centroids is not None:
+            self._assign(slot)
+    
+    def recall(self, query: Any, k: int = 5, n_probe: int = 8) -> List[Tuple[Any, float]]:
+        """Return up to ``k`` ``(data, similarity)`` pairs most similar to query
+
+        ``query`` is either a vector or raw data passed through the embedder.
+        """
+        size = len(self.storage)
+        if not size or k <= 0:
+            return []
+        query = self._as_vector(query)
+        
+        if self.centroids is not None:
+            slots = self._probe(query, n_probe)
+            scores = self.vectors[slots] @ query
+            best = self._top_k(scores, k)
+            slots, scores = slots[best], scores[best]
+        else:
+            slots = np.empty(0, dtype=np.intp)
+            scores = np.empty(0, dtype=np.float32)
+            for start in range(0, size, self.block_size):
+                block_scores = self.vectors[start:min(start + self.block_size, size)] @ query
+                best = self._top_k(block_scores, k)
+                slots = np.concatenate([slots, best + start])
+                scores = np.concatenate([scores, block_scores[best]])
+                best = self._top_k(scores, k)
+                slots, scores = slots[best], scores[best]
+        
+        order = np.argsort(-scores, kind='stable')
+        return [(self.entries[slot].data, float(score)) for slot, score in zip(slots[order], scores[order])]
+    
+    def build_index(self, n_lists: int = 256, n_iter: int = 10, sample_size: Optional[int] = None,
+                    seed: int = 0) -> None:
+        """Cluster stored embeddings with spherical k-means for IVF recall
+        
+        Centroids are trained on a sample (64 points per list by default),
+        then every stored embedding is assigned to its nearest centroid.
+        """
+        size = len(self.storage)
+        if not size:
+            return
+        rng = np.random.default_rng(seed)
+        data = self.vectors[:size]
+        sample_size = min(size, sample_size or 64 * n_lists)
+        sample = data[rng.choice(size, sample_size, replace=False)]
+        centroids = sample[:min(n_lists, sample_size)].copy()
+        for _ in range(n_iter):
+            labels = np.argmax(sample @ centroids.T, axis=1)
+            order = np.argsort(labels, kind='stable')
+            present, starts = np.unique(labels[order], return_index=True)
+            sums = np.add.reduceat(sample[order], starts, axis=0)
+            norms = np.linalg.norm(sums, axis=1, keepdims=True)
+            centroids[present] = sums / np.maximum(norms, 1e-12)
+        
+        self.centroids = centroids
+        self.assignments = np.full(self.capacity, -1, dtype=np.intp)
+        for start in range(0, size, self.block_size):
+            block = data[start:start + self.block_size]
+            self.assignments[start:start + len(block)] = np.argmax(block @ centroids.T, axis=1)
+        self._rebuild_lists()
+    
+    def drop_index(self) -> None:
+        """Return to exact blocked recall"""
+        self.centroids = None
+        self.assignments = None
+        self.list_slots = None
+        self.list_offsets = None
+        self.pending_slots = []
+        self.pending_count = 0
+    
+    def clear(self) -> None:
+        """Clear all memory and the IVF index"""
+        super().clear()
+        self.entries = [None] * self.capacity
+        self.drop_index()
+    
+    def _as_vector(self, query: Any) -> np.ndarray:
+        """Normalised query vector"""
+        if isinstance(query, np.ndarray) and query.dtype.kind == 'f':
+            vector = query.astype(np.float32, copy=False)
+        else:
+            vector = np.asarray(self.embedder(query), dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+    
+    def _assign(self, slot: int) -> None:
+        """Move slot to its nearest IVF list"""
+        label = int(np.argmax(self.centroids @ self.vectors[slot]))
+        if label != self.assignments[slot]:
+            self.assignments[slot] = label
+            self.pending_slots[label].append(slot)
+            self.pending_count += 1
+            if self.pending_count > max(1024, len(self.list_slots)):
+                self._rebuild_lists()
+    
+    def _rebuild_lists(self) -> None:
+        """Regroup slots by IVF list and drop pending entries"""
+        size = len(self.storage)
+        self.list_slots = np.argsort(self.assignments[:size], kind='stable')
+        self.list_offsets = np.searchsorted(self.assignments[:size][self.list_slots],
+                                            np.arange(len(self.centroids) + 1))
+        self.pending_slots = [[] for _ in range(len(self.centroids))]
+        self.pending_count = 0
+    
+    def _probe(self, query: np.ndarray, n_probe: int) -> np.ndarray:
+        """Candidate slots from the closest IVF lists
+        
+        Slots inserted after ``build_index`` sit in per-list pending arrays;
+        entries left behind by reassigned slots are filtered out here.
+        """
+        lists = self._top_k(self.centroids @ query, n_probe)
+        parts, labels = [], []
+        for i in lists.tolist():
+            for part in (self.list_slots[self.list_offsets[i]:self.list_offsets[i + 1]],
+                         np.asarray(self.pending_slots[i], dtype=np.intp)):
+                parts.append(part)
+                labels.append(np.full(len(part), i))
+        slots = np.concatenate(parts)
+        slots = slots[self.assignments[slots] == np.concatenate(labels)]
+        return np.unique(slots) if any(self.pending_slots[i] for i in lists.tolist()) else slots
+    
+    @staticmethod
+    def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+        """Indices of the k largest scores, unordered"""
+        if len(scores) <= k:
+            return np.arange(len(scores))
+        return np.argpartition(-scores, k - 1)[:k]
@@ -1,7 +1,8 @@
 """Base Environment module"""
 
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 from abc import ABC, abstractmethod
+from ..utils.registry import Registry
 
 
 class BaseEnvironment(ABC):
@@ -10,7 +11,7 @@ class BaseEnvironment(ABC):
     def __init__(self, env_id: str, size: Tuple[int, int] = (100, 100)):
         self.env_id = env_id
         self.size = size
-        self.agents = []
+        self.agents = Registry()
         self.state = {}
         self.timestep = 0
         
@@ -24,15 +25,13 @@ class BaseEnvironment(ABC):
         """Execute environment step"""
         pass
     
-    def add_agent(self, agent_id: str) -> None:
-        """Add agent to environment"""
-        if agent_id not in self.agents:
-            self.agents.append(agent_id)
+    def add_agent(self, agent_id: str) -> int:
+        """Add agent to environment and return its dense index"""
+        return self.agents.add(agent_id)
     
-    def remove_agent(self, agent_id: str) -> None:
-        """Remove agent from environment"""
-        if agent_id in self.agents:
-            self.agents.remove(agent_id)
+    def remove_agent(self, agent_id: str) -> Optional[int]:
+        """Remove agent from environment, the last agent takes its index"""
+        return self.agents.discard(agent_id)
     
     def get_state(self) -> Dict[str, Any]:
         """Get environment state"""
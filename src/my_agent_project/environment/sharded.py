@@ -0,0 +1,247 @@
+"""Sharded Simulation module - One simulation split across worker processes"""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import multiprocessing as mp
+from multiprocessing import shared_memory
+from threading import BrokenBarrierError
+import zlib
+import numpy as np
+from .simulator import EnvironmentSimulator
+from ..utils.registry import Registry
+
+
+STEP, RESET, CLOSE = 1, 2, 3
+
+
+def shard_of(agent_id: str, num_shards: int) -> int:
+    """Shard owning an agent, stable across processes and runs"""
+    return zlib.crc32(str(agent_id).encode('utf-8')) % num_shards
+
+
+def _default_env(shard: int) -> EnvironmentSimulator:
+    """Simulator for one shard"""
+    return EnvironmentSimulator(f"shard_{shard}")
+
+
+def _shard_layout(env_fn: Callable[[int], EnvironmentSimulator], num_agents: int, num_shards: int,
+                  action_shape: Tuple[int, ...], action_dtype: Any) -> Dict[str, Tuple[tuple, np.dtype]]:
+    """Shape and dtype of every shared array
+    
+    Observation columns with one row per agent span all agents; other
+    observation values, such as the timestep, get one row per shard.
+    """
+    probe = env_fn(0)
+    for agent_id in ('probe_0', 'probe_1'):
+        probe.add_agent(agent_id)
+    probe.reset()
+    actions = np.zeros((2,) + tuple(action_shape), dtype=action_dtype)
+    layout = {
+        'control': ((1,), np.dtype(np.int64)),
+        'actions': ((num_agents,) + actions.shape[1:], actions.dtype),
+        'rewards': ((num_agents,), np.dtype(np.float64)),
+        'returns': ((num_agents,), np.dtype(np.float64)),
+        'dones': ((num_shards,), np.dtype(bool)),
+        'failed': ((num_shards,), np.dtype(bool))
+    }
+    for name, value in probe._execute_actions(actions, np.ones(2, dtype=bool)).items():
+        value = np.asarray(value)
+        if value.ndim and len(value) == 2:
+            layout['agent_obs_' + name] = ((num_agents,) + value.shape[1:], value.dtype)
+        else:
+            layout['shard_obs_' + name] = ((num_shards,) + value.shape, value.dtype)
+    return layout
+
+
+def _attach(layout: Dict[str, Tuple[tuple, np.dtype]], names: Dict[str, str]) -> Tuple[dict, dict]:
+    """Map shared blocks by name into arrays"""
+    blocks = {key: shared_memory.SharedMemory(name=name) for key, name in names.items()}
+    buffers = {key: np.ndarray(shape, dtype=dtype, buffer=blocks[key].buf) for key, (shape, dtype) in layout.items()}
+    return blocks, buffers
+
+
+def _shard_worker(shard: int, env_fn: Callable[[int], EnvironmentSimulator], agent_ids: List[str],
+                  start: int, stop: int, layout: Dict[str, Tuple[tuple, np.dtype]], names: Dict[str, str],
+                  barrier, errors) -> None:
+    """Subprocess loop stepping one shard between two barrier waits per tick
+    
+    A shard whose setup failed keeps answering ticks, reporting the setup
+    error on each, so the parent raises it instead of timing out.
+    """
+    blocks, buffers = _attach(layout, names)
+    try:
+        env = env_fn(shard)
+        for agent_id in agent_ids:
+            env.add_agent(agent_id)
+        env.reset()
+    except Exception as e:
+        env, setup_error = None, e
+    try:
+        while True:
+            barrier.wait()
+            command = int(buffers['control'][0])
+            if command == CLOSE:
+                break
+            try:
+                if env is None:
+                    raise setup_error
+                if command == STEP:
+                    observations, rewards, done = env.step_array(buffers['actions'][start:stop])
+                    for name, value in observations.items():
+                        if 'agent_obs_' + name in buffers:
+                            buffers['agent_obs_' + name][start:stop] = value
+                        else:
+                            buffers['shard_obs_' + name][shard] = value
+                    buffers['rewards'][start:stop] = rewards
+                    buffers['returns'][start:stop] = env.episode_returns
+                    buffers['dones'][shard] = done
+                elif command == RESET:
+                    env.reset()
+                    buffers['returns'][start:stop] = 0.0
+                    buffers['dones'][shard] = False
+            except Exception as e:
+                buffers['failed'][shard] = True
+                errors.put(e)
+            barrier.wait()
+    except BrokenBarrierError:
+        pass
+    finally:
+        del buffers
+        for block in blocks.values():
+            block.close()
+
+
+class ShardedSimulator:
+    """One simulation whose agents are split across worker processes
+    
+    Every agent belongs to the shard ``shard_of(agent_id, num_shards)``,
+    and each shard runs its own simulator from ``env_fn(shard)`` in a
+    worker process. Agents are ordered by shard, so every shard owns a
+    contiguous slice of the shared action, reward and observation arrays.
+    A tick releases all workers through a barrier and waits on it again
+    until every shard has stepped, so shards stay in lockstep and each
+    tick only moves data through shared memory. ``env_fn`` must be
+    picklable when the start method is not fork.
+    """
+    
+    def __init__(self, agent_ids: List[str], num_shards: Optional[int] = None,
+                 env_fn: Callable[[int], EnvironmentSimulator] = _default_env, action_shape: Tuple[int, ...] = (),
+                 action_dtype: Any = np.int64, start_method: Optional[str] = None, timeout: Optional[float] = 60.0):
+        self.num_shards = num_shards or mp.cpu_count()
+        self.timeout = timeout
+        shards = [[] for _ in range(self.num_shards)]
+        for agent_id in agent_ids:
+            shards[shard_of(agent_id, self.num_shards)].append(agent_id)
+        self.agents = Registry(agent_id for shard in shards for agent_id in shard)
+        offsets = np.cumsum([0] + [len(shard) for shard in shards])
+        self.shard_slices = [slice(int(start), int(stop)) for start, stop in zip(offsets[:-1], offsets[1:])]
+        self.timestep = 0
+        self.total_return = 0.0
+        
+        self.layout = _shard_layout(env_fn, len(self.agents), self.num_shards, action_shape, action_dtype)
+        self.blocks = {}
+        self.buffers = {}
+        self.processes = []
+        try:
+            for key, (shape, dtype) in self.layout.items():
+                block = shared_memory.SharedMemory(create=True, size=max(1, int(np.prod(shape)) * dtype.itemsize))
+                self.blocks[key] = block
+                self.buffers[key] = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+                self.buffers[key][...] = 0
+            names = {key: block.name for key, block in self.blocks.items()}
+            
+            context = mp.get_context(start_method)
+            self.barrier = context.Barrier(self.num_shards + 1)
+            self.errors = context.SimpleQueue()
+            for shard, (agents, bounds) in enumerate(zip(shards, self.shard_slices)):
+                process = context.Process(target=_shard_worker, daemon=True, args=(
+                    shard, env_fn, agents, bounds.start, bounds.stop, self.layout, names, self.barrier, self.errors))
+                process.start()
+                self.processes.append(process)
+        except BaseException:
+            for process in self.processes:
+                process.terminate()
+                process.join()
+            self.processes = []
+            self._free_blocks()
+            raise
+    
+    @property
+    def agent_ids(self) -> List[str]:
+        """Agent ids in shard order, the row order of every array"""
+        return self.agents.keys()
+    
+    @property
+    def episode_returns(self) -> np.ndarray:
+        """Per-agent episode returns gathered from every shard"""
+        return self.buffers['returns'].copy()
+    
+    def reset(self) -> Dict[str, Any]:
+        """Reset every shard"""
+        self._tick(RESET)
+        self.timestep = 0
+        self.total_return = 0.0
+        return {'agents': len(self.agents), 'shards': self.num_shards}
+    
+    def step(self, actions: np.ndarray) -> Tuple[Dict[str, np.ndarray], np.ndarray, bool]:
+        """Step all shards one tick with actions in ``agent_ids`` order
+        
+        Returns observation columns, per-agent rewards and whether any
+        shard finished its episode; ``total_return`` sums the rewards of
+        all shards up to this tick.
+        """
+        self.buffers['actions'][:] = actions
+        self._tick(STEP)
+        self.timestep += 1
+        rewards = self.buffers['rewards'].copy()
+        self.total_return += float(rewards.sum())
+        observations = {}
+        for key, value in self.buffers.items():
+            if key.startswith(('agent_obs_', 'shard_obs_')):
+                observations[key[10:]] = value.copy()
+        return observations, rewards, bool(self.buffers['dones'].any())
+    
+    def _tick(self, command: int) -> None:
+        """Run one command on every shard and wait for all of them"""
+        if not self.processes:
+            raise RuntimeError("sharded simulator is closed")
+        self.buffers['control'][0] = command
+        self.barrier.wait(self.timeout)
+        self.barrier.wait(self.timeout)
+        failed = int(self.buffers['failed'].sum())
+        if failed:
+            self.buffers['failed'][:] = False
+            errors = [self.errors.get() for _ in range(failed)]
+            raise errors[0]
+    
+    def close(self) -> None:
+        """Stop workers and free shared memory"""
+        if not self.processes:
+            return
+        self.buffers['control'][0] = CLOSE
+        try:
+            self.barrier.wait(self.timeout)
+        except BrokenBarrierError:
+            pass
+        for process in self.processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+        self._free_blocks()
+        self.processes = []
+    
+    def _free_blocks(self) -> None:
+        """Drop array views, then close and unlink every shared block"""
+        self.buffers = {}
+        for block in self.blocks.values():
+            block.close()
+            block.unlink()
+        self.blocks = {}
+    
+    def __len__(self) -> int:
+        return len(self.agents)
+    
+    def __enter__(self) -> 'ShardedSimulator':
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
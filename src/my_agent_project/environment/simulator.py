@@ -1,18 +1,37 @@
 """Environment Simulator module"""
 
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
 from .base_env import BaseEnvironment
+from ..core.records import Observation
+from .spatial_index import GridIndex, KDTree
 
 
 class EnvironmentSimulator(BaseEnvironment):
-    """Simulated environment for agents"""
+    """Simulated environment for agents
     
-    def __init__(self, env_id: str, size: Tuple[int, int] = (100, 100), timestep_duration: float = 0.1):
+    Every registered agent holds a dense index in the ``agents`` registry and
+    episode returns live in a NumPy array in the same order, so
+    ``step_array`` can step all agents in one vectorized pass. ``step``
+    keeps the dict interface.
+    
+    Resources and obstacles with a ``position`` are spatially indexed:
+    resources, which may move, in a uniform grid and obstacles in a KD-tree
+    rebuilt lazily after additions. A resource's id is its list position.
+    """
+    
+    def __init__(self, env_id: str, size: Tuple[int, int] = (100, 100), timestep_duration: float = 0.1,
+                 max_steps: int = 1000, cell_size: float = 10.0):
         super().__init__(env_id, size)
         self.timestep_duration = timestep_duration
+        self.max_steps = max_steps
         self.resources = []
         self.obstacles = []
-        self.episode_rewards = {}
+        self.resource_index = GridIndex(size, cell_size)
+        self._obstacle_index = None
+        self._obstacle_ids = np.zeros(0, dtype=np.intp)
+        self._obstacle_radii = np.zeros(0)
+        self._returns = np.zeros(16)
         
     def reset(self) -> Dict[str, Any]:
         """Reset environment to initial state"""
@@ -22,7 +41,7 @@ class EnvironmentSimulator(BaseEnvironment):
             'resources': len(self.resources),
             'obstacles': len(self.obstacles)
         }
-        self.episode_rewards = dict.fromkeys(self.agents, 0)
+        self._returns[:] = 0.0
         return self.state
     
     def step(self, actions: Dict[str, Any]) -> Tuple[Dict, Dict, bool]:
@@ -38,32 +57,138 @@ class EnvironmentSimulator(BaseEnvironment):
             
             observations[agent_id] = observation
             rewards[agent_id] = reward
-            self.episode_rewards[agent_id] += reward
+            self._returns[self.agents.index(agent_id)] += reward
         
-        done = self.timestep >= 1000
+        done = self.timestep >= self.max_steps
         
         return observations, rewards, done
     
-    def _execute_action(self, agent_id: str, action: Any) -> Dict[str, Any]:
+    def step_array(self, actions: np.ndarray,
+                   mask: Optional[np.ndarray] = None) -> Tuple[Dict[str, np.ndarray], np.ndarray, bool]:
+        """Execute one simulation step for all agents at once
+        
+        ``actions`` holds one row per agent in ``agents`` index order and
+        ``mask`` marks the agents acting this tick (all by default); idle
+        agents get a zero reward. Returns column observations, a reward
+        array and the done flag.
+        """
+        actions = np.asarray(actions)
+        if len(actions) != len(self.agents):
+            raise ValueError(f"expected actions for {len(self.agents)} agents, got {len(actions)}")
+        self.timestep += 1
+        
+        acting = np.ones(len(actions), dtype=bool) if mask is None else np.asarray(mask, dtype=bool)
+        observations = self._execute_actions(actions, acting)
+        rewards = np.where(acting, self._calculate_rewards(observations), 0.0)
+        self._returns[:len(rewards)] += rewards
+        
+        done = self.timestep >= self.max_steps
+        
+        return observations, rewards, done
+    
+    def _execute_action(self, agent_id: str, action: Any) -> Observation:
         """Execute agent action in environment"""
+        return Observation(agent_id, action, self.timestep)
+    
+    def _execute_actions(self, actions: np.ndarray, acting: np.ndarray) -> Dict[str, np.ndarray]:
+        """Execute actions of all agents, vectorized counterpart of ``_execute_action``"""
         return {
-            'agent_id': agent_id,
-            'action': action,
+            'action': actions,
             'timestep': self.timestep,
-            'status': 'executed'
+            'executed': acting
         }
     
-    def _calculate_reward(self, _agent_id: str, observation: Dict) -> float:
+    def _calculate_reward(self, _agent_id: str, observation: Observation) -> float:
         """Calculate reward for agent"""
         return 0.1 if observation['status'] == 'executed' else -0.1
     
+    def _calculate_rewards(self, observations: Dict[str, np.ndarray]) -> np.ndarray:
+        """Calculate rewards for all agents, vectorized counterpart of ``_calculate_reward``"""
+        return np.where(observations['executed'], 0.1, -0.1)
+    
+    def add_agent(self, agent_id: str) -> int:
+        """Add agent with a zero episode return"""
+        if agent_id in self.agents:
+            return self.agents.index(agent_id)
+        index = super().add_agent(agent_id)
+        if index >= len(self._returns):
+            self._returns = np.concatenate([self._returns, np.zeros(len(self._returns))])
+        self._returns[index] = 0.0
+        return index
+    
+    def remove_agent(self, agent_id: str) -> Optional[int]:
+        """Remove agent, moving the last agent's return into its index"""
+        index = super().remove_agent(agent_id)
+        if index is not None:
+            self._returns[index] = self._returns[len(self.agents)]
+        return index
+    
+    @property
+    def agent_ids(self) -> List[str]:
+        """Agent ids in dense index order"""
+        return self.agents.keys()
+    
+    @property
+    def episode_returns(self) -> np.ndarray:
+        """Cumulative episode returns in dense index order"""
+        return self._returns[:len(self.agents)]
+    
     def add_resource(self, resource: Dict) -> None:
         """Add resource to environment"""
         self.resources.append(resource)
+        if 'position' in resource:
+            self.resource_index.insert(len(self.resources) - 1, resource['position'])
+    
+    def move_resource(self, resource_id: int, position: Tuple[float, float]) -> None:
+        """Move resource and update its index entry"""
+        resource = self.resources[resource_id]
+        if 'position' in resource:
+            self.resource_index.move(resource_id, position)
+        else:
+            self.resource_index.insert(resource_id, position)
+        resource['position'] = position
+    
+    def nearest_resources(self, position: Tuple[float, float], k: int = 1) -> List[Dict]:
+        """Up to k resources closest to position, nearest first"""
+        return [self.resources[i] for i, _ in self.resource_index.nearest(position, k)]
+    
+    def resources_within(self, position: Tuple[float, float], radius: float) -> List[Dict]:
+        """Resources within radius of position"""
+        return [self.resources[i] for i in self.resource_index.query_radius(position, radius)]
     
     def add_obstacle(self, obstacle: Dict) -> None:
         """Add obstacle to environment"""
         self.obstacles.append(obstacle)
+        if 'position' in obstacle:
+            self._obstacle_index = None
+    
+    def obstacles_within(self, position: Tuple[float, float], radius: float = 0.0) -> List[Dict]:
+        """Obstacles whose extent (``radius``, default 0) overlaps a circle"""
+        index = self._obstacles()
+        if not len(index):
+            return []
+        candidates = index.query_radius(position, radius + float(self._obstacle_radii.max()))
+        distances = np.hypot(*(index.data[candidates] - position).T)
+        hits = candidates[distances <= radius + self._obstacle_radii[candidates]]
+        return [self.obstacles[i] for i in self._obstacle_ids[hits].tolist()]
+    
+    def check_collision(self, position: Tuple[float, float], radius: float = 0.0) -> bool:
+        """Whether a circle at position overlaps any obstacle"""
+        return bool(self.obstacles_within(position, radius))
+    
+    def _obstacles(self) -> KDTree:
+        """KD-tree over positioned obstacles, rebuilt after additions"""
+        if self._obstacle_index is None:
+            placed = [i for i, obstacle in enumerate(self.obstacles) if 'position' in obstacle]
+            self._obstacle_ids = np.array(placed, dtype=np.intp)
+            self._obstacle_radii = np.array([self.obstacles[i].get('radius', 0.0) for i in placed], dtype=np.float64)
+            self._obstacle_index = KDTree([self.obstacles[i]['position'] for i in placed])
+        return self._obstacle_index
+    
+    @property
+    def episode_rewards(self) -> Dict[str, float]:
+        """Cumulative episode rewards keyed by agent id"""
+        return dict(zip(self.agents, self.episode_returns.tolist()))
     
     def get_episode_rewards(self) -> Dict[str, float]:
         """Get cumulative episode rewards"""
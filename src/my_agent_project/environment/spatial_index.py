@@ -0,0 +1,277 @@
+"""Spatial Index module - Proximity and collision queries on the 2D map"""
+
+from typing import Iterable, List, Tuple
+import heapq
+import math
+import numpy as np
+
+
+class GridIndex:
+    """Uniform grid for moving point entities with dense integer ids
+    
+    Each cell keeps a set of entity ids and positions live in a growable
+    ``(n, 2)`` array, so insert, move and remove are O(1) and queries only
+    visit cells near the query point.
+    """
+    
+    def __init__(self, size: Tuple[float, float], cell_size: float = 10.0, capacity: int = 1024):
+        self.size = size
+        self.cell_size = float(cell_size)
+        self.cols = max(1, math.ceil(size[0] / cell_size))
+        self.rows = max(1, math.ceil(size[1] / cell_size))
+        self.cells = {}
+        self.positions = np.zeros((capacity, 2))
+        self.cell_of = np.full(capacity, -1, dtype=np.int64)
+        self.count = 0
+    
+    def insert(self, entity_id: int, position: Tuple[float, float]) -> None:
+        """Add entity at position"""
+        self._reserve(entity_id + 1)
+        if self.cell_of[entity_id] >= 0:
+            self.move(entity_id, position)
+            return
+        cell = self._cell(*position)
+        self.positions[entity_id] = position
+        self.cell_of[entity_id] = cell
+        self.cells.setdefault(cell, set()).add(entity_id)
+        self.count += 1
+    
+    def insert_many(self, entity_ids: np.ndarray, positions: np.ndarray) -> None:
+        """Add new entities in bulk"""
+        entity_ids = np.asarray(entity_ids, dtype=np.int64)
+        positions = np.asarray(positions, dtype=np.float64)
+        if not len(entity_ids):
+            return
+        self._reserve(int(entity_ids.max()) + 1)
+        if (self.cell_of[entity_ids] >= 0).any():
+            raise ValueError("insert_many expects entities not already indexed")
+        cells = self._cells(positions)
+        self.positions[entity_ids] = positions
+        self.cell_of[entity_ids] = cells
+        order = np.argsort(cells, kind='stable')
+        present, starts = np.unique(cells[order], return_index=True)
+        for cell, group in zip(present.tolist(), np.split(entity_ids[order], starts[1:])):
+            self.cells.setdefault(cell, set()).update(group.tolist())
+        self.count += len(entity_ids)
+    
+    def move(self, entity_id: int, position: Tuple[float, float]) -> None:
+        """Update position of an indexed entity"""
+        cell = self._cell(*position)
+        old = int(self.cell_of[entity_id])
+        if old < 0:
+            raise KeyError(entity_id)
+        if cell != old:
+            self._discard(old, entity_id)
+            self.cells.setdefault(cell, set()).add(entity_id)
+            self.cell_of[entity_id] = cell
+        self.positions[entity_id] = position
+    
+    def remove(self, entity_id: int) -> None:
+        """Drop entity from the index"""
+        if entity_id >= len(self.cell_of) or self.cell_of[entity_id] < 0:
+            raise KeyError(entity_id)
+        self._discard(int(self.cell_of[entity_id]), entity_id)
+        self.cell_of[entity_id] = -1
+        self.count -= 1
+    
+    def query_radius(self, position: Tuple[float, float], radius: float) -> List[int]:
+        """Ids of entities within radius of position"""
+        x, y = position
+        cx0, cy0 = self._coords(x - radius, y - radius)
+        cx1, cy1 = self._coords(x + radius, y + radius)
+        candidates = []
+        for cy in range(cy0, cy1 + 1):
+            for cx in range(cx0, cx1 + 1):
+                members = self.cells.get(cy * self.cols + cx)
+                if members:
+                    candidates.extend(members)
+        if not candidates:
+            return []
+        candidates = np.array(candidates, dtype=np.int64)
+        offsets = self.positions[candidates] - (x, y)
+        return candidates[np.einsum('ij,ij->i', offsets, offsets) <= radius * radius].tolist()
+    
+    def nearest(self, position: Tuple[float, float], k: int = 1) -> List[Tuple[int, float]]:
+        """Up to k ``(id, distance)`` pairs closest to position
+        
+        Searches rings of cells outward from the query cell and stops once
+        no unvisited ring can hold anything closer than the k-th best.
+        """
+        if not self.count or k <= 0:
+            return []
+        x, y = position
+        cx, cy = self._coords(x, y)
+        ids = np.empty(0, dtype=np.int64)
+        distances = np.empty(0)
+        max_ring = max(cx, cy, self.cols - 1 - cx, self.rows - 1 - cy)
+        for ring in range(max_ring + 1):
+            found = []
+            for cell in self._ring(cx, cy, ring):
+                members = self.cells.get(cell)
+                if members:
+                    found.extend(members)
+            if found:
+                found = np.array(found, dtype=np.int64)
+                ids = np.concatenate([ids, found])
+                distances = np.concatenate([distances, np.hypot(*(self.positions[found] - (x, y)).T)])
+                if len(ids) > k:
+                    keep = np.argpartition(distances, k - 1)[:k]
+                    ids, distances = ids[keep], distances[keep]
+            # Anything beyond this ring is at least ring * cell_size away
+            if len(ids) >= k and distances.max() <= ring * self.cell_size:
+                break
+        order = np.argsort(distances, kind='stable')
+        return list(zip(ids[order].tolist(), distances[order].tolist()))
+    
+    def _ring(self, cx: int, cy: int, ring: int) -> Iterable[int]:
+        """Cells at Chebyshev distance ring from (cx, cy) inside the grid"""
+        if ring == 0:
+            yield cy * self.cols + cx
+            return
+        x0, x1 = max(cx - ring, 0), min(cx + ring, self.cols - 1)
+        for y in (cy - ring, cy + ring):
+            if 0 <= y < self.rows:
+                for x in range(x0, x1 + 1):
+                    yield y * self.cols + x
+        for x in (cx - ring, cx + ring):
+            if 0 <= x < self.cols:
+                for y in range(max(cy - ring + 1, 0), min(cy + ring - 1, self.rows - 1) + 1):
+                    yield y * self.cols + x
+    
+    def _coords(self, x: float, y: float) -> Tuple[int, int]:
+        """Grid column and row of a point, clamped to the map"""
+        cx = min(max(int(x // self.cell_size), 0), self.cols - 1)
+        cy = min(max(int(y // self.cell_size), 0), self.rows - 1)
+        return cx, cy
+    
+    def _cell(self, x: float, y: float) -> int:
+        """Flat cell id of a point"""
+        cx, cy = self._coords(x, y)
+        return cy * self.cols + cx
+    
+    def _cells(self, positions: np.ndarray) -> np.ndarray:
+        """Flat cell ids of many points"""
+        coords = np.floor_divide(positions, self.cell_size).astype(np.int64)
+        cx = np.clip(coords[:, 0], 0, self.cols - 1)
+        cy = np.clip(coords[:, 1], 0, self.rows - 1)
+        return cy * self.cols + cx
+    
+    def _discard(self, cell: int, entity_id: int) -> None:
+        """Remove id from a cell, dropping the cell once empty"""
+        members = self.cells[cell]
+        members.discard(entity_id)
+        if not members:
+            del self.cells[cell]
+    
+    def _reserve(self, size: int) -> None:
+        """Grow position storage to hold ids below size"""
+        capacity = len(self.cell_of)
+        if size <= capacity:
+            return
+        capacity = max(size, 2 * capacity)
+        positions = np.zeros((capacity, 2))
+        positions[:len(self.positions)] = self.positions
+        cell_of = np.full(capacity, -1, dtype=np.int64)
+        cell_of[:len(self.cell_of)] = self.cell_of
+        self.positions, self.cell_of = positions, cell_of
+    
+    def __len__(self) -> int:
+        return self.count
+
+
+class KDTree:
+    """Static 2D KD-tree for entities that never move
+    
+    Points are split on the wider axis at the median until a node holds at
+    most ``leaf_size`` points; leaves are contiguous slices of a reordered
+    point array, so they are scanned with vectorized distance checks.
+    """
+    
+    def __init__(self, points: np.ndarray, leaf_size: int = 32):
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        self.data = points
+        self.leaf_size = leaf_size
+        self.order = np.arange(len(points))
+        self.bounds = []
+        self.children = []
+        self.slices = []
+        if len(points):
+            self._build(points, 0, len(points))
+        self.points = points[self.order]
+    
+    def _build(self, points: np.ndarray, start: int, end: int) -> int:
+        """Build subtree over order[start:end] and return its node id"""
+        node = len(self.bounds)
+        block = points[self.order[start:end]]
+        low, high = block.min(axis=0), block.max(axis=0)
+        self.bounds.append((float(low[0]), float(low[1]), float(high[0]), float(high[1])))
+        self.children.append(None)
+        self.slices.append((start, end))
+        if end - start <= self.leaf_size:
+            return node
+        
+        axis = int(np.argmax(high - low))
+        mid = (end - start) // 2
+        split = np.argpartition(block[:, axis], mid)
+        self.order[start:end] = self.order[start:end][split]
+        self.children[node] = (self._build(points, start, start + mid), self._build(points, start + mid, end))
+        return node
+    
+    def query_radius(self, position: Tuple[float, float], radius: float) -> np.ndarray:
+        """Indices of points within radius of position"""
+        if not self.bounds:
+            return np.empty(0, dtype=np.intp)
+        x, y = position
+        limit = radius * radius
+        parts = []
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            if self._box_distance(node, x, y) > limit:
+                continue
+            children = self.children[node]
+            if children is not None:
+                stack.extend(children)
+                continue
+            start, end = self.slices[node]
+            offsets = self.points[start:end] - (x, y)
+            hits = np.einsum('ij,ij->i', offsets, offsets) <= limit
+            if hits.any():
+                parts.append(self.order[start:end][hits])
+        return np.concatenate(parts) if parts else np.empty(0, dtype=np.intp)
+    
+    def nearest(self, position: Tuple[float, float], k: int = 1) -> List[Tuple[int, float]]:
+        """Up to k ``(index, distance)`` pairs closest to position"""
+        if not self.bounds or k <= 0:
+            return []
+        x, y = position
+        best = []
+        heap = [(0.0, 0)]
+        while heap:
+            box_distance, node = heapq.heappop(heap)
+            if len(best) == k and box_distance > -best[0][0]:
+                break
+            children = self.children[node]
+            if children is not None:
+                for child in children:
+                    heapq.heappush(heap, (self._box_distance(child, x, y), child))
+                continue
+            start, end = self.slices[node]
+            offsets = self.points[start:end] - (x, y)
+            distances = np.einsum('ij,ij->i', offsets, offsets)
+            for index, distance in zip(self.order[start:end].tolist(), distances.tolist()):
+                if len(best) < k:
+                    heapq.heappush(best, (-distance, index))
+                elif distance < -best[0][0]:
+                    heapq.heapreplace(best, (-distance, index))
+        return [(index, math.sqrt(-distance)) for distance, index in sorted(best, reverse=True)]
+    
+    def _box_distance(self, node: int, x: float, y: float) -> float:
+        """Squared distance from point to node bounding box"""
+        x0, y0, x1, y1 = self.bounds[node]
+        dx = x0 - x if x < x0 else (x - x1 if x > x1 else 0.0)
+        dy = y0 - y if y < y0 else (y - y1 if y > y1 else 0.0)
+        return dx * dx + dy * dy
+    
+    def __len__(self) -> int:
+        return len(self.points)
@@ -0,0 +1,227 @@
+"""Vectorized Environment module - Batched stepping of independent simulators"""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import multiprocessing as mp
+from multiprocessing import shared_memory
+import numpy as np
+from .simulator import EnvironmentSimulator
+
+
+def _buffer_layout(env: EnvironmentSimulator, action_shape: Tuple[int, ...],
+                   action_dtype: Any) -> Dict[str, Tuple[tuple, np.dtype]]:
+    """Per-environment shape and dtype of every stacked array"""
+    agents = len(env.agent_ids)
+    actions = np.zeros((agents,) + tuple(action_shape), dtype=action_dtype)
+    layout = {
+        'actions': (actions.shape, actions.dtype),
+        'rewards': ((agents,), np.dtype(np.float64)),
+        'final_returns': ((agents,), np.dtype(np.float64)),
+        'dones': ((), np.dtype(bool))
+    }
+    # Probe the observation hook once to learn the observation columns
+    for name, value in env._execute_actions(actions, np.ones(agents, dtype=bool)).items():
+        value = np.asarray(value)
+        layout['obs_' + name] = (value.shape, value.dtype)
+    return layout
+
+
+def _step_envs(envs: List[EnvironmentSimulator], buffers: Dict[str, np.ndarray], offset: int) -> None:
+    """Step envs on their action rows, resetting any that finish"""
+    for row, env in enumerate(envs, offset):
+        observations, rewards, done = env.step_array(buffers['actions'][row])
+        for name, value in observations.items():
+            buffers['obs_' + name][row] = value
+        buffers['rewards'][row] = rewards
+        buffers['dones'][row] = done
+        if done:
+            buffers['final_returns'][row] = env.episode_returns
+            env.reset()
+        else:
+            buffers['final_returns'][row] = 0.0
+
+
+def _worker(remote, parent_remote, env_fns: List[Callable], offset: int, num_envs: int,
+            layout: Dict[str, Tuple[tuple, np.dtype]], names: Dict[str, str]) -> None:
+    """Subprocess loop stepping a contiguous slice of environments
+    
+    If building the environments fails, the error is sent back as the
+    reply to every command instead of the worker dying silently.
+    """
+    parent_remote.close()
+    blocks = {key: shared_memory.SharedMemory(name=name) for key, name in names.items()}
+    buffers = {key: np.ndarray((num_envs,) + shape, dtype=dtype, buffer=blocks[key].buf)
+               for key, (shape, dtype) in layout.items()}
+    try:
+        envs = [env_fn() for env_fn in env_fns]
+    except Exception as e:
+        envs, setup_error = None, e
+    try:
+        while True:
+            command = remote.recv()
+            if command == 'close':
+                break
+            try:
+                if envs is None:
+                    raise setup_error
+                if command == 'step':
+                    _step_envs(envs, buffers, offset)
+                    remote.send(None)
+                elif command == 'reset':
+                    remote.send([env.reset() for env in envs])
+            except Exception as e:
+                remote.send(e)
+    finally:
+        del buffers
+        for block in blocks.values():
+            block.close()
+        remote.close()
+
+
+class VecEnv:
+    """N independent simulators stepped as one batch in-process
+    
+    ``env_fns`` build simulators with the same registered agents. Actions
+    are stacked as ``(num_envs, agents, ...)`` and every step returns
+    stacked observation columns, rewards and done flags. Environments that
+    finish are reset at once; ``infos['final_returns']`` holds the returns
+    of the episode that just ended.
+    """
+    
+    def __init__(self, env_fns: List[Callable[[], EnvironmentSimulator]],
+                 action_shape: Tuple[int, ...] = (), action_dtype: Any = np.int64):
+        self.num_envs = len(env_fns)
+        self.envs = [env_fn() for env_fn in env_fns]
+        for env in self.envs:
+            env.reset()
+        self.layout = _buffer_layout(self.envs[0], action_shape, action_dtype)
+        self.buffers = {key: np.zeros((self.num_envs,) + shape, dtype=dtype)
+                        for key, (shape, dtype) in self.layout.items()}
+    
+    def reset(self) -> List[Dict[str, Any]]:
+        """Reset every environment"""
+        return [env.reset() for env in self.envs]
+    
+    def step(self, actions: np.ndarray) -> Tuple[Dict[str, np.ndarray], np.ndarray, np.ndarray, Dict[str, np.ndarray]]:
+        """Step every environment with its row of actions"""
+        self.buffers['actions'][:] = actions
+        self._step()
+        return self._results()
+    
+    def _step(self) -> None:
+        """Step environments on the action buffer"""
+        _step_envs(self.envs, self.buffers, 0)
+    
+    def _results(self) -> Tuple[Dict[str, np.ndarray], np.ndarray, np.ndarray, Dict[str, np.ndarray]]:
+        """Copies of the stacked step results"""
+        observations = {key[4:]: value.copy() for key, value in self.buffers.items() if key.startswith('obs_')}
+        infos = {'final_returns': self.buffers['final_returns'].copy()}
+        return observations, self.buffers['rewards'].copy(), self.buffers['dones'].copy(), infos
+    
+    def close(self) -> None:
+        """Release environments"""
+        self.envs = []
+    
+    def __enter__(self) -> 'VecEnv':
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class SubprocVecEnv(VecEnv):
+    """VecEnv whose simulators run in worker processes
+    
+    Environments are split into contiguous slices, one per worker. Actions
+    and results travel through shared-memory arrays, so each step only
+    sends a short command down every pipe. ``env_fns`` must be picklable
+    when the start method is not fork.
+    """
+    
+    def __init__(self, env_fns: List[Callable[[], EnvironmentSimulator]], num_workers: Optional[int] = None,
+                 action_shape: Tuple[int, ...] = (), action_dtype: Any = np.int64, start_method: Optional[str] = None):
+        self.num_envs = len(env_fns)
+        probe = env_fns[0]()
+        probe.reset()
+        self.layout = _buffer_layout(probe, action_shape, action_dtype)
+        
+        self.blocks = {}
+        self.buffers = {}
+        self.remotes = []
+        self.processes = []
+        try:
+            for key, (shape, dtype) in self.layout.items():
+                nbytes = max(1, int(np.prod((self.num_envs,) + shape)) * dtype.itemsize)
+                block = shared_memory.SharedMemory(create=True, size=nbytes)
+                self.blocks[key] = block
+                self.buffers[key] = np.ndarray((self.num_envs,) + shape, dtype=dtype, buffer=block.buf)
+                self.buffers[key][:] = 0
+            names = {key: block.name for key, block in self.blocks.items()}
+            
+            num_workers = min(num_workers or mp.cpu_count(), self.num_envs)
+            bounds = np.linspace(0, self.num_envs, num_workers + 1).astype(int)
+            context = mp.get_context(start_method)
+            for start, stop in zip(bounds[:-1], bounds[1:]):
+                remote, worker_remote = context.Pipe()
+                self.remotes.append(remote)
+                process = context.Process(target=_worker, daemon=True, args=(
+                    worker_remote, remote, env_fns[start:stop], int(start), self.num_envs, self.layout, names))
+                process.start()
+                worker_remote.close()
+                self.processes.append(process)
+            self.reset()
+        except BaseException:
+            for process in self.processes:
+                process.terminate()
+                process.join()
+            for remote in self.remotes:
+                remote.close()
+            self.remotes = []
+            self.processes = []
+            self._free_blocks()
+            raise
+    
+    def reset(self) -> List[Dict[str, Any]]:
+        """Reset every environment"""
+        states = []
+        for part in self._broadcast('reset'):
+            states.extend(part)
+        return states
+    
+    def _step(self) -> None:
+        """Step all worker slices in parallel"""
+        self._broadcast('step')
+    
+    def _broadcast(self, command: str) -> List[Any]:
+        """Send command to every worker and collect replies"""
+        for remote in self.remotes:
+            remote.send(command)
+        replies = [remote.recv() for remote in self.remotes]
+        for reply in replies:
+            if isinstance(reply, Exception):
+                raise reply
+        return replies
+    
+    def close(self) -> None:
+        """Stop workers and free shared memory"""
+        if not self.processes:
+            return
+        for remote in self.remotes:
+            try:
+                remote.send('close')
+            except (BrokenPipeError, OSError):
+                pass
+        for process in self.processes:
+            process.join(timeout=5)
+        for remote in self.remotes:
+            remote.close()
+        self._free_blocks()
+        self.remotes = []
+        self.processes = []
+    
+    def _free_blocks(self) -> None:
+        """Drop array views, then close and unlink every shared block"""
+        self.buffers = {}
+        for block in self.blocks.values():
+            block.close()
+            block.unlink()
+        self.blocks = {}
@@ -0,0 +1,145 @@
+"""Checkpoint module - Snapshot and restore of simulator and agent state"""
+
+from typing import Any, Dict, List
+from pathlib import Path
+import hashlib
+import io
+import json
+import os
+import pickle
+import numpy as np
+
+
+class _SnapshotPickler(pickle.Pickler):
+    """Pickler that moves large numeric arrays out to the array store"""
+    
+    def __init__(self, file, checkpoint: 'Checkpoint', stats: Dict[str, Any]):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.checkpoint = checkpoint
+        self.stats = stats
+    
+    def persistent_id(self, obj: Any) -> Any:
+        if (type(obj) in (np.ndarray, np.memmap) and obj.dtype.kind not in 'OV'
+                and obj.nbytes >= self.checkpoint.min_array_bytes):
+            return self.checkpoint._store_array(obj, self.stats)
+        return None
+
+
+class _SnapshotUnpickler(pickle.Unpickler):
+    """Unpickler that maps stored arrays back in"""
+    
+    def __init__(self, file, checkpoint: 'Checkpoint', lazy: bool):
+        super().__init__(file)
+        self.checkpoint = checkpoint
+        self.lazy = lazy
+        self.loaded = {}
+    
+    def persistent_load(self, pid: Any) -> np.ndarray:
+        # Arrays referenced from several places come back as one object
+        if pid not in self.loaded:
+            self.loaded[pid] = self.checkpoint._load_array(pid, self.lazy)
+        return self.loaded[pid]
+
+
+class Checkpoint:
+    """Directory of named snapshots sharing a content-addressed array store
+    
+    ``save`` pickles any object graph (a simulator, agents, learning
+    models) but writes every NumPy array of at least ``min_array_bytes``
+    to ``arrays/<digest>.npy``. Arrays whose content already sits in the
+    store are not written again, so each snapshot after the first only
+    costs the arrays that changed. ``load`` maps arrays back copy-on-write
+    by default, making restore time independent of array size; pages are
+    read on first touch and writes stay private to the process.
+    """
+    
+    def __init__(self, path: str, min_array_bytes: int = 16384):
+        self.path = Path(path)
+        self.min_array_bytes = min_array_bytes
+        (self.path / 'arrays').mkdir(parents=True, exist_ok=True)
+        (self.path / 'snapshots').mkdir(exist_ok=True)
+    
+    def save(self, name: str, obj: Any) -> Dict[str, Any]:
+        """Write snapshot of obj under name and return write statistics"""
+        stats = {'arrays': [], 'arrays_written': 0, 'arrays_reused': 0, 'bytes_written': 0}
+        buffer = io.BytesIO()
+        _SnapshotPickler(buffer, self, stats).dump(obj)
+        payload = buffer.getvalue()
+        
+        manifest = {'arrays': sorted(set(stats['arrays'])), 'payload_bytes': len(payload)}
+        self._write_atomic(self._snapshot_file(name, '.pkl'), payload)
+        self._write_atomic(self._snapshot_file(name, '.json'), json.dumps(manifest).encode('utf-8'))
+        stats['bytes_written'] += len(payload)
+        del stats['arrays']
+        return stats
+    
+    def load(self, name: str, lazy: bool = True) -> Any:
+        """Restore object graph saved under name
+        
+        With ``lazy`` arrays come back as copy-on-write memory maps,
+        otherwise they are read fully into memory.
+        """
+        with open(self._snapshot_file(name, '.pkl'), 'rb') as f:
+            return _SnapshotUnpickler(f, self, lazy).load()
+    
+    def list_snapshots(self) -> List[str]:
+        """Names of saved snapshots"""
+        return sorted(p.stem for p in (self.path / 'snapshots').glob('*.json'))
+    
+    def delete(self, name: str) -> None:
+        """Delete snapshot; call ``prune`` to reclaim its arrays"""
+        for suffix in ('.pkl', '.json'):
+            self._snapshot_file(name, suffix).unlink(missing_ok=True)
+    
+    def prune(self) -> int:
+        """Remove arrays no snapshot refers to and return how many"""
+        referenced = set()
+        for name in self.list_snapshots():
+            with open(self._snapshot_file(name, '.json')) as f:
+                referenced.update(json.load(f)['arrays'])
+        removed = 0
+        for path in (self.path / 'arrays').glob('*.npy'):
+            if path.stem not in referenced:
+                path.unlink()
+                removed += 1
+        return removed
+    
+    def _store_array(self, array: np.ndarray, stats: Dict[str, Any]) -> str:
+        """Write array unless its content is already stored, return its digest"""
+        array = np.ascontiguousarray(array)
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{array.dtype.str}{array.shape}".encode('ascii'))
+        digest.update(array.reshape(-1).view(np.uint8))
+        key = digest.hexdigest()
+        stats['arrays'].append(key)
+        
+        path = self.path / 'arrays' / f"{key}.npy"
+        if path.exists():
+            stats['arrays_reused'] += 1
+            return key
+        tmp = path.with_suffix('.tmp')
+        with open(tmp, 'wb') as f:
+            np.save(f, array)
+        os.replace(tmp, path)
+        stats['arrays_written'] += 1
+        stats['bytes_written'] += array.nbytes
+        return key
+    
+    def _load_array(self, key: str, lazy: bool) -> np.ndarray:
+        """Read stored array"""
+        path = self.path / 'arrays' / f"{key}.npy"
+        if lazy:
+            return np.load(path, mmap_mode='c')
+        return np.load(path)
+    
+    def _snapshot_file(self, name: str, suffix: str) -> Path:
+        """Path of a snapshot file"""
+        return self.path / 'snapshots' / f"{name}{suffix}"
+    
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes) -> None:
+        """Write file so that a crash never leaves it half written"""
+        tmp = path.with_suffix(path.suffix + '.tmp')
+        with open(tmp, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, path)
@@ -1,24 +1,196 @@
 """Metrics module - Performance metrics collection"""
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Sequence
 from collections import defaultdict
 import time
+import numpy as np
+
+
+class LogHistogram:
+    """Log-bucketed histogram with bounded relative error
+    
+    As in HDR histograms, every power of two is split into ``sub_buckets``
+    linear buckets, so a quantile lands within ``1 / sub_buckets`` of the
+    true value whatever its magnitude. Counts for positive and negative
+    magnitudes live in dense arrays spanning the buckets seen so far,
+    which for finite floats is bounded by the exponent range. Non-finite
+    values are not counted.
+    """
+    
+    def __init__(self, sub_buckets: int = 64):
+        self.sub_buckets = sub_buckets
+        self.scale = 2 * sub_buckets
+        self.counts = [np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)]
+        self.offsets = [0, 0]
+        self.zeros = 0
+        self.count = 0
+    
+    def add_many(self, values: np.ndarray) -> None:
+        """Count a batch of values"""
+        values = np.asarray(values, dtype=np.float64)
+        values = values[np.isfinite(values)]
+        mantissas, exponents = np.frexp(np.abs(values))
+        keys = exponents.astype(np.int64) * self.sub_buckets + ((mantissas - 0.5) * self.scale).astype(np.int64)
+        self._add_keys(0, keys[values > 0])
+        self._add_keys(1, keys[values < 0])
+        self.zeros += int(np.count_nonzero(values == 0))
+        self.count += len(values)
+    
+    def quantiles(self, qs: Sequence[float]) -> List[Optional[float]]:
+        """Values at quantiles ``qs`` (each in [0, 1]) as bucket midpoints"""
+        if not self.count:
+            return [None] * len(qs)
+        keys, counts = self._buckets(1)
+        values = [-self._midpoints(keys[::-1]), [0.0], self._midpoints(self._buckets(0)[0])]
+        counts = np.concatenate([counts[::-1], [self.zeros], self._buckets(0)[1]])
+        ranks = np.maximum(1, np.round(np.asarray(qs) * self.count))
+        positions = np.searchsorted(np.cumsum(counts), ranks)
+        return np.concatenate(values)[np.minimum(positions, len(counts) - 1)].tolist()
+    
+    def merge(self, other: 'LogHistogram') -> None:
+        """Add counts of a histogram with the same ``sub_buckets``"""
+        for side in (0, 1):
+            keys, counts = other._buckets(side)
+            self._add_keys(side, keys, counts)
+        self.zeros += other.zeros
+        self.count += other.count
+    
+    def _add_keys(self, side: int, keys: np.ndarray, weights: Optional[np.ndarray] = None) -> None:
+        """Add bucket keys of one sign, growing its count array to cover them"""
+        if not len(keys):
+            return
+        counts, offset = self.counts[side], self.offsets[side]
+        if not len(counts):
+            offset = int(keys.min())
+        low = min(int(keys.min()), offset)
+        high = max(int(keys.max()), offset + len(counts) - 1)
+        if low < offset or high >= offset + len(counts):
+            grown = np.zeros(high - low + 1, dtype=np.int64)
+            grown[offset - low:offset - low + len(counts)] = counts
+            counts, offset = grown, low
+        added = np.bincount(keys - offset, weights=weights, minlength=len(counts))
+        counts += added.astype(np.int64, copy=False)
+        self.counts[side], self.offsets[side] = counts, offset
+    
+    def _buckets(self, side: int) -> tuple:
+        """Keys and counts of the non-empty buckets of one sign in key order"""
+        counts = self.counts[side]
+        present = np.flatnonzero(counts)
+        return present + self.offsets[side], counts[present]
+    
+    def _midpoints(self, keys: np.ndarray) -> np.ndarray:
+        """Magnitudes at the centre of buckets"""
+        exponents, subs = np.divmod(keys, self.sub_buckets)
+        return np.ldexp(0.5 + (subs + 0.5) / self.scale, exponents.astype(np.int32))
+    
+    def __len__(self) -> int:
+        return sum(int(np.count_nonzero(counts)) for counts in self.counts) + (1 if self.zeros else 0)
+
+
+class MetricSeries:
+    """Constant-memory summary of one metric
+    
+    Count, sum, min, max and latest value are running aggregates, and
+    quantiles come from a ``LogHistogram``. With ``reservoir_size`` a
+    uniform random sample of the raw values is kept by reservoir sampling
+    (Algorithm R), applied a batch at a time.
+    """
+    
+    def __init__(self, sub_buckets: int = 64, reservoir_size: int = 0, rng: Optional[np.random.Generator] = None):
+        self.count = 0
+        self.total = 0.0
+        self.minimum = float('inf')
+        self.maximum = -float('inf')
+        self.latest = None
+        self.histogram = LogHistogram(sub_buckets)
+        self.reservoir_size = reservoir_size
+        self.reservoir = np.empty(reservoir_size)
+        self._rng = rng or np.random.default_rng()
+    
+    def add_many(self, values: List[Any]) -> None:
+        """Fold a batch of samples into the summary"""
+        if not values:
+            return
+        array = np.asarray(values, dtype=np.float64)
+        self.latest = values[-1]
+        self.total += float(array.sum())
+        self.minimum = min(self.minimum, float(array.min()))
+        self.maximum = max(self.maximum, float(array.max()))
+        self.histogram.add_many(array)
+        if self.reservoir_size:
+            self._sample(array)
+        self.count += len(array)
+    
+    def _sample(self, values: np.ndarray) -> None:
+        """Algorithm R over a batch: sample ``n`` replaces a random slot with probability size / n"""
+        fill = max(0, min(len(values), self.reservoir_size - self.count))
+        self.reservoir[self.count:self.count + fill] = values[:fill]
+        rest = values[fill:]
+        if len(rest):
+            seen = self.count + fill + np.arange(1, len(rest) + 1)
+            slots = (self._rng.random(len(rest)) * seen).astype(np.int64)
+            keep = slots < self.reservoir_size
+            self.reservoir[slots[keep]] = rest[keep]
+    
+    def samples(self) -> List[float]:
+        """Current reservoir contents"""
+        return self.reservoir[:min(self.count, self.reservoir_size)].tolist()
+    
+    def quantiles(self, qs: Sequence[float]) -> List[Optional[float]]:
+        """Histogram quantiles clamped to the observed range"""
+        return [value if value is None else min(max(value, self.minimum), self.maximum)
+                for value in self.histogram.quantiles(qs)]
 
 
 class Metrics:
-    """Metrics collection and tracking"""
+    """Metrics collection and tracking
+    
+    ``record`` only appends to a per-metric buffer; every ``batch_size``
+    samples, or when stats are read, the buffer is folded into the
+    metric's ``MetricSeries`` with NumPy. Memory stays constant however
+    many values are recorded. Values must be finite real numbers; others
+    are rejected by ``record`` before they reach the buffer.
+    """
+    
+    PERCENTILES = (0.5, 0.95, 0.99)
     
-    def __init__(self):
-        self._metrics = defaultdict(list)
+    def __init__(self, sub_buckets: int = 64, reservoir_size: int = 0, batch_size: int = 1024,
+                 seed: Optional[int] = None):
+        self.sub_buckets = sub_buckets
+        self.reservoir_size = reservoir_size
+        self.batch_size = batch_size
+        self.series = {}
         self.counters = defaultdict(int)
         self.timers = {}
-        
+        self._buffers = {}
+        self._rng = np.random.default_rng(seed)
+    
     def record(self, metric_name: str, value: Any) -> None:
         """Record metric value"""
-        self._metrics[metric_name].append({
-            'value': value,
-            'timestamp': time.time()
-        })
+        try:
+            number = value + 0.0
+        except TypeError:
+            raise TypeError(f"metric {metric_name!r} needs a real number, got {type(value).__name__}") from None
+        if number - number != 0.0:
+            raise ValueError(f"metric {metric_name!r} needs a finite value, got {value!r}")
+        buffer = self._buffers.get(metric_name)
+        if buffer is None:
+            buffer = self._buffers[metric_name] = []
+            self.series[metric_name] = MetricSeries(self.sub_buckets, self.reservoir_size, self._rng)
+        buffer.append(value)
+        if len(buffer) >= self.batch_size:
+            self._fold(metric_name)
+    
+    def _fold(self, metric_name: str) -> Optional[MetricSeries]:
+        """Fold buffered samples of a metric into its series"""
+        series = self.series.get(metric_name)
+        if series is not None:
+            buffer = self._buffers[metric_name]
+            try:
+                series.add_many(buffer)
+            finally:
+                buffer.clear()
+        return series
     
     def increment_counter(self, counter_name: str, amount: int = 1) -> None:
         """Increment counter"""
@@ -26,36 +198,51 @@ class Metrics:
     
     def start_timer(self, timer_name: str) -> None:
         """Start timer"""
-        self.timers[timer_name] = time.time()
+        self.timers[timer_name] = time.perf_counter()
     
     def stop_timer(self, timer_name: str) -> float:
         """Stop timer and return elapsed time"""
         if timer_name in self.timers:
-            elapsed = time.time() - self.timers[timer_name]
+            elapsed = time.perf_counter() - self.timers[timer_name]
             self.record(f"{timer_name}_duration", elapsed)
             del self.timers[timer_name]
             return elapsed
         return 0.0
     
+    def get_percentile(self, metric_name: str, percentile: float) -> Optional[float]:
+        """Approximate value at ``percentile`` (0-100) of a metric"""
+        series = self._fold(metric_name)
+        if series is None:
+            return None
+        return series.quantiles([percentile / 100])[0]
+    
+    def get_samples(self, metric_name: str) -> List[Any]:
+        """Reservoir sample of a metric's raw values"""
+        series = self._fold(metric_name)
+        return series.samples() if series is not None else []
+    
     def get_metric_stats(self, metric_name: str) -> Dict[str, Any]:
         """Get statistics for metric"""
-        if metric_name not in self._metrics or not self._metrics[metric_name]:
+        series = self._fold(metric_name)
+        if series is None or not series.count:
             return {}
         
-        values = [m['value'] for m in self._metrics[metric_name]]
-        
+        p50, p95, p99 = series.quantiles(self.PERCENTILES)
         return {
-            'count': len(values),
-            'min': min(values),
-            'max': max(values),
-            'avg': sum(values) / len(values),
-            'latest': values[-1]
+            'count': series.count,
+            'min': series.minimum,
+            'max': series.maximum,
+            'avg': series.total / series.count,
+            'latest': series.latest,
+            'p50': p50,
+            'p95': p95,
+            'p99': p99
         }
     
     def get_all_metrics(self) -> Dict[str, Any]:
         """Get all metrics summary"""
         return {
-            'metrics': {k: self.get_metric_stats(k) for k in self._metrics},
+            'metrics': {k: self.get_metric_stats(k) for k in self.series},
             'counters': dict(self.counters),
             'active_timers': list(self.timers.keys())
         }
@@ -0,0 +1,73 @@
+"""Registry module - Hash-backed id registry with dense indices"""
+
+from typing import Hashable, Iterable, List, Optional
+
+
+class Registry:
+    """Set of ids, each holding a dense index in ``range(len(registry))``
+    
+    Ids iterate in index order, which is insertion order until a removal.
+    Removal is an O(1) swap-delete: the last id moves into the vacated
+    index, which ``remove`` returns so array-backed consumers can move the
+    matching row with ``rows[index] = rows[len(registry)]``.
+    """
+    
+    def __init__(self, keys: Iterable[Hashable] = ()):
+        self._keys = []
+        self._index = {}
+        for key in keys:
+            self.add(key)
+    
+    def add(self, key: Hashable) -> int:
+        """Register id if new and return its index"""
+        index = self._index.get(key)
+        if index is None:
+            index = len(self._keys)
+            self._index[key] = index
+            self._keys.append(key)
+        return index
+    
+    def remove(self, key: Hashable) -> int:
+        """Unregister id and return the index it vacated"""
+        index = self._index.pop(key)
+        last = self._keys.pop()
+        if index < len(self._keys):
+            self._keys[index] = last
+            self._index[last] = index
+        return index
+    
+    def discard(self, key: Hashable) -> Optional[int]:
+        """Unregister id if present"""
+        return self.remove(key) if key in self._index else None
+    
+    def index(self, key: Hashable) -> int:
+        """Dense index of id"""
+        return self._index[key]
+    
+    def get(self, key: Hashable, default: Optional[int] = None) -> Optional[int]:
+        """Dense index of id, or default"""
+        return self._index.get(key, default)
+    
+    def keys(self) -> List[Hashable]:
+        """Ids in index order"""
+        return list(self._keys)
+    
+    def clear(self) -> None:
+        """Unregister all ids"""
+        self._keys.clear()
+        self._index.clear()
+    
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._index
+    
+    def __getitem__(self, index: int) -> Hashable:
+        return self._keys[index]
+    
+    def __len__(self) -> int:
+        return len(self._keys)
+    
+    def __iter__(self):
+        return iter(self._keys)
+    
+    def __repr__(self) -> str:
+        return f"Registry({self._keys!r})"
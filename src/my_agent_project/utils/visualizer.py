@@ -2,6 +2,7 @@
 
 from typing import Dict, List, Any, Optional
 import json
+from ..core.records import json_default
 
 
 class Visualizer:
@@ -10,7 +11,7 @@ class Visualizer:
     @staticmethod
     def format_agent_state(agent_state: Dict[str, Any]) -> str:
         """Format agent state for visualization"""
-        return json.dumps(agent_state, indent=2)
+        return json.dumps(agent_state, indent=2, default=json_default)
     
     @staticmethod
     def create_metrics_report(metrics: Dict[str, Any]) -> str:
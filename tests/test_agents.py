@@ -1,7 +1,13 @@
 """Test agents module"""
 
 import unittest
+import numpy as np
 from src.my_agent_project.agents.autonomous_agent import AutonomousAgent
+from src.my_agent_project.agents.collaborative_agent import CollaborativeAgent
+from src.my_agent_project.agents.population import Population
+from src.my_agent_project.agents.reasoning_agent import ReasoningAgent
+from src.my_agent_project.core.message_bus import MessageBus
+from src.my_agent_project.utils.registry import Registry
 
 
 class TestAutonomousAgent(unittest.TestCase):
@@ -16,6 +22,136 @@ class TestAutonomousAgent(unittest.TestCase):
     def test_goal_setting(self):
         self.agent.set_goal("test_goal")
         self.assertEqual(self.agent.goal, "test_goal")
+    
+    def test_memory_eviction_and_view(self):
+        agent = AutonomousAgent("autonomous_2", memory_size=3)
+        for step in range(5):
+            agent.perceive(step)
+        
+        memory = agent.get_memory()
+        self.assertEqual([m['data'] for m in memory], [2, 3, 4])
+        self.assertEqual(memory[-1]['data'], 4)
+        with self.assertRaises(TypeError):
+            memory[0] = {}
+        
+        snapshot = agent.snapshot_memory()
+        agent.perceive(5)
+        self.assertEqual(snapshot[0]['data'], 2)
+        self.assertEqual(memory[0]['data'], 3)
+    
+    def test_semantic_recall(self):
+        self.agent.perceive("enemy spotted near the river")
+        self.agent.enable_semantic_recall()
+        self.agent.perceive("supplies found in the cave")
+        recalled = self.agent.recall("river enemy", k=1)
+        self.assertEqual(recalled[0][0]['data'], "enemy spotted near the river")
+
+
+class TestCollaborativeAgent(unittest.TestCase):
+    """Test collaborative agent"""
+    
+    def test_team_membership(self):
+        agent = CollaborativeAgent("collab_1", team_size=3)
+        for member_id in ["a", "b", "a", "c"]:
+            agent.add_team_member(member_id)
+        agent.remove_team_member("a")
+        agent.remove_team_member("missing")
+        
+        self.assertEqual(list(agent.team_members), ["c", "b"])
+        self.assertEqual(agent.get_team_status()['team_size'], 2)
+        self.assertEqual(agent.memory[-1], {'type': 'team_member_removed', 'member_id': 'a'})
+    
+    def test_registry_swap_delete(self):
+        registry = Registry(["a", "b", "c", "d"])
+        self.assertEqual(registry.remove("b"), 1)
+        self.assertEqual((registry[1], registry.index("d")), ("d", 1))
+        self.assertEqual(registry.remove("c"), 2)
+        self.assertEqual(registry.keys(), ["a", "d"])
+        self.assertIsNone(registry.discard("b"))
+
+
+class TestPopulation(unittest.TestCase):
+    """Test batched population runner against per-agent calls"""
+    
+    def check_matches_loop(self, make_agent, steps=3, shared=False):
+        looped = [make_agent(i) for i in range(4)]
+        batched = [make_agent(i) for i in range(4)]
+        population = Population(batched)
+        for step in range(steps):
+            observations = [f"obs {step}"] * 4 if shared else [f"obs {step} {i}" for i in range(4)]
+            expected = []
+            for agent, observation in zip(looped, observations):
+                agent.perceive(observation)
+                decision = agent.reason()
+                expected.append((decision, agent.act(decision.get('action'))))
+            population.step(observations[0] if shared else observations)
+            for i, (decision, result) in enumerate(expected):
+                self.assertEqual(population.decision(i), decision)
+                self.assertEqual(population.result(i), result)
+        
+        self.assertEqual(population.pending_phases(), steps * (2 if isinstance(batched[0], ReasoningAgent) else 1))
+        population.sync()
+        for agent, reference in zip(batched, looped):
+            self.assertEqual(list(agent.memory), list(reference.memory))
+            self.assertEqual(agent.state, reference.state)
+            for name in ('facts', 'inference_results', 'communication_log', 'messages_sent'):
+                if hasattr(reference, name):
+                    self.assertEqual(getattr(agent, name), getattr(reference, name), name)
+    
+    def test_autonomous(self):
+        self.check_matches_loop(lambda i: AutonomousAgent(f"a{i}", independence_level=i / 4))
+    
+    def test_collaborative(self):
+        def make_agent(i):
+            agent = CollaborativeAgent(f"c{i}", team_size=3)
+            for member in range(i):
+                agent.add_team_member(f"m{member}")
+            return agent
+        self.check_matches_loop(make_agent)
+    
+    def test_reasoning(self):
+        self.check_matches_loop(lambda i: ReasoningAgent(f"r{i}", reasoning_depth=i))
+    
+    def test_sync_keeps_only_bounded_entries(self):
+        self.check_matches_loop(lambda i: CollaborativeAgent(f"c{i}", memory_size=2), steps=5, shared=True)
+        self.check_matches_loop(lambda i: ReasoningAgent(f"r{i}", reasoning_depth=2, memory_size=3), steps=5)
+    
+    def test_sync_replays_agents_with_recall_or_bus(self):
+        def make_agent(i):
+            agent = CollaborativeAgent(f"c{i}")
+            if i == 1:
+                agent.enable_semantic_recall()
+            if i == 2:
+                agent.join_team(MessageBus(), "red")
+            return agent
+        self.check_matches_loop(make_agent)
+    
+    def test_rejects_mixed_classes_and_subclasses(self):
+        class Overriding(AutonomousAgent):
+            def reason(self):
+                return {'action': 'custom'}
+        
+        with self.assertRaises(TypeError):
+            Population([AutonomousAgent("a"), ReasoningAgent("r")])
+        with self.assertRaises(TypeError):
+            Population([Overriding("o")])
+    
+    def test_auto_sync_and_live_counters(self):
+        agents = [CollaborativeAgent(f"c{i}") for i in range(3)]
+        population = Population(agents, max_pending=4)
+        for step in range(3):
+            population.step(f"obs {step}")
+        self.assertEqual(population.pending_phases(), 3)
+        np.testing.assert_array_equal(population.counter('messages_sent'), [3, 3, 3])
+        self.assertEqual(agents[0].messages_sent, 0)
+        
+        agents[1].share_knowledge('goal', 'north')
+        population.step("obs 3")
+        self.assertEqual(population.pending_phases(), 0)
+        self.assertEqual([a.messages_sent for a in agents], [4, 4, 4])
+        np.testing.assert_array_equal(population.counter('messages_sent'), [4, 4, 4])
+        self.assertEqual(population.decision(1)['shared_knowledge_items'], 1)
+        self.assertEqual(population.decision(0)['shared_knowledge_items'], 0)
 
 
 if __name__ == '__main__':
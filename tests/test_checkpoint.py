@@ -0,0 +1,79 @@
+"""Test checkpoint module"""
+
+import tempfile
+import unittest
+import numpy as np
+from src.my_agent_project.agents.reasoning_agent import ReasoningAgent
+from src.my_agent_project.core.learning import TabularLearningModel
+from src.my_agent_project.environment.simulator import EnvironmentSimulator
+from src.my_agent_project.utils.checkpoint import Checkpoint
+
+
+class TestCheckpoint(unittest.TestCase):
+    """Test snapshot and restore"""
+    
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.checkpoint = Checkpoint(self.tmp.name, min_array_bytes=1024)
+    
+    def tearDown(self):
+        self.tmp.cleanup()
+    
+    def make_world(self):
+        env = EnvironmentSimulator("world", max_steps=50)
+        for i in range(300):
+            env.add_agent(f"agent_{i}")
+        env.reset()
+        env.add_resource({'name': 'food', 'position': (3.0, 4.0)})
+        env.add_obstacle({'name': 'rock', 'position': (9.0, 9.0), 'radius': 1.0})
+        env.step_array(np.zeros(300))
+        
+        agent = ReasoningAgent("reasoner", memory_size=10)
+        agent.perceive("sky is blue")
+        agent.add_rule({'if': 'sky is blue', 'then': 'weather is clear'})
+        model = TabularLearningModel(initial_capacity=512)
+        model.train_batch(list(range(200)), None, np.ones(200), list(range(1, 201)))
+        return {'env': env, 'agent': agent, 'model': model}
+    
+    def test_round_trip(self):
+        world = self.make_world()
+        self.checkpoint.save('t1', world)
+        
+        for lazy in (True, False):
+            restored = self.checkpoint.load('t1', lazy=lazy)
+            env, agent, model = restored['env'], restored['agent'], restored['model']
+            self.assertEqual(env.timestep, 1)
+            self.assertEqual(env.get_episode_rewards(), world['env'].get_episode_rewards())
+            self.assertEqual(env.nearest_resources((0.0, 0.0))[0]['name'], 'food')
+            self.assertTrue(env.check_collision((9.5, 9.5)))
+            self.assertEqual(list(agent.memory), list(world['agent'].memory))
+            self.assertEqual((agent.facts, agent.rules), (world['agent'].facts, world['agent'].rules))
+            self.assertEqual(model.predict(7), world['model'].predict(7))
+            self.assertEqual(isinstance(model.values, np.memmap), lazy)
+            
+            env.step_array(np.zeros(300))
+            self.assertEqual(env.timestep, 2)
+    
+    def test_delta_snapshots_and_prune(self):
+        world = self.make_world()
+        first = self.checkpoint.save('t1', world)
+        self.assertGreater(first['arrays_written'], 0)
+        
+        world['agent'].perceive("grass is green")
+        second = self.checkpoint.save('t2', world)
+        self.assertEqual(second['arrays_written'], 0)
+        self.assertEqual(second['arrays_reused'], first['arrays_written'])
+        
+        world['model'].train(7, None, 1.0, 8)
+        third = self.checkpoint.save('t3', world)
+        self.assertEqual(third['arrays_written'], 1)
+        
+        self.checkpoint.delete('t1')
+        self.checkpoint.delete('t2')
+        self.assertEqual(self.checkpoint.prune(), 1)
+        self.assertEqual(self.checkpoint.list_snapshots(), ['t3'])
+        self.assertEqual(self.checkpoint.load('t3')['agent'].facts, ["sky is blue", "grass is green"])
+
+
+if __name__ == '__main__':
+    unittest.main()
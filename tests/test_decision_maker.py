@@ -0,0 +1,50 @@
+"""Test decision maker module"""
+
+import unittest
+import numpy as np
+from src.my_agent_project.core.decision_maker import DecisionMaker
+
+
+class TestDecisionMaker(unittest.TestCase):
+    """Test decision maker"""
+    
+    def setUp(self):
+        self.scores = np.array([[0.1, 0.9, 0.5], [0.8, 0.2, 0.8]])
+        self.probabilities = np.array([[0.9, 0.1, 0.9], [0.0, 1.0, 0.5]])
+    
+    def test_greedy_batch_matches_decide(self):
+        maker = DecisionMaker('greedy')
+        choices = maker.decide_batch(self.scores)
+        for row, choice in zip(self.scores, choices):
+            options = [{'action': i, 'score': s} for i, s in enumerate(row)]
+            self.assertEqual(maker.decide(options)['decision'], choice)
+    
+    def test_utility_batch_matches_decide(self):
+        maker = DecisionMaker('utility')
+        choices = maker.decide_batch(self.scores, self.probabilities)
+        for scores, probabilities, choice in zip(self.scores, self.probabilities, choices):
+            options = [
+                {'action': i, 'score': s, 'probability': p}
+                for i, (s, p) in enumerate(zip(scores, probabilities))
+            ]
+            self.assertEqual(maker.decide(options)['decision'], choice)
+    
+    def test_structured_array_and_mask(self):
+        options = np.zeros((2, 3), dtype=[('score', 'f8'), ('probability', 'f8')])
+        options['score'] = self.scores
+        options['probability'] = self.probabilities
+        mask = np.array([[True, False, True], [False, False, False]])
+        
+        choices = DecisionMaker('utility').decide_batch(options, mask=mask)
+        self.assertEqual(choices.tolist(), [2, -1])
+    
+    def test_random_batch_respects_mask(self):
+        maker = DecisionMaker('random', seed=0)
+        mask = np.zeros((100, 4), dtype=bool)
+        mask[:, 1] = True
+        self.assertTrue(np.all(maker.decide_batch(np.zeros((100, 4)), mask=mask) == 1))
+        self.assertEqual(maker.get_decision_metrics()['total_decisions'], 100)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,20 @@
 """Test environment module"""
 
+import multiprocessing as mp
+import os
 import unittest
+import numpy as np
+from src.my_agent_project.environment.sharded import ShardedSimulator, shard_of
 from src.my_agent_project.environment.simulator import EnvironmentSimulator
+from src.my_agent_project.environment.spatial_index import GridIndex, KDTree
+from src.my_agent_project.environment.vec_env import SubprocVecEnv, VecEnv
+
+
+def make_env(max_steps=3):
+    env = EnvironmentSimulator("vec_env", max_steps=max_steps)
+    for agent_id in ["a", "b"]:
+        env.add_agent(agent_id)
+    return env
 
 
 class TestEnvironmentSimulator(unittest.TestCase):
@@ -19,6 +32,171 @@ class TestEnvironmentSimulator(unittest.TestCase):
         state = self.env.reset()
         self.assertEqual(state['agents'], 1)
         self.assertEqual(self.env.timestep, 0)
+    
+    def test_step_array_matches_step(self):
+        for agent_id in ["a", "b", "c"]:
+            self.env.add_agent(agent_id)
+        self.env.reset()
+        self.env.step({"a": 1, "c": 2})
+        expected = self.env.get_episode_rewards()
+        
+        self.env.reset()
+        observations, rewards, done = self.env.step_array(np.array([1, 0, 2]), mask=[True, False, True])
+        np.testing.assert_allclose(rewards, [0.1, 0.0, 0.1])
+        self.assertEqual(self.env.get_episode_rewards(), expected)
+        self.assertEqual(observations['timestep'], 1)
+        self.assertFalse(done)
+        with self.assertRaises(ValueError):
+            self.env.step_array(np.zeros(2))
+    
+    def test_agent_churn_keeps_returns_aligned(self):
+        for agent_id in ["a", "b", "c"]:
+            self.env.add_agent(agent_id)
+        self.env.reset()
+        self.env.step_array(np.zeros(3), mask=[False, True, True])
+        self.env.step({"c": 0})
+        self.env.remove_agent("a")
+        self.env.add_agent("d")
+        
+        self.assertEqual(self.env.agent_ids, ["c", "b", "d"])
+        rewards = self.env.get_episode_rewards()
+        self.assertAlmostEqual(rewards["c"], 0.2)
+        self.assertAlmostEqual(rewards["b"], 0.1)
+        self.assertEqual(rewards["d"], 0.0)
+    
+    def test_resource_and_obstacle_queries(self):
+        self.env.add_resource({'name': 'food', 'position': (5.0, 5.0)})
+        self.env.add_resource({'name': 'water', 'position': (40.0, 40.0)})
+        self.env.add_resource({'name': 'unplaced'})
+        self.env.add_obstacle({'name': 'rock', 'position': (20.0, 20.0), 'radius': 3.0})
+        
+        self.assertEqual(self.env.nearest_resources((10.0, 10.0))[0]['name'], 'food')
+        self.env.move_resource(1, (12.0, 12.0))
+        self.assertEqual([r['name'] for r in self.env.nearest_resources((14.0, 14.0), k=2)], ['water', 'food'])
+        self.assertEqual(len(self.env.resources_within((8.0, 8.0), 6.0)), 2)
+        self.assertTrue(self.env.check_collision((22.0, 22.0)))
+        self.assertFalse(self.env.check_collision((25.0, 25.0), radius=1.0))
+        self.assertTrue(self.env.check_collision((25.0, 25.0), radius=5.0))
+
+
+class TestSpatialIndex(unittest.TestCase):
+    """Test spatial indexes against brute force"""
+    
+    def test_matches_brute_force(self):
+        rng = np.random.default_rng(0)
+        points = rng.random((2000, 2)) * 100
+        grid = GridIndex((100, 100), cell_size=5)
+        grid.insert_many(np.arange(2000), points)
+        for i in range(0, 2000, 3):
+            points[i] = rng.random(2) * 100
+            grid.move(i, points[i])
+        tree = KDTree(points, leaf_size=8)
+        
+        for _ in range(50):
+            query, radius = rng.random(2) * 100, rng.random() * 10
+            distances = np.hypot(*(points - query).T)
+            expected = set(np.nonzero(distances <= radius)[0].tolist())
+            self.assertEqual(set(grid.query_radius(query, radius)), expected)
+            self.assertEqual(set(tree.query_radius(query, radius).tolist()), expected)
+            np.testing.assert_allclose([d for _, d in grid.nearest(query, 5)], np.sort(distances)[:5])
+            np.testing.assert_allclose([d for _, d in tree.nearest(query, 5)], np.sort(distances)[:5])
+        
+        grid.remove(0)
+        self.assertEqual(len(grid), 1999)
+        self.assertNotIn(0, grid.query_radius(points[0], 1.0))
+
+
+class TestVecEnv(unittest.TestCase):
+    """Test vectorized environments"""
+    
+    def check_auto_reset(self, vec_env):
+        actions = np.zeros((3, 2), dtype=np.int64)
+        for _ in range(2):
+            observations, rewards, dones, infos = vec_env.step(actions)
+            self.assertFalse(dones.any())
+        observations, rewards, dones, infos = vec_env.step(actions + 1)
+        
+        self.assertTrue(dones.all())
+        self.assertEqual(rewards.shape, (3, 2))
+        np.testing.assert_allclose(infos['final_returns'], 0.3)
+        np.testing.assert_array_equal(observations['action'], np.ones((3, 2)))
+        observations, _, dones, _ = vec_env.step(actions)
+        np.testing.assert_array_equal(observations['timestep'], [1, 1, 1])
+    
+    def test_in_process(self):
+        with VecEnv([make_env] * 3) as vec_env:
+            self.check_auto_reset(vec_env)
+    
+    def test_subprocess_workers(self):
+        with SubprocVecEnv([make_env] * 3, num_workers=2) as vec_env:
+            self.assertEqual(len(vec_env.processes), 2)
+            self.assertEqual(len(vec_env.reset()), 3)
+            self.check_auto_reset(vec_env)
+    
+    def test_failed_start_frees_shared_memory(self):
+        before = set(os.listdir('/dev/shm'))
+        with self.assertRaisesRegex(RuntimeError, "env unavailable"):
+            SubprocVecEnv([make_env, make_env, make_broken_env], num_workers=3)
+        self.assertEqual(set(os.listdir('/dev/shm')) - before, set())
+        self.assertEqual([p for p in mp.active_children() if p.name.startswith('Process')], [])
+
+
+def make_broken_env():
+    raise RuntimeError("env unavailable")
+
+
+def make_shard(shard):
+    return EnvironmentSimulator(f"shard_{shard}", max_steps=3)
+
+
+def make_broken_shard(shard):
+    if shard == 1:
+        raise RuntimeError("shard 1 unavailable")
+    return make_shard(shard)
+
+
+class TestShardedSimulator(unittest.TestCase):
+    """Test simulation split across worker processes"""
+    
+    def test_matches_single_simulator(self):
+        agent_ids = [f"agent_{i}" for i in range(20)]
+        with ShardedSimulator(agent_ids, num_shards=3, env_fn=make_shard) as sharded:
+            self.assertEqual(sorted(sharded.agent_ids), sorted(agent_ids))
+            for shard, bounds in enumerate(sharded.shard_slices):
+                self.assertTrue(all(shard_of(a, 3) == shard for a in sharded.agent_ids[bounds]))
+            
+            reference = make_shard(0)
+            for agent_id in sharded.agent_ids:
+                reference.add_agent(agent_id)
+            sharded.reset()
+            reference.reset()
+            for tick in range(3):
+                actions = np.arange(20) + tick
+                observations, rewards, done = sharded.step(actions)
+                expected, expected_rewards, expected_done = reference.step_array(actions)
+                np.testing.assert_array_equal(observations['action'], expected['action'])
+                np.testing.assert_array_equal(observations['timestep'], [tick + 1] * 3)
+                np.testing.assert_allclose(rewards, expected_rewards)
+                self.assertEqual(done, expected_done)
+            np.testing.assert_allclose(sharded.episode_returns, reference.episode_returns)
+            self.assertAlmostEqual(sharded.total_return, reference.episode_returns.sum())
+            
+            with self.assertRaises(ValueError):
+                sharded.step(np.zeros(5))
+            sharded.reset()
+            self.assertFalse(sharded.episode_returns.any())
+    
+    def test_worker_setup_error_is_raised(self):
+        with ShardedSimulator(["a", "b", "c"], num_shards=2, env_fn=make_broken_shard, timeout=10.0) as sharded:
+            for _ in range(2):
+                with self.assertRaisesRegex(RuntimeError, "shard 1 unavailable"):
+                    sharded.reset()
+    
+    def test_failed_start_frees_shared_memory(self):
+        before = set(os.listdir('/dev/shm'))
+        with self.assertRaises(ValueError):
+            ShardedSimulator(["a", "b"], num_shards=2, start_method='no-such-method')
+        self.assertEqual(set(os.listdir('/dev/shm')) - before, set())
 
 
 if __name__ == '__main__':
@@ -0,0 +1,216 @@
+"""Test executor module"""
+
+import asyncio
+import threading
+import time
+import unittest
+from src.my_agent_project.agents.autonomous_agent import AutonomousAgent
+from src.my_agent_project.core.executor import AsyncExecutor, ExecutionStatus, Executor
+from src.my_agent_project.core.result_cache import ResultCache
+
+
+def square(value):
+    return value * value
+
+
+def fail():
+    raise ValueError("boom")
+
+
+class TestExecutor(unittest.TestCase):
+    """Test executor backends"""
+    
+    def test_inline_stops_at_failure(self):
+        executor = Executor()
+        ok = executor.submit_task('ok', square, (3,))
+        bad = executor.submit_task('bad', fail)
+        executor.submit_task('later', square, (4,))
+        
+        with self.assertRaises(ValueError):
+            executor.execute_tasks()
+        self.assertEqual(ok.future.result(), 9)
+        self.assertEqual(bad.status, ExecutionStatus.FAILED)
+        self.assertEqual(executor.get_execution_status()['queued_tasks'], 1)
+    
+    def test_thread_backend_honours_concurrency(self):
+        lock = threading.Lock()
+        running = {'now': 0, 'peak': 0}
+        
+        def track():
+            with lock:
+                running['now'] += 1
+                running['peak'] = max(running['peak'], running['now'])
+            time.sleep(0.02)
+            with lock:
+                running['now'] -= 1
+        
+        with Executor(max_concurrent_tasks=3, backend='thread') as executor:
+            tasks = [executor.submit_task("same", track) for i in range(9)]
+            tasks.append(executor.submit_task('bad', fail))
+            executed = executor.execute_tasks()
+        
+        self.assertEqual(len(executed), 10)
+        self.assertEqual(running['peak'], 3)
+        self.assertEqual(tasks[-1].status, ExecutionStatus.FAILED)
+        self.assertIsInstance(tasks[-1].future.exception(), ValueError)
+    
+    def test_process_backend_and_cancel(self):
+        with Executor(max_concurrent_tasks=2, backend='process') as executor:
+            tasks = [executor.submit_task(f"sq{i}", square, (i,)) for i in range(4)]
+            self.assertTrue(tasks[1].cancel())
+            executor.execute_tasks()
+        
+        self.assertEqual([t.status for t in tasks], [
+            ExecutionStatus.SUCCESS, ExecutionStatus.CANCELLED, ExecutionStatus.SUCCESS, ExecutionStatus.SUCCESS
+        ])
+        self.assertEqual(executor.get_task_result('sq3'), 9)
+    
+    def test_bounded_history(self):
+        executor = Executor(max_history=3)
+        for i in range(5):
+            executor.submit_task(f"sq{i}", square, (i,))
+        executor.execute_tasks()
+        self.assertEqual(executor.get_task_result('sq2'), 4)
+        executor.submit_task('sq5', square, (5,))
+        executor.execute_tasks()
+        
+        self.assertEqual([t.task_id for t in executor.execution_history], ['sq4', 'sq2', 'sq5'])
+        self.assertIsNone(executor.get_task_result('sq0'))
+        status = executor.get_execution_status()
+        self.assertEqual(status['completed_tasks'], 6)
+        self.assertEqual(status['succeeded_tasks'], 6)
+        self.assertEqual(status['retained_tasks'], 3)
+    
+    def test_result_cache_ttl_and_lru(self):
+        now = [0.0]
+        calls = []
+        
+        def record(value, tags):
+            calls.append(value)
+            return value
+        
+        cache = ResultCache(max_size=2, ttl=10.0, clock=lambda: now[0])
+        executor = Executor(cache=cache)
+        first = executor.submit_task('a', record, (1, ['x']), cache=True)
+        again = executor.submit_task('b', record, (1, ['x']), cache=True)
+        executor.execute_tasks()
+        self.assertEqual(calls, [1])
+        self.assertEqual((again.status, again.result), (ExecutionStatus.SUCCESS, 1))
+        self.assertEqual(first.status, ExecutionStatus.SUCCESS)
+        
+        now[0] = 11.0
+        executor.submit_task('c', record, (1, ['x']), cache=True)
+        executor.submit_task('d', record, (2, []), cache=True)
+        executor.submit_task('e', record, (3, []), cache=True)
+        executor.submit_task('f', record, (1, ['x']), cache=True)
+        executor.execute_tasks()
+        self.assertEqual(calls, [1, 1, 2, 3, 1])
+        self.assertEqual(cache.get_stats()['hits'], 1)
+        self.assertEqual(cache.evictions, 2)
+    
+    def test_result_cache_collapses_concurrent_duplicates(self):
+        calls = []
+        
+        def slow(value):
+            calls.append(value)
+            time.sleep(0.05)
+            return value * 2
+        
+        with Executor(max_concurrent_tasks=4, backend='thread') as executor:
+            tasks = [executor.submit_task(f"t{i}", slow, (21,), cache=True) for i in range(4)]
+            executed = executor.execute_tasks()
+        
+        self.assertEqual(calls, [21])
+        self.assertEqual(len(executed), 4)
+        self.assertEqual([t.future.result() for t in tasks], [42] * 4)
+        self.assertEqual(executor.cache.collapsed, 3)
+
+
+class TestAsyncExecutor(unittest.TestCase):
+    """Test asyncio executor"""
+    
+    def test_concurrency_timeout_and_cancel(self):
+        running = {'now': 0, 'peak': 0}
+        
+        async def io_call(delay):
+            running['now'] += 1
+            running['peak'] = max(running['peak'], running['now'])
+            await asyncio.sleep(delay)
+            running['now'] -= 1
+            return delay
+        
+        async def scenario():
+            executor = AsyncExecutor(max_concurrent_tasks=4)
+            fast = [executor.submit_task(f"io{i}", io_call, (0.01,)) for i in range(12)]
+            slow = executor.submit_task('slow', io_call, (1.0,), timeout=0.05)
+            doomed = executor.submit_task('doomed', io_call, (1.0,))
+            run = asyncio.ensure_future(executor.execute_tasks())
+            await asyncio.sleep(0)
+            executor.cancel_task('doomed')
+            await run
+            return fast, slow, doomed
+        
+        fast, slow, doomed = asyncio.run(scenario())
+        self.assertTrue(all(t.status == ExecutionStatus.SUCCESS for t in fast))
+        self.assertEqual(running['peak'], 4)
+        self.assertEqual(slow.status, ExecutionStatus.CANCELLED)
+        self.assertEqual(doomed.status, ExecutionStatus.CANCELLED)
+    
+    def test_action_timeout_error_fails_and_duplicate_ids(self):
+        peak = {'active': 0}
+        
+        async def upstream_timeout():
+            raise TimeoutError("upstream")
+        
+        async def io_call():
+            await asyncio.sleep(0.01)
+            peak['active'] = max(peak['active'], executor.get_execution_status()['active_tasks'])
+        
+        async def scenario():
+            tasks = [executor.submit_task('same', io_call) for _ in range(3)]
+            tasks.append(executor.submit_task('upstream', upstream_timeout, timeout=5.0))
+            tasks.append(executor.submit_task('upstream', upstream_timeout))
+            await executor.execute_tasks()
+            return tasks
+        
+        executor = AsyncExecutor(max_concurrent_tasks=5)
+        tasks = asyncio.run(scenario())
+        self.assertTrue(all(t.status == ExecutionStatus.SUCCESS for t in tasks[:3]))
+        self.assertEqual(peak['active'], 3)
+        for task in tasks[3:]:
+            self.assertEqual(task.status, ExecutionStatus.FAILED)
+            self.assertEqual(task.error, "upstream")
+        self.assertEqual(executor.get_execution_status()['active_tasks'], 0)
+    
+    def test_reused_across_event_loops(self):
+        async def io_call(value):
+            await asyncio.sleep(0.001)
+            return value
+        
+        async def scenario(offset):
+            for i in range(3):
+                executor.submit_task(f"t{offset + i}", io_call, (offset + i,))
+            return await executor.execute_tasks()
+        
+        executor = AsyncExecutor(max_concurrent_tasks=1)
+        for offset in (0, 3):
+            tasks = asyncio.run(scenario(offset))
+            self.assertEqual([t.status for t in tasks], [ExecutionStatus.SUCCESS] * 3)
+            self.assertEqual([t.result for t in tasks], [offset, offset + 1, offset + 2])
+    
+    def test_drives_agent_cycles(self):
+        agents = [AutonomousAgent(f"agent_{i}") for i in range(100)]
+        
+        async def scenario():
+            executor = AsyncExecutor(max_concurrent_tasks=10)
+            for agent in agents:
+                executor.submit_task(agent.agent_id, agent.astep, ("obs",))
+            return await executor.execute_tasks()
+        
+        tasks = asyncio.run(scenario())
+        self.assertEqual(tasks[0].result['action_executed'], 'autonomous_action')
+        self.assertEqual(len(agents[-1].get_memory()), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+"""Test knowledge store module"""
+
+import unittest
+from src.my_agent_project.agents.collaborative_agent import CollaborativeAgent
+from src.my_agent_project.core.knowledge_store import KnowledgeStore
+from src.my_agent_project.core.message_bus import MessageBus
+from src.my_agent_project.core.transport import BusBridge, SocketTransport
+
+
+class TestKnowledgeStore(unittest.TestCase):
+    """Test LWW map merges and team sharing"""
+    
+    def test_replicas_converge_in_any_order(self):
+        a, b = KnowledgeStore("a"), KnowledgeStore("b")
+        a.set("target", "north")
+        b.set("target", "south")
+        b.set("fuel", 10)
+        
+        b_delta = b.delta_since(0)
+        self.assertEqual(a.merge(b_delta), 2)
+        a.delete("fuel")
+        self.assertEqual(b.merge(a.delta_since(0)), 1)
+        self.assertEqual(dict(a.view()), dict(b.view()))
+        self.assertEqual(dict(a.view()), {"target": "south"})
+        self.assertEqual(a.merge(b_delta), 0)
+        
+        seq = a.seq
+        a.set("fuel", 5)
+        self.assertEqual(list(a.delta_since(seq)), ["fuel"])
+    
+    def test_team_shares_one_store(self):
+        bus = MessageBus()
+        store = KnowledgeStore("red")
+        agents = [CollaborativeAgent(f"agent_{i}") for i in range(3)]
+        agents[0].share_knowledge("private", 1)
+        for agent in agents:
+            agent.join_team(bus, "red", knowledge=store)
+        
+        agents[1].share_knowledge("base", (4, 2))
+        self.assertEqual(agents[2].shared_knowledge["base"], (4, 2))
+        self.assertEqual(agents[2].shared_knowledge["private"], 1)
+        with self.assertRaises(TypeError):
+            agents[2].shared_knowledge["base"] = None
+        
+        agents[2].leave_team()
+        agents[1].share_knowledge("later", True)
+        self.assertNotIn("later", agents[2].shared_knowledge)
+        self.assertEqual(agents[2].shared_knowledge["base"], (4, 2))
+    
+    def test_sync_across_bridged_buses(self):
+        left_bus, right_bus = MessageBus(), MessageBus()
+        left_link, right_link = SocketTransport.pair()
+        left, right = BusBridge(left_bus, [left_link]), BusBridge(right_bus, [right_link])
+        left_store, right_store = KnowledgeStore("left"), KnowledgeStore("right")
+        writer, reader = CollaborativeAgent("writer"), CollaborativeAgent("reader")
+        writer.join_team(left_bus, "red", knowledge=left_store)
+        reader.join_team(right_bus, "red", knowledge=right_store)
+        
+        writer.share_knowledge("a", 1)
+        writer.share_knowledge("b", 2)
+        left_bus.flush()
+        right.poll(timeout=1.0)
+        self.assertEqual(reader.sync_knowledge(), 2)
+        self.assertEqual(dict(reader.shared_knowledge), {"a": 1, "b": 2})
+        self.assertEqual(right_store.publish(), 0)
+        left.close()
+        right.close()
+    
+    def test_knowledge_from_before_join_reaches_other_replicas(self):
+        left_bus, right_bus = MessageBus(), MessageBus()
+        left_link, right_link = SocketTransport.pair()
+        left, right = BusBridge(left_bus, [left_link]), BusBridge(right_bus, [right_link])
+        scout, late = CollaborativeAgent("scout"), CollaborativeAgent("late")
+        scout.share_knowledge("enemy", (3, 4))
+        scout.join_team(left_bus, "red", knowledge=KnowledgeStore("left"))
+        left_bus.flush()
+        self.assertEqual(right.poll(timeout=1.0), 0)
+        
+        late.share_knowledge("fuel", 7)
+        late.join_team(right_bus, "red", knowledge=KnowledgeStore("right"))
+        right_bus.flush()
+        left.poll(timeout=1.0)
+        scout.sync_knowledge()
+        left_bus.flush()
+        right.poll(timeout=1.0)
+        late.sync_knowledge()
+        
+        self.assertEqual(dict(late.shared_knowledge), {"enemy": (3, 4), "fuel": 7})
+        self.assertEqual(dict(scout.shared_knowledge), {"enemy": (3, 4), "fuel": 7})
+        left.close()
+        right.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
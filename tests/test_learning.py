@@ -0,0 +1,143 @@
+"""Test learning module"""
+
+import os
+import random
+import tempfile
+import unittest
+import numpy as np
+from src.my_agent_project.core.learning import (
+    LearningModel,
+    RunningStats,
+    TabularLearningModel,
+    TrainingHistory,
+)
+
+
+class TestTrainingHistory(unittest.TestCase):
+    """Test bounded training history and streaming aggregates"""
+    
+    def test_bounded_history_metrics_match_unbounded(self):
+        reference = LearningModel()
+        model = LearningModel(history_capacity=8)
+        for step in range(50):
+            reference.train(step % 7, 'a', step * 0.5 - 3, (step + 1) % 7)
+            model.train(step % 7, 'a', step * 0.5 - 3, (step + 1) % 7)
+        
+        self.assertEqual(len(model.training_history), 8)
+        self.assertEqual(list(model.training_history), reference.training_history[-8:])
+        metrics = model.get_training_metrics()
+        for key, value in reference.get_training_metrics().items():
+            self.assertAlmostEqual(metrics[key], value)
+        rewards = [h['reward'] for h in reference.training_history]
+        self.assertAlmostEqual(metrics['reward_variance'], np.var(rewards))
+    
+    def test_running_stats_batch_merge(self):
+        values = np.random.default_rng(1).normal(size=1000)
+        stats = RunningStats()
+        stats.update_many(values[:300])
+        for value in values[300:700]:
+            stats.update(value)
+        stats.update_many(values[700:])
+        self.assertEqual(stats.count, 1000)
+        self.assertAlmostEqual(stats.variance, np.var(values))
+        self.assertEqual(stats.maximum, values.max())
+    
+    def test_spill_to_disk(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'history.bin')
+            history = TrainingHistory(capacity=4, spill_path=path)
+            for step in range(6):
+                history.record(step, None, float(step), -float(step))
+            history.record_many(range(6, 17), [f"a{i}" for i in range(6, 17)], np.arange(6, 17.0), -np.arange(6, 17.0))
+            history.flush()
+            
+            spilled = TrainingHistory.load_spilled(path)
+            np.testing.assert_array_equal(spilled['reward'], np.arange(17.0))
+            np.testing.assert_array_equal(history.to_arrays()['reward'], [13, 14, 15, 16])
+            transitions = list(TrainingHistory.iter_spilled(path))
+            self.assertEqual([t.state for t in transitions], list(range(17)))
+            self.assertEqual(transitions[5].action, None)
+            self.assertEqual(transitions[16], {'state': 16, 'action': 'a16', 'reward': 16.0, 'delta': -16.0})
+    
+    def test_slices_and_capacity_validation(self):
+        history = TrainingHistory(capacity=4)
+        for step in range(6):
+            history.record(step, None, float(step), 0.0)
+        self.assertEqual([t.state for t in history[1:]], [3, 4, 5])
+        self.assertEqual([t.state for t in history[::-2]], [5, 3])
+        with self.assertRaises(ValueError):
+            TrainingHistory(capacity=0)
+        with self.assertRaises(ValueError):
+            LearningModel(history_capacity=0)
+
+
+class TestTabularLearningModel(unittest.TestCase):
+    """Test array-backed tabular learning model"""
+    
+    def setUp(self):
+        self.model = TabularLearningModel(learning_rate=0.1, initial_capacity=2)
+    
+    def test_train_matches_learning_model(self):
+        reference = LearningModel(learning_rate=0.1)
+        rng = random.Random(3)
+        for _ in range(500):
+            state, next_state = rng.randrange(50), rng.randrange(50)
+            reward = rng.random()
+            reference.train(state, 'move', reward, next_state)
+            self.model.train(state, 'move', reward, next_state)
+        
+        for state in range(50):
+            self.assertEqual(self.model.predict(state), reference.predict(state))
+        self.assertEqual(self.model.weights, reference.weights)
+        self.assertEqual(self.model.get_training_metrics(), reference.get_training_metrics())
+    
+    def test_train_batch_distinct_states(self):
+        reference = TabularLearningModel(learning_rate=0.1)
+        reference.weights = {'x': 1.0, 'y': 2.0}
+        self.model.weights = {'x': 1.0, 'y': 2.0}
+        
+        states, rewards, next_states = ['a', 'b', 'c'], [1.0, 0.5, -1.0], ['x', 'y', 'z']
+        for state, reward, next_state in zip(states, rewards, next_states):
+            reference.train(state, None, reward, next_state)
+        deltas = self.model.train_batch(states, [None] * 3, rewards, next_states)
+        
+        self.assertEqual(deltas.tolist(), [h['delta'] for h in reference.training_history])
+        np.testing.assert_array_equal(self.model.predict_batch(states + ['unseen']),
+                                      [reference.predict(s) for s in states] + [0.0])
+    
+    def test_repeated_states_accumulate(self):
+        self.model.train_batch_ids(np.array([0, 0]), [1.0, 1.0], np.array([1, 1]))
+        self.assertAlmostEqual(self.model.values[0], 0.2)
+    
+    def test_unhashable_states(self):
+        self.model.train([1, 2], None, 1.0, [3])
+        self.assertEqual(self.model.get_state_count(), 1)
+        self.assertAlmostEqual(self.model.predict([1, 2]), 0.1)
+    
+    def test_int_states(self):
+        model = TabularLearningModel(learning_rate=0.1, initial_capacity=2, int_states=True)
+        model.train_batch(np.array([0, 5]), None, [1.0, 2.0], np.array([5, 0]))
+        self.assertEqual(model.get_state_count(), 6)
+        self.assertEqual(len(model.training_history), 2)
+        np.testing.assert_allclose(model.predict_batch([0, 5, 9]), [0.1, 0.2, 0.0])
+        
+        for call in (lambda: model.train(-1, None, 1.0, 0), lambda: model.train(0, None, 1.0, -1),
+                     lambda: model.intern_many([3, -2]), lambda: model.predict_batch([-1])):
+            with self.assertRaises(ValueError):
+                call()
+        np.testing.assert_allclose(model.predict_batch([0, 5]), [0.1, 0.2])
+    
+    def test_raw_state_keys_round_trip(self):
+        self.model.train(1, None, 1.0, 'end')
+        self.model.train('1', None, 2.0, 'end')
+        self.assertAlmostEqual(self.model.predict(1.0), 0.1)
+        self.assertAlmostEqual(self.model.predict('1'), 0.2)
+        
+        restored = TabularLearningModel()
+        restored.weights = dict(zip(self.model.state_ids, self.model.values))
+        self.assertAlmostEqual(restored.predict(1), 0.1)
+        self.assertAlmostEqual(restored.predict('1'), 0.2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+"""Test memory module"""
+
+import unittest
+import numpy as np
+from src.my_agent_project.agents.autonomous_agent import AutonomousAgent
+from src.my_agent_project.core.memory import Memory
+from src.my_agent_project.core.vector_memory import HashingEmbedder, VectorMemory
+
+
+class TestMemory(unittest.TestCase):
+    """Test memory indexes"""
+    
+    def setUp(self):
+        self.memory = Memory(capacity=5)
+        for step in range(8):
+            self.memory.store(step, {'type': 'even' if step % 2 == 0 else 'odd', 'agent': step % 3})
+    
+    def test_type_index_follows_eviction(self):
+        self.assertEqual(self.memory.retrieve_by_type('even'), [4, 6])
+        self.assertEqual(self.memory.retrieve_by_type('odd'), [3, 5, 7])
+        self.assertEqual(self.memory.retrieve_by_type('missing'), [])
+    
+    def test_unindexed_and_added_index(self):
+        self.assertEqual(self.memory.retrieve_by_metadata('agent', 0), [3, 6])
+        self.memory.add_index('agent')
+        self.memory.store(9, {'agent': 0})
+        self.assertEqual(self.memory.retrieve_by_metadata('agent', 0), [6, 9])
+    
+    def test_timestamp_range(self):
+        self.assertEqual(self.memory.retrieve_range(4, 6), [4, 5])
+        self.assertEqual(self.memory.retrieve_range(0, 4), [3])
+        self.assertEqual(self.memory.retrieve_range(6), [6, 7])
+        self.assertEqual(self.memory.retrieve_range(10), [])
+    
+    def test_zero_capacity_keeps_nothing(self):
+        memory = Memory(capacity=0)
+        memory.store('x', {'type': 'even'})
+        self.assertIsNone(memory.retrieve())
+        self.assertEqual(memory.retrieve_by_type('even'), [])
+        self.assertEqual(memory.retrieve_range(0), [])
+    
+    def test_clear(self):
+        self.memory.clear()
+        self.assertEqual(self.memory.retrieve_by_type('even'), [])
+        self.memory.store('x', {'type': 'even'})
+        self.assertEqual(self.memory.retrieve_range(0, 1), ['x'])
+
+
+class TestVectorMemory(unittest.TestCase):
+    """Test embedding recall"""
+    
+    def test_hashing_embedder_is_deterministic(self):
+        embedder = HashingEmbedder(dim=64)
+        np.testing.assert_array_equal(embedder("red apple"), embedder("Red apple"))
+        self.assertAlmostEqual(float(np.linalg.norm(embedder("red apple"))), 1.0, places=6)
+    
+    def test_recall_with_eviction(self):
+        memory = VectorMemory(capacity=3, dim=128, block_size=2)
+        for text in ["red apple", "blue sky", "green grass", "red fire truck"]:
+            memory.store(text, {'type': 'note'})
+        
+        results = memory.recall("red apple", k=2)
+        self.assertEqual(results[0][0], "red fire truck")
+        self.assertNotIn("red apple", [data for data, _ in results])
+        self.assertEqual(memory.retrieve_by_type('note'), ["blue sky", "green grass", "red fire truck"])
+    
+    def test_zero_capacity_agent_recall(self):
+        agent = AutonomousAgent("a", memory_size=0)
+        agent.enable_semantic_recall()
+        agent.perceive("enemy spotted near the river")
+        self.assertEqual(agent.recall("river"), [])
+        self.assertEqual(len(agent.get_memory()), 0)
+    
+    def test_ivf_recall_finds_exact_match(self):
+        rng = np.random.default_rng(0)
+        vectors = rng.normal(size=(2000, 32)).astype(np.float32)
+        memory = VectorMemory(capacity=2000, dim=32, embedder=lambda data: vectors[data])
+        for i in range(2000):
+            memory.store(i)
+        memory.build_index(n_lists=16)
+        memory.store(5, embedding=vectors[5])
+        
+        self.assertEqual(memory.recall(vectors[123], k=1, n_probe=2)[0][0], 123)
+        self.assertEqual([data for data, _ in memory.recall(vectors[5], k=2)], [5, 5])
+
+
+if __name__ == '__main__':
+    unittest.main()
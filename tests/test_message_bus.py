@@ -0,0 +1,92 @@
+"""Test message bus module"""
+
+import threading
+import unittest
+from src.my_agent_project.agents.collaborative_agent import CollaborativeAgent
+from src.my_agent_project.core.message_bus import BackpressureError, MessageBus
+
+
+class TestMessageBus(unittest.TestCase):
+    """Test publish/subscribe delivery"""
+    
+    def test_team_broadcast_shares_message(self):
+        bus = MessageBus()
+        agents = [CollaborativeAgent(f"agent_{i}") for i in range(3)]
+        for agent in agents:
+            agent.join_team(bus, "red")
+        bus.flush()
+        
+        agents[0].perceive({'enemy': (3, 4)})
+        self.assertEqual(agents[1].receive_messages(), [])
+        self.assertEqual(bus.flush(), 2)
+        
+        received = [agent.receive_messages() for agent in agents]
+        self.assertEqual(received[0], [])
+        self.assertIs(received[1][0], received[2][0])
+        self.assertEqual(received[1][0].payload, {'enemy': (3, 4)})
+        self.assertEqual(agents[0].get_team_status()['communication_count'], 1)
+        
+        agents[2].leave_team()
+        agents[0].perceive("again")
+        self.assertEqual(bus.flush(), 1)
+    
+    def test_drop_oldest_caps_queue(self):
+        bus = MessageBus(queue_capacity=3)
+        subscription = bus.subscribe("t", "reader")
+        for i in range(5):
+            bus.publish("t", "writer", i)
+        bus.flush()
+        
+        self.assertEqual([m.payload for m in subscription.drain()], [2, 3, 4])
+        self.assertEqual(subscription.dropped, 2)
+        self.assertEqual(bus.get_stats()['queued'], 0)
+    
+    def test_block_policy(self):
+        bus = MessageBus(queue_capacity=1, policy='block', block_timeout=0.01)
+        subscription = bus.subscribe("t", "reader")
+        bus.publish("t", "writer", 1)
+        bus.publish("t", "writer", 2)
+        with self.assertRaises(BackpressureError):
+            bus.flush()
+        
+        bus = MessageBus(queue_capacity=1, policy='block', block_timeout=5.0)
+        subscription = bus.subscribe("t", "reader")
+        for i in range(3):
+            bus.publish("t", "writer", i)
+        received = []
+        
+        def consume():
+            while len(received) < 3:
+                received.extend(m.payload for m in subscription.drain())
+        
+        consumer = threading.Thread(target=consume)
+        consumer.start()
+        bus.flush()
+        consumer.join(timeout=5.0)
+        self.assertEqual(received, [0, 1, 2])
+    
+    def test_full_blocking_subscriber_does_not_lose_batch(self):
+        bus = MessageBus(queue_capacity=1, policy='block', block_timeout=0.01)
+        full = bus.subscribe("t", "full")
+        other = bus.subscribe("t", "other", capacity=8)
+        for i in range(3):
+            bus.publish("t", "writer", i)
+        with self.assertRaises(BackpressureError):
+            bus.flush()
+        
+        self.assertEqual([m.payload for m in other.drain()], [0, 1, 2])
+        self.assertEqual([m.payload for m in full.drain()], [0])
+        self.assertEqual(full.rejected, 2)
+        self.assertEqual(bus.get_stats()['rejected'], 2)
+        
+        bus.publish("t", "writer", 3)
+        self.assertEqual(bus.flush(), 2)
+        self.assertEqual([m.payload for m in full.drain()], [3])
+    
+    def test_block_policy_requires_timeout(self):
+        with self.assertRaises(ValueError):
+            MessageBus(policy='block', block_timeout=None).subscribe("t", "reader")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+"""Test metrics module"""
+
+import unittest
+import numpy as np
+from src.my_agent_project.utils.metrics import LogHistogram, Metrics
+
+
+class TestMetrics(unittest.TestCase):
+    """Test streaming aggregates, histograms and reservoirs"""
+    
+    def test_stats_match_exact_values(self):
+        values = np.random.default_rng(0).lognormal(0, 1, 10_000)
+        metrics = Metrics(batch_size=256)
+        for value in values.tolist():
+            metrics.record('latency', value)
+        
+        stats = metrics.get_metric_stats('latency')
+        self.assertEqual(stats['count'], len(values))
+        self.assertEqual(stats['min'], values.min())
+        self.assertEqual(stats['max'], values.max())
+        self.assertAlmostEqual(stats['avg'], values.mean())
+        self.assertEqual(stats['latest'], values[-1])
+        for key, q in [('p50', 50), ('p95', 95), ('p99', 99)]:
+            self.assertAlmostEqual(stats[key], np.percentile(values, q), delta=np.percentile(values, q) / 64)
+        self.assertEqual(metrics.get_metric_stats('missing'), {})
+    
+    def test_histogram_signs_and_merge(self):
+        histogram = LogHistogram()
+        histogram.add_many([-4.0, -1.0, 0.0, 2.0, float('nan')])
+        other = LogHistogram()
+        other.add_many([8.0])
+        histogram.merge(other)
+        self.assertEqual(histogram.count, 5)
+        quantiles = histogram.quantiles([0.0, 0.4, 0.6, 0.8, 1.0])
+        np.testing.assert_allclose(quantiles, [-4.0, -1.0, 0.0, 2.0, 8.0], rtol=1 / 64)
+    
+    def test_reservoir_is_bounded_uniform_sample(self):
+        metrics = Metrics(reservoir_size=500, batch_size=100, seed=1)
+        for value in range(20_000):
+            metrics.record('step', value)
+        samples = metrics.get_samples('step')
+        self.assertEqual(len(samples), 500)
+        self.assertEqual(len(set(samples)), 500)
+        self.assertAlmostEqual(np.mean(samples), 10_000, delta=1_000)
+        self.assertEqual(Metrics().get_samples('step'), [])
+    
+    def test_invalid_values_are_rejected_up_front(self):
+        metrics = Metrics(batch_size=2)
+        metrics.record('loss', 1)
+        with self.assertRaises(TypeError):
+            metrics.record('loss', 'high')
+        for value in (float('nan'), float('inf'), -np.inf):
+            with self.assertRaises(ValueError):
+                metrics.record('loss', value)
+        metrics.record('loss', np.float32(3.0))
+        metrics.record('loss', 2)
+        
+        stats = metrics.get_metric_stats('loss')
+        self.assertEqual((stats['count'], stats['min'], stats['max'], stats['avg']), (3, 1.0, 3.0, 2.0))
+        self.assertAlmostEqual(stats['p50'], 2.0, delta=2.0 / 64)
+    
+    def test_failed_fold_does_not_wedge_buffer(self):
+        metrics = Metrics(batch_size=4)
+        metrics.record('loss', 1.0)
+        metrics._buffers['loss'].append(1j)
+        with self.assertRaises(TypeError):
+            metrics.get_metric_stats('loss')
+        self.assertEqual(metrics._buffers['loss'], [])
+        metrics.record('loss', 5.0)
+        self.assertEqual(metrics.get_metric_stats('loss')['latest'], 5.0)
+    
+    def test_timer_records_duration(self):
+        metrics = Metrics()
+        metrics.start_timer('tick')
+        elapsed = metrics.stop_timer('tick')
+        self.assertEqual(metrics.get_metric_stats('tick_duration')['latest'], elapsed)
+        self.assertEqual(metrics.get_all_metrics()['active_timers'], [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,11 @@
 """Test reasoning module"""
 
+import random
 import unittest
-from src.my_agent_project.core.reasoning import ForwardChainingEngine
+from src.my_agent_project.core.reasoning import (
+    ForwardChainingEngine,
+    IncrementalForwardChainingEngine,
+)
 
 
 class TestForwardChaining(unittest.TestCase):
@@ -20,5 +24,64 @@ class TestForwardChaining(unittest.TestCase):
         self.assertIn('A', conclusions)
 
 
+class TestIncrementalForwardChaining(unittest.TestCase):
+    """Test incremental forward chaining reasoning"""
+    
+    def setUp(self):
+        self.engine = IncrementalForwardChainingEngine(max_iterations=10)
+        self.rules = [
+            {'conditions': ['A', 'B'], 'conclusion': 'C'},
+            {'conditions': ['C'], 'conclusion': 'D'},
+            {'conditions': ['D', 'E'], 'conclusion': 'F'},
+        ]
+    
+    def test_chained_conclusions(self):
+        conclusions = self.engine.reason(['A', 'B'], self.rules)
+        self.assertEqual(set(conclusions), {'A', 'B', 'C', 'D'})
+    
+    def test_incremental_facts_and_rules(self):
+        self.engine.reason(['A', 'B'], self.rules)
+        self.assertEqual(self.engine.assert_facts(['E']), ['E', 'F'])
+        self.assertEqual(self.engine.add_rule({'conditions': ['F'], 'conclusion': 'G'}), ['G'])
+    
+    def test_retracted_facts_rebuild(self):
+        self.engine.reason(['A', 'B', 'E'], self.rules)
+        conclusions = self.engine.reason(['A', 'E'], self.rules)
+        self.assertEqual(set(conclusions), {'A', 'E'})
+    
+    def test_edited_rule_lists_match_forward_chaining(self):
+        rules = [{'conditions': ['a'], 'conclusion': 'b'}]
+        self.engine.reason(['a'], rules)
+        rules[0] = {'conditions': ['a'], 'conclusion': 'c'}
+        self.assertEqual(set(self.engine.reason(['a'], rules)), {'a', 'c'})
+        
+        rules[0]['conclusion'] = 'e'
+        self.assertEqual(set(self.engine.reason(['a'], rules)), {'a', 'e'})
+        
+        rules.pop()
+        rules.append({'conditions': [], 'conclusion': 'd'})
+        self.assertEqual(set(self.engine.reason(['a'], rules)), {'a', 'd'})
+        
+        self.engine.add_rule({'conditions': ['a'], 'conclusion': 'x'})
+        self.assertEqual(set(self.engine.reason(['a'], rules)), {'a', 'd'})
+    
+    def test_matches_forward_chaining(self):
+        rng = random.Random(7)
+        for max_iterations in range(5):
+            rules = [
+                {
+                    'conditions': [f"f{rng.randrange(30)}" for _ in range(rng.randint(0, 3))],
+                    'conclusion': f"f{rng.randrange(30)}"
+                }
+                for _ in range(60)
+            ]
+            engine = IncrementalForwardChainingEngine(max_iterations=max_iterations)
+            facts = []
+            for _ in range(5):
+                facts = facts + [f"f{rng.randrange(30)}"]
+                expected = ForwardChainingEngine(max_iterations).reason(facts, rules)
+                self.assertEqual(set(engine.reason(facts, rules)), set(expected))
+
+
 if __name__ == '__main__':
     unittest.main()
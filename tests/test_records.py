@@ -0,0 +1,79 @@
+"""Test records module"""
+
+import json
+import pickle
+import unittest
+from src.my_agent_project.agents.autonomous_agent import AutonomousAgent
+from src.my_agent_project.core.learning import LearningModel
+from src.my_agent_project.core.memory import Memory
+from src.my_agent_project.core.records import Decision, Transition, json_default
+from src.my_agent_project.environment.simulator import EnvironmentSimulator
+from src.my_agent_project.utils.visualizer import Visualizer
+
+
+class TestRecords(unittest.TestCase):
+    """Test dict compatibility of slotted records"""
+    
+    def test_mapping_access(self):
+        decision = Decision("a1", 0.5, "move", 0.5)
+        expected = {'agent_id': "a1", 'independence_score': 0.5, 'action': "move", 'confidence': 0.5}
+        self.assertEqual(decision, expected)
+        self.assertEqual(expected, decision)
+        self.assertEqual(dict(decision), expected)
+        self.assertEqual(decision['action'], decision.action)
+        self.assertIsNone(decision.get('missing'))
+        self.assertIn('confidence', decision)
+        with self.assertRaises(KeyError):
+            decision['missing']
+        self.assertFalse(hasattr(decision, '__dict__'))
+    
+    def test_assignment_limited_to_fields(self):
+        transition = Transition("s", "a", 1.0, 0.5)
+        transition['reward'] = 2.0
+        self.assertEqual(transition.reward, 2.0)
+        with self.assertRaises(KeyError):
+            transition['extra'] = 1
+    
+    def test_json_and_copy(self):
+        env = EnvironmentSimulator("env")
+        env.add_agent("a1")
+        observations, _, _ = env.step({"a1": "move"})
+        agent = AutonomousAgent("a1")
+        agent.perceive(observations["a1"])
+        
+        state = json.loads(Visualizer.format_agent_state(agent.state))
+        self.assertEqual(state['observation'], {'agent_id': "a1", 'action': "move", 'timestep': 1, 'status': 'executed'})
+        decision = agent.reason()
+        self.assertEqual(json.loads(json.dumps(decision, default=json_default)), decision)
+        copied = decision.copy()
+        copied['extra'] = 1
+        self.assertIsInstance(copied, dict)
+        self.assertNotIn('extra', decision)
+        with self.assertRaises(TypeError):
+            json.dumps(object(), default=json_default)
+    
+    def test_pickle_round_trip(self):
+        transition = Transition("s", "a", 1.0, 0.5)
+        self.assertEqual(pickle.loads(pickle.dumps(transition)), transition)
+    
+    def test_hot_paths_return_records(self):
+        agent = AutonomousAgent("a1", independence_level=0.7)
+        agent.perceive("obs")
+        decision = agent.reason()
+        result = agent.act(decision['action'])
+        self.assertEqual(agent.memory[-1], {'type': 'observation', 'data': "obs"})
+        self.assertEqual(result, {'agent_id': "a1", 'action_executed': 'autonomous_action', 'status': 'success'})
+        
+        memory = Memory(capacity=4)
+        memory.store("x", {'type': 'note'})
+        memory.store("y")
+        self.assertEqual(memory.storage[0], {'data': "x", 'metadata': {'type': 'note'}, 'timestamp': 0})
+        self.assertEqual(memory.storage[1]['metadata'], {})
+        
+        model = LearningModel()
+        model.train("s0", "a", 1.0, "s1")
+        self.assertEqual(model.training_history[0]['reward'], 1.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
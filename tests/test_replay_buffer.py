@@ -0,0 +1,71 @@
+"""Test replay buffer module"""
+
+import unittest
+import numpy as np
+from src.my_agent_project.core.learning import TabularLearningModel
+from src.my_agent_project.core.replay_buffer import (
+    PrioritizedReplayBuffer,
+    ReplayBuffer,
+    SumTree,
+)
+
+
+class TestSumTree(unittest.TestCase):
+    """Test sum tree"""
+    
+    def test_update_and_find(self):
+        tree = SumTree(5)
+        tree.update(np.arange(5), np.array([1.0, 0.0, 2.0, 3.0, 4.0]))
+        self.assertEqual(tree.total(), 10.0)
+        np.testing.assert_array_equal(tree.find([0.5, 1.5, 2.9, 3.5, 9.9]), [0, 2, 2, 3, 4])
+
+
+class TestReplayBuffer(unittest.TestCase):
+    """Test replay buffers"""
+    
+    def test_ring_overwrite_and_retrieve(self):
+        buffer = ReplayBuffer(capacity=4, seed=0)
+        buffer.add_batch(np.arange(6), np.zeros(6), np.arange(6.0), np.arange(1, 7))
+        buffer.store((6, 0, 6.0, 7))
+        self.assertEqual(buffer.get_size(), 4)
+        self.assertEqual([buffer.retrieve(i)['reward'] for i in range(4)], [3.0, 4.0, 5.0, 6.0])
+        
+        batch = buffer.sample(32)
+        self.assertTrue(np.all(batch['rewards'] >= 3.0))
+        np.testing.assert_array_equal(batch['next_states'], batch['states'] + 1)
+    
+    def test_memory_queries_are_rejected(self):
+        buffer = ReplayBuffer(capacity=4)
+        buffer.store((0, 0, 1.0, 1))
+        with self.assertRaises(TypeError):
+            buffer.store((1, 0, 1.0, 2), {'type': 't'})
+        for query in (lambda: buffer.retrieve_by_type('t'), lambda: buffer.retrieve_by_metadata('type', 't'),
+                      lambda: buffer.retrieve_range(0), lambda: buffer.add_index('agent')):
+            with self.assertRaises(TypeError):
+                query()
+        self.assertEqual(buffer.get_size(), 1)
+    
+    def test_prioritized_sampling_follows_priorities(self):
+        buffer = PrioritizedReplayBuffer(capacity=8, alpha=1.0, epsilon=0.0, seed=0)
+        indices = buffer.add_batch(np.arange(4), np.zeros(4), np.zeros(4), np.arange(4))
+        buffer.update_priorities(indices, np.array([0.0, 0.0, 1.0, 3.0]))
+        
+        batch = buffer.sample(4000)
+        counts = np.bincount(batch['indices'], minlength=4)
+        self.assertEqual(counts[0] + counts[1], 0)
+        self.assertAlmostEqual(counts[3] / counts[2], 3.0, delta=0.3)
+        self.assertEqual(batch['weights'].max(), 1.0)
+    
+    def test_batch_training_loop(self):
+        model = TabularLearningModel(learning_rate=0.1, int_states=True)
+        buffer = PrioritizedReplayBuffer(capacity=16, seed=0)
+        buffer.add_batch(np.array([0, 1]), np.zeros(2), np.array([1.0, 0.0]), np.array([1, 0]))
+        for _ in range(10):
+            batch = buffer.sample(8)
+            deltas = model.train_batch(batch['states'], batch['actions'], batch['rewards'], batch['next_states'])
+            buffer.update_priorities(batch['indices'], deltas)
+        self.assertGreater(model.predict(0), 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+"""Test scheduler module"""
+
+import unittest
+from src.my_agent_project.core.executor import ExecutionStatus, Executor, Task
+from src.my_agent_project.core.scheduler import TaskScheduler
+
+
+class TestTaskScheduler(unittest.TestCase):
+    """Test priority, deadline and dependency scheduling"""
+    
+    def setUp(self):
+        self.order = []
+        self.executor = Executor(max_concurrent_tasks=1, scheduler=TaskScheduler())
+    
+    def submit(self, task_id, **options):
+        return self.executor.submit_task(task_id, self.order.append, (task_id,), **options)
+    
+    def test_priority_then_deadline(self):
+        self.submit('low', priority=0)
+        self.submit('late', priority=5, deadline=20.0)
+        self.submit('soon', priority=5, deadline=10.0)
+        self.submit('none', priority=5)
+        self.executor.execute_tasks()
+        self.assertEqual(self.order, ['soon', 'late', 'none', 'low'])
+    
+    def test_earliest_deadline_first(self):
+        self.executor = Executor(max_concurrent_tasks=1, scheduler=TaskScheduler(order='deadline'))
+        self.submit('urgent', priority=0, deadline=5.0)
+        self.submit('important', priority=9, deadline=50.0)
+        self.submit('none', priority=9)
+        self.submit('tied', priority=3, deadline=5.0)
+        self.executor.execute_tasks()
+        self.assertEqual(self.order, ['tied', 'urgent', 'important', 'none'])
+        with self.assertRaises(ValueError):
+            TaskScheduler(order='fifo')
+    
+    def test_dependencies(self):
+        self.submit('child', dependencies=['parent'], priority=10)
+        self.submit('parent')
+        self.submit('grandchild', dependencies=['child', 'parent'])
+        self.executor.execute_tasks()
+        self.assertEqual(self.order, ['parent', 'child', 'grandchild'])
+    
+    def test_failed_dependency_cancels_dependents(self):
+        def fail():
+            raise RuntimeError("down")
+        
+        executor = Executor(backend='thread', scheduler=TaskScheduler())
+        parent = executor.submit_task('parent', fail)
+        child = executor.submit_task('child', self.order.append, ('child',), dependencies=['parent'])
+        grandchild = executor.submit_task('grandchild', self.order.append, ('gc',), dependencies=['child'])
+        executor.execute_tasks()
+        executor.shutdown()
+        
+        self.assertEqual(parent.status, ExecutionStatus.FAILED)
+        self.assertEqual([child.status, grandchild.status], [ExecutionStatus.CANCELLED] * 2)
+        self.assertEqual(child.error, "dependency parent failed")
+        self.assertEqual(self.order, [])
+        self.assertEqual(len(executor.task_queue), 0)
+    
+    def test_bookkeeping_is_bounded(self):
+        scheduler = TaskScheduler(max_finished=3)
+        self.executor = Executor(backend='thread', scheduler=scheduler)
+        self.submit('a')
+        self.submit('b', dependencies=['missing'])
+        self.submit('c', dependencies=['a', 'missing'])
+        self.executor.execute_tasks()
+        self.executor.shutdown()
+        self.assertEqual(sorted(scheduler._children), ['missing'])
+        self.assertEqual(len(scheduler._children['missing']), 2)
+        
+        for i in range(5):
+            scheduler.complete(Task(f"t{i}", self.order.append))
+        self.assertEqual(list(scheduler.finished), ['t2', 't3', 't4'])
+    
+    def test_failed_parent_releases_other_child_links(self):
+        def fail():
+            raise RuntimeError("down")
+        
+        scheduler = TaskScheduler()
+        executor = Executor(backend='thread', scheduler=scheduler)
+        executor.submit_task('parent', fail)
+        child = executor.submit_task('child', self.order.append, ('child',), dependencies=['parent', 'never'])
+        executor.execute_tasks()
+        executor.shutdown()
+        self.assertEqual(child.status, ExecutionStatus.CANCELLED)
+        self.assertEqual(dict(scheduler._children), {})
+        self.assertEqual(scheduler.get_waiting_count(), 0)
+    
+    def test_weighted_fairness(self):
+        self.executor.task_queue.set_weight('a', 2.0)
+        for i in range(6):
+            self.submit(f"a{i}", owner='a')
+            self.submit(f"b{i}", owner='b')
+        scheduler = self.executor.task_queue
+        owners = [scheduler.pop().owner for _ in range(6)]
+        self.assertEqual(owners.count('a'), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
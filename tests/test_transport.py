@@ -0,0 +1,83 @@
+"""Test transport module"""
+
+import multiprocessing as mp
+import os
+import tempfile
+import time
+import unittest
+from src.my_agent_project.agents.collaborative_agent import CollaborativeAgent
+from src.my_agent_project.core.message_bus import Message, MessageBus
+from src.my_agent_project.core.transport import BusBridge, SocketTransport, TransportListener
+
+
+def run_worker(port):
+    """Worker process hosting one teammate, replying to every broadcast"""
+    bus = MessageBus()
+    agent = CollaborativeAgent("remote")
+    agent.join_team(bus, "red")
+    bridge = BusBridge(bus, [SocketTransport.connect('127.0.0.1', port)], topic_prefixes=('team/',))
+    while bridge.poll(timeout=5.0):
+        for message in agent.receive_messages():
+            agent.perceive(f"ack {message.payload}")
+        agent.sync_knowledge()
+        agent.share_knowledge('seen', sorted(agent.shared_knowledge))
+        bus.flush()
+    bridge.close()
+
+
+class TestTransport(unittest.TestCase):
+    """Test framed transports and bus bridging"""
+    
+    def test_framing_over_local_pair(self):
+        left, right = SocketTransport.pair()
+        batch = [Message("t", "a", {'payload': list(range(1000))}, i) for i in range(50)]
+        left.send(batch)
+        left.send(batch[:1])
+        self.assertEqual(right.recv(timeout=1.0), batch + batch[:1])
+        self.assertEqual(left.frames_sent, 2)
+        
+        left.close()
+        self.assertEqual(right.recv(timeout=1.0), [])
+        self.assertTrue(right.closed)
+        right.close()
+    
+    def test_unix_socket_listener(self):
+        path = os.path.join(tempfile.mkdtemp(), "bus.sock")
+        listener = TransportListener(path, port=None)
+        client = SocketTransport.connect(path)
+        server = listener.accept(timeout=5.0)
+        client.send([Message("t", "a", 1, 0)])
+        self.assertEqual(server.recv(timeout=1.0)[0].payload, 1)
+        for transport in (client, server, listener):
+            transport.close()
+        self.assertFalse(os.path.exists(path))
+    
+    def test_tcp_bridge_between_processes(self):
+        listener = TransportListener('127.0.0.1', 0)
+        worker = mp.get_context('fork').Process(target=run_worker, args=(listener.address[1],), daemon=True)
+        worker.start()
+        bus = MessageBus()
+        bridge = BusBridge(bus, [listener.accept(timeout=10.0)], topic_prefixes=('team/',))
+        agent = CollaborativeAgent("local")
+        agent.join_team(bus, "red")
+        
+        agent.share_knowledge('base', (0, 0))
+        agent.perceive("contact north")
+        bus.flush()
+        self.assertGreater(bridge.poll(timeout=10.0), 0)
+        deadline = time.monotonic() + 10.0
+        while len(agent.subscription) == 0 or len(agent.knowledge.subscription) == 0:
+            self.assertLess(time.monotonic(), deadline, "bridged replies did not arrive")
+            bridge.poll(timeout=1.0)
+        
+        self.assertEqual([m.payload for m in agent.receive_messages()], ["ack contact north"])
+        agent.sync_knowledge()
+        self.assertEqual(agent.shared_knowledge['seen'], ['base'])
+        bridge.close()
+        listener.close()
+        worker.join(timeout=10.0)
+        self.assertEqual(worker.exitcode, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()